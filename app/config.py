@@ -12,6 +12,7 @@ def load_yaml_config(file_path: str) -> dict:
 class ProjectConfig(BaseSettings):
     start_date: str  # YYYY-MM-DD 형식
     total_days: int
+    season_name: Optional[str] = None  # seasons 테이블의 현재 시즌 이름 (e.g. season10)
 
 
 class AppConfig(BaseSettings):
@@ -21,6 +22,9 @@ class AppConfig(BaseSettings):
     auth: Optional[dict] = None
     project: Optional[ProjectConfig] = None
     openai: Optional[dict] = None
+    ingestion: Optional[dict] = None
+    cache: Optional[dict] = None
+    response: Optional[dict] = None
 
     @classmethod
     def from_yaml(cls, file_path: str):
@@ -1,12 +1,14 @@
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
-from app.routers import users, attendance, auth, github_commits, admin
+from app.routers import users, attendance, auth, github_commits, admin, seasons
 import os
 import argparse
 from app.scheduler import init_scheduler
+from app.utils.compression_utils import GZIP_COMPRESSLEVEL, GZIP_MINIMUM_SIZE
 import logging
 from datetime import datetime
 
@@ -61,8 +63,8 @@ async def lifespan(app: FastAPI):
     # 애플리케이션 종료 시 실행
     logger.info("애플리케이션 종료")
 
-# FastAPI 앱 초기화 (lifespan 매니저 포함)
-app = FastAPI(title="정원사들 시즌10", lifespan=lifespan)
+# FastAPI 앱 초기화 (lifespan 매니저 포함, JSON 응답은 orjson으로 직렬화)
+app = FastAPI(title="정원사들 시즌10", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # CORS 설정
 app.add_middleware(
@@ -73,12 +75,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (이미 압축한 응답은 그대로 전달)
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_COMPRESSLEVEL)
+
 # 라우터 등록
 app.include_router(users.router, prefix="/api", tags=["users"])
 app.include_router(attendance.router, prefix="/api", tags=["attendance"])
 app.include_router(auth.router, prefix="/api", tags=["auth"])
 app.include_router(github_commits.router, prefix="/api", tags=["github_commits"])
 app.include_router(admin.router, prefix="/api", tags=["admin"])
+app.include_router(seasons.router, prefix="/api", tags=["seasons"])
 
 # 정적 파일 서빙
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
@@ -1,16 +1,19 @@
-from sqlalchemy import Column, Integer, String, Boolean, Date, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, Date, DateTime, UniqueConstraint, Index
 from sqlalchemy.sql import func
 
 from app.database import Base
 
 
 class Attendance(Base):
-    """출석 모델"""
+    """출석 모델
+
+    PostgreSQL에서는 KST 날짜 범위(시즌)로 파티션을 나눈 테이블이며, 기본 키는 (id, attendance_date)입니다. (migrations/versions/0009)
+    """
     __tablename__ = "attendances"
 
     id = Column(Integer, primary_key=True, index=True)
     github_id = Column(String, nullable=False, index=True)  # 사용자의 GitHub ID (e.g. junho85)
-    attendance_date = Column(Date, nullable=False, index=True)
+    attendance_date = Column(Date, nullable=False)
     commit_count = Column(Integer, default=0)
     is_attended = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -19,6 +22,11 @@ class Attendance(Base):
     # 사용자와 날짜의 조합은 고유해야 함
     __table_args__ = (
         UniqueConstraint('github_id', 'attendance_date', name='uix_github_id_attendance_date'),
+        # 날짜별 출석 조회/집계 (PostgreSQL은 github_id, commit_count까지 포함하는 커버링 인덱스)
+        Index(
+            'ix_attendances_attendance_date_is_attended', 'attendance_date', 'is_attended',
+            postgresql_include=['github_id', 'commit_count']
+        ),
     )
 
     def __repr__(self):
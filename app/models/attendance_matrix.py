@@ -0,0 +1,42 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class AttendanceMatrix(Base):
+    """사용자별 시즌 출석 매트릭스 (attendances 테이블의 읽기 모델)"""
+    __tablename__ = "attendance_matrix"
+
+    id = Column(Integer, primary_key=True, index=True)
+    github_id = Column(String, nullable=False)  # 사용자의 GitHub ID (e.g. junho85)
+    start_date = Column(Date, nullable=False)  # days의 첫 글자에 해당하는 날짜 (시즌 시작일)
+    days = Column(Text, nullable=False, default="")  # 일자별 출석 여부 문자열 (e.g. "1101..."). i번째 글자 = start_date + i일
+    attended_count = Column(Integer, nullable=False, default=0)  # days의 출석 일수
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('github_id', name='uix_attendance_matrix_github_id'),
+    )
+
+    def __repr__(self):
+        return f"<AttendanceMatrix(github_id={self.github_id}, start_date={self.start_date}, attended_count={self.attended_count})>"
+
+
+class DailyAttendanceCount(Base):
+    """날짜별 출석 인원 (attendances 테이블의 읽기 모델)"""
+    __tablename__ = "daily_attendance_counts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    attendance_date = Column(Date, nullable=False)
+    attended_count = Column(Integer, nullable=False, default=0)  # 해당 날짜에 출석한 사용자 수
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('attendance_date', name='uix_daily_attendance_counts_date'),
+    )
+
+    def __repr__(self):
+        return f"<DailyAttendanceCount(date={self.attendance_date}, attended_count={self.attended_count})>"
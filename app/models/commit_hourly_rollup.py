@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, SmallInteger, String, Date, DateTime, UniqueConstraint, Index
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class CommitHourlyRollup(Base):
+    """(KST 날짜, KST 시, github_id)별 커밋 수 (github_commits 테이블의 읽기 모델)"""
+    __tablename__ = "commit_hourly_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    commit_date_kst = Column(Date, nullable=False)  # 커밋 시각의 KST 날짜
+    commit_hour_kst = Column(SmallInteger, nullable=False)  # 커밋 시각의 KST 시 (0-23)
+    github_id = Column(String, nullable=False)  # 사용자의 GitHub ID (e.g. junho85)
+    commit_count = Column(Integer, nullable=False, default=0)  # 해당 시간대의 커밋 수
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # 기간별 시간대 집계 (날짜 범위 스캔)
+        UniqueConstraint('commit_date_kst', 'commit_hour_kst', 'github_id', name='uix_commit_hourly_rollups_cell'),
+        # 사용자별 시간대 분포
+        Index('ix_commit_hourly_rollups_github_id_commit_date_kst', 'github_id', 'commit_date_kst'),
+    )
+
+    def __repr__(self):
+        return (f"<CommitHourlyRollup(github_id={self.github_id}, commit_date_kst={self.commit_date_kst}, "
+                f"commit_hour_kst={self.commit_hour_kst}, commit_count={self.commit_count})>")
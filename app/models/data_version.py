@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class DataVersion(Base):
+    """데이터 버전 카운터. 데이터가 바뀔 때마다 1씩 올라가며, 조회 API 응답 캐시의 키로 사용합니다."""
+    __tablename__ = "data_versions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)  # 카운터 이름 (e.g. attendance)
+    version = Column(BigInteger, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('name', name='uix_data_versions_name'),
+    )
+
+    def __repr__(self):
+        return f"<DataVersion(name={self.name}, version={self.version})>"
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, Date, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class FinalizedDay(Base):
+    """
+    마감된 날짜. 마감된 날짜는 더 이상 GitHub에서 다시 수집하지 않고 출석 기록도 바꾸지 않습니다.
+    관리자가 다시 열어(reopen) 고친 날짜는 reopened_at이 남고, 그 날짜의 응답은 매번 재검증합니다.
+    """
+    __tablename__ = "finalized_days"
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)  # 마감된 날짜 (KST)
+    finalized_at = Column(DateTime(timezone=True), nullable=False)  # 마감 시각 (UTC). 응답 ETag에 사용
+    reopened_at = Column(DateTime(timezone=True), nullable=True)  # 관리자가 마감 후 마지막으로 고친 시각 (UTC)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('day', name='uix_finalized_days_day'),
+    )
+
+    def __repr__(self):
+        return f"<FinalizedDay(day={self.day}, finalized_at={self.finalized_at}, reopened_at={self.reopened_at})>"
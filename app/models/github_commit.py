@@ -1,26 +1,49 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, UniqueConstraint, Boolean
+from sqlalchemy import Column, Integer, SmallInteger, String, Date, DateTime, Text, UniqueConstraint, Boolean, Index
 from sqlalchemy.sql import func
 from app.database import Base
+from app.utils.date_utils import to_kst_date, to_kst_datetime
+
+
+def _default_commit_date_kst(context):
+    """INSERT 시 commit_date로부터 KST 날짜를 채웁니다."""
+    return to_kst_date(context.get_current_parameters()["commit_date"])
+
+
+def _default_commit_hour_kst(context):
+    """INSERT 시 commit_date로부터 KST 시(0-23)를 채웁니다."""
+    return to_kst_datetime(context.get_current_parameters()["commit_date"]).hour
 
 
 class GitHubCommit(Base):
-    """GitHub 커밋 내역 모델"""
+    """GitHub 커밋 내역 모델
+
+    PostgreSQL에서는 KST 날짜 범위(시즌)로 파티션을 나눈 테이블입니다. (migrations/versions/0009)
+    파티션 테이블의 기본 키와 유니크 제약조건에는 파티션 키가 들어가므로 PostgreSQL의 기본 키는 (id, commit_date_kst)이고,
+    같은 커밋의 중복 저장은 github_commit_keys 테이블(GitHubCommitKey)이 막습니다.
+    """
     __tablename__ = "github_commits"
 
     id = Column(Integer, primary_key=True, index=True)  # 기본 ID (자동 증가)
-    github_id = Column(String, nullable=False, index=True)  # 사용자의 GitHub ID (e.g. junho85)
+    github_id = Column(String, nullable=False)  # 사용자의 GitHub ID (e.g. junho85)
     commit_id = Column(String, nullable=False, index=True)  # GitHub 커밋 해시 ID (e.g. a1b2c3d4...)
     repository = Column(String, nullable=False)  # 커밋이 속한 저장소 이름 (e.g. username/repo-name)
     message = Column(Text, nullable=False)  # 커밋 메시지
     commit_url = Column(String, nullable=False)  # 커밋 URL (e.g. https://github.com/username/repo-name/commit/a1b2c3d4...)
     commit_date = Column(DateTime(timezone=True), nullable=False)  # 커밋이 이루어진 날짜 및 시간
+    commit_date_kst = Column(Date, nullable=False, default=_default_commit_date_kst)  # 커밋 시각의 KST 날짜 (일별 집계용)
+    commit_hour_kst = Column(SmallInteger, nullable=False, default=_default_commit_hour_kst)  # 커밋 시각의 KST 시 (시간대별 집계용)
     is_private = Column(Boolean, nullable=False, default=False)  # 프라이빗 저장소 여부
     created_at = Column(DateTime(timezone=True), server_default=func.now())  # 생성 시간
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())  # 업데이트 시간
     
-    # commit_id와 repository 조합에 대한 유니크 제약조건 추가
+    # 파티션 키(commit_date_kst)가 들어간 유니크 제약조건 (commit_id, repository 중복은 github_commit_keys가 막음)
     __table_args__ = (
-        UniqueConstraint('commit_id', 'repository', name='uix_commit_repo'),
+        UniqueConstraint('commit_id', 'repository', 'commit_date_kst', name='uix_commit_repo'),
+        # 사용자별 일별 집계, 사용자별 기간 조회
+        Index('ix_github_commits_github_id_commit_date_kst', 'github_id', 'commit_date_kst'),
+        Index('ix_github_commits_github_id_commit_date', 'github_id', 'commit_date'),
+        # 추가만 되는 테이블의 기간 스캔용 (PostgreSQL BRIN, 그 외 DB는 일반 인덱스)
+        Index('ix_github_commits_commit_date_brin', 'commit_date', postgresql_using='brin'),
     )
 
     def __repr__(self):
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class GitHubCommitKey(Base):
+    """저장한 커밋의 (commit_id, repository) 키
+
+    github_commits는 PostgreSQL에서 파티션 테이블이어서 유니크 제약조건에 파티션 키(commit_date_kst)가 들어가므로,
+    날짜가 다른 같은 커밋이 동시에 저장되는 것을 막지 못합니다. 파티션을 나누지 않은 이 테이블의
+    유니크 제약조건으로 같은 커밋이 한 번만 저장되게 합니다.
+    """
+    __tablename__ = "github_commit_keys"
+
+    id = Column(Integer, primary_key=True, index=True)
+    commit_id = Column(String, nullable=False)  # GitHub 커밋 해시 ID
+    repository = Column(String, nullable=False)  # 커밋이 속한 저장소 이름
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('commit_id', 'repository', name='uix_github_commit_keys'),
+    )
+
+    def __repr__(self):
+        return f"<GitHubCommitKey(commit_id={self.commit_id}, repository={self.repository})>"
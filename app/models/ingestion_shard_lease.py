@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class IngestionShardLease(Base):
+    """수집 샤드 리스 모델"""
+    __tablename__ = "ingestion_shard_leases"
+
+    id = Column(Integer, primary_key=True, index=True)
+    run_key = Column(String, nullable=False, index=True)  # 수집 실행 단위 키 (e.g. 2025-03-14@2025-03-14T05)
+    shard_id = Column(Integer, nullable=False)  # 샤드 번호 (0 ~ num_shards-1)
+    owner = Column(String, nullable=True)  # 리스를 보유한 워커 ID
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)  # 리스 만료 시간 (UTC)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)  # 마지막 하트비트 시간 (UTC)
+    completed_at = Column(DateTime(timezone=True), nullable=True)  # 샤드 처리 완료 시간 (UTC)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # 실행 단위와 샤드 번호의 조합은 고유해야 함
+    __table_args__ = (
+        UniqueConstraint('run_key', 'shard_id', name='uix_run_key_shard_id'),
+    )
+
+    def __repr__(self):
+        return f"<IngestionShardLease(run_key={self.run_key}, shard_id={self.shard_id}, owner={self.owner})>"
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class Season(Base):
+    """시즌. PostgreSQL에서는 시즌 기간마다 github_commits, attendances 파티션이 하나씩 있습니다."""
+    __tablename__ = "seasons"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)  # 시즌 이름 (e.g. season10). API의 season 파라미터 값
+    start_date = Column(Date, nullable=False)  # 시즌 시작일 (KST)
+    end_date = Column(Date, nullable=False)  # 시즌 종료일 (KST, 포함)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('name', name='uix_seasons_name'),
+    )
+
+    def __repr__(self):
+        return f"<Season(name={self.name}, start_date={self.start_date}, end_date={self.end_date})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Index, false, true
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -10,8 +10,23 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)
     github_id = Column(String, unique=True, nullable=False, index=True)
     github_api_token = Column(Text, nullable=True)
+    is_active = Column(Boolean, nullable=False, default=True, server_default=true())  # 참여 중 여부. 비활성 사용자는 수집하지 않음
+    activated_at = Column(DateTime(timezone=True), nullable=True, server_default=func.now())  # 현재 참여 기간 시작 시각 (NULL이면 처음부터)
+    deactivated_at = Column(DateTime(timezone=True), nullable=True)  # 참여 종료 시각 (참여 중이면 NULL)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # 수집/통계는 대부분 참여 중인 사용자만, 통계 기간 판단은 비활성 사용자만 조회하므로 부분 인덱스 사용
+    __table_args__ = (
+        Index(
+            "ix_users_active_github_id", "github_id",
+            postgresql_where=is_active == true(), sqlite_where=is_active == true()
+        ),
+        Index(
+            "ix_users_inactive_deactivated_at", "deactivated_at",
+            postgresql_where=is_active == false(), sqlite_where=is_active == false()
+        ),
+    )
+
     def __repr__(self):
-        return f"<User(id={self.id}, github_id={self.github_id})>"
+        return f"<User(id={self.id}, github_id={self.github_id}, is_active={self.is_active})>"
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class UserStreak(Base):
+    """사용자별 연속 출석 상태 (attendances 테이블의 읽기 모델)"""
+    __tablename__ = "user_streaks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    github_id = Column(String, nullable=False)  # 사용자의 GitHub ID (e.g. junho85)
+    current_streak = Column(Integer, nullable=False, default=0)  # last_attended_date로 끝나는 연속 출석 일수
+    longest_streak = Column(Integer, nullable=False, default=0)  # 최장 연속 출석 일수
+    last_attended_date = Column(Date, nullable=True)  # 마지막 출석 날짜 (출석한 적이 없으면 NULL)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('github_id', name='uix_user_streaks_github_id'),
+    )
+
+    def __repr__(self):
+        return f"<UserStreak(github_id={self.github_id}, current={self.current_streak}, longest={self.longest_streak})>"
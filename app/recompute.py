@@ -0,0 +1,96 @@
+import argparse
+import logging
+import time
+from datetime import date, timedelta
+
+from app.database import SessionLocal
+from app.services.attendance_service import find_attendance_mismatches, recompute_attendance_range
+from app.utils.date_utils import get_project_period
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# dry run에서 로그로 보여줄 최대 차이 행 수 (구간별)
+MAX_LOGGED_DIFFS = 20
+
+
+def parse_args():
+    """명령행 인수를 파싱합니다."""
+    season_start, season_end = get_project_period()
+    parser = argparse.ArgumentParser(
+        description="정원사들 시즌10 출석 기록 재계산/대사 (github_commits → attendances, 달라진 칸만 저장)"
+    )
+    parser.add_argument("--from", dest="from_date", type=str, default=season_start.isoformat(),
+                        help="시작 날짜 (YYYY-MM-DD, 기본값: 시즌 시작일)")
+    parser.add_argument("--to", dest="to_date", type=str, default=season_end.isoformat(),
+                        help="종료 날짜 (YYYY-MM-DD, 기본값: 시즌 종료일)")
+    parser.add_argument("--chunk-days", type=int, default=7, help="한 트랜잭션에서 처리할 일수 (기본값: 7)")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 현재 출석 기록과의 차이만 출력합니다 (대사)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    from_date = date.fromisoformat(args.from_date)
+    to_date = date.fromisoformat(args.to_date)
+    if from_date > to_date:
+        raise SystemExit("--from 날짜가 --to 날짜보다 늦습니다")
+    if args.chunk_days < 1:
+        raise SystemExit("--chunk-days는 1 이상이어야 합니다")
+
+    total_days = (to_date - from_date).days + 1
+    processed_days = 0
+    total_diffs = 0
+    started_at = time.monotonic()
+
+    db = SessionLocal()
+    try:
+        chunk_start = from_date
+        while chunk_start <= to_date:
+            chunk_end = min(chunk_start + timedelta(days=args.chunk_days - 1), to_date)
+
+            if args.dry_run:
+                diffs = find_attendance_mismatches(db, chunk_start, chunk_end)
+            else:
+                try:
+                    diffs = recompute_attendance_range(db, chunk_start, chunk_end)
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    logger.exception(f"재계산 실패: {chunk_start} ~ {chunk_end} (이전 구간은 이미 저장됨)")
+                    raise
+
+            for diff in diffs[:MAX_LOGGED_DIFFS]:
+                logger.info(
+                    f"  {diff['attendance_date']} {diff['github_id']}: "
+                    f"commit_count {diff['stored_commit_count']} → {diff['commit_count']}, "
+                    f"is_attended {diff['stored_is_attended']} → {diff['is_attended']}"
+                )
+            if len(diffs) > MAX_LOGGED_DIFFS:
+                logger.info(f"  ... 외 {len(diffs) - MAX_LOGGED_DIFFS}건")
+
+            processed_days += (chunk_end - chunk_start).days + 1
+            total_diffs += len(diffs)
+            elapsed = time.monotonic() - started_at
+            logger.info(
+                f"[{processed_days}/{total_days}일] {chunk_start} ~ {chunk_end} 처리 완료: "
+                f"변경 {len(diffs)}행, 누적 {total_diffs}행, {processed_days / elapsed if elapsed else 0:.1f}일/초"
+            )
+
+            chunk_start = chunk_end + timedelta(days=1)
+    finally:
+        db.close()
+
+    elapsed = time.monotonic() - started_at
+    if args.dry_run:
+        logger.info(f"dry run 완료: {total_diffs}행이 현재 기록과 다릅니다 ({elapsed:.1f}초)")
+    else:
+        logger.info(f"재계산 완료: {from_date} ~ {to_date}, {total_diffs}행 변경 ({elapsed:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,14 @@ from typing import List, Optional
 from app.database import get_db
 from app.models.user import User
 from app.utils.auth_utils import get_admin_user
+from app.utils.date_utils import get_project_period
 from app.services.admin_service import AdminService
+from app.services.attendance_service import FinalizedDayError
 from app.services.openai_service import get_openai_service
 from app.schemas.admin import (
     AttendanceUpdateRequest,
     AddUserRequest,
+    SeasonCreateRequest,
     LogEntry,
     MotivationalPromptRequest,
     EncouragementMessageRequest,
@@ -47,13 +50,17 @@ async def update_attendance(
     current_user: User = Depends(get_admin_user),
     db: Session = Depends(get_db)
 ):
-    """특정 사용자의 특정 날짜 출석 상태를 수동으로 변경합니다. (관리자 전용)"""
+    """
+    특정 사용자의 특정 날짜 출석 상태를 수동으로 변경합니다. (관리자 전용)
+    마감된 날짜는 reopen=true일 때만 수정하며, 그렇지 않으면 409를 반환합니다.
+    """
     try:
         result = AdminService.update_user_attendance(
             update_data.github_id,
             update_data.date,
             update_data.is_attended,
-            db
+            db,
+            reopen=update_data.reopen
         )
         
         if result is None:
@@ -65,6 +72,8 @@ async def update_attendance(
         return result
     except HTTPException:
         raise
+    except FinalizedDayError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -72,6 +81,121 @@ async def update_attendance(
         )
 
 
+@router.post("/admin/rebuild-attendance-matrix", tags=["admin"])
+async def rebuild_attendance_matrix(
+    current_user: User = Depends(get_admin_user),
+    db: Session = Depends(get_db)
+):
+    """출석 통계용 읽기 모델(출석 매트릭스, 날짜별 출석 인원, 연속 출석 상태, 시간대별 커밋 집계)을 다시 만듭니다. (관리자 전용)"""
+    try:
+        return AdminService.rebuild_attendance_read_model(db)
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"출석 매트릭스 재생성 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post("/admin/seasons", tags=["admin"])
+async def add_season(
+    season_data: SeasonCreateRequest,
+    current_user: User = Depends(get_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    시즌을 추가합니다. (관리자 전용)
+    PostgreSQL이면 시즌 기간의 github_commits, attendances 파티션을 함께 만들고,
+    기본 파티션에 있던 시즌 기간의 행을 새 파티션으로 옮깁니다.
+    """
+    try:
+        result = AdminService.add_season(season_data.name, season_data.start_date, season_data.end_date, db)
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"시즌 추가 중 오류가 발생했습니다: {str(e)}"
+        )
+
+    if not result["success"]:
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=result)
+    return result
+
+
+@router.get("/admin/verify-streaks", tags=["admin"])
+async def verify_streaks(
+    current_user: User = Depends(get_admin_user),
+    db: Session = Depends(get_db)
+):
+    """저장된 연속 출석 상태를 출석 기록에서 새로 계산한 값과 비교합니다. (관리자 전용)"""
+    try:
+        return AdminService.verify_streaks(db)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"연속 출석 상태 확인 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.post("/admin/finalized-days/{date_str}/reopen", tags=["admin"])
+async def reopen_finalized_day(
+    date_str: str,
+    current_user: User = Depends(get_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    마감된 날짜를 다시 열어 저장된 커밋 내역 기준으로 출석 기록을 고칩니다. (관리자 전용)
+    마감된 날짜의 출석 기록은 재계산과 대사 복구에서 건너뛰므로, 마감 후 바뀐 커밋은 이 경로로 반영합니다.
+    """
+    try:
+        day = date.fromisoformat(date_str)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식을 사용하세요."
+        )
+
+    result = AdminService.reopen_finalized_day(day, db)
+    if result["status"] == "error":
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result["message"])
+    if result["status"] == "info":
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=result["message"])
+    return result
+
+
+@router.post("/admin/reconcile-attendance", tags=["admin"])
+async def reconcile_attendance(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    repair: bool = False,
+    current_user: User = Depends(get_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    출석 기록(attendances)을 커밋 내역(github_commits)과 비교합니다. (관리자 전용)
+    기간을 지정하지 않으면 시즌 전체를 비교하고, repair=true면 차이가 있는 출석 기록을 커밋 내역 기준으로 고칩니다.
+    마감된 날짜는 비교하지 않습니다. (POST /admin/finalized-days/{date}/reopen 사용)
+    """
+    season_start, season_end = get_project_period()
+    try:
+        start = date.fromisoformat(start_date) if start_date else season_start
+        end = date.fromisoformat(end_date) if end_date else season_end
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식을 사용하세요."
+        )
+    
+    try:
+        return AdminService.reconcile_attendance(start, end, repair, db)
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"출석 기록 대사 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
 @router.get("/admin/system-status", response_model=SystemStatusResponse, tags=["admin"])
 async def system_status(current_user: User = Depends(get_admin_user)):
     """시스템 상태 정보를 반환합니다. (관리자 전용)"""
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
-from datetime import date, datetime, timedelta
+from typing import List, Any, Awaitable, Callable, Hashable, Optional, Tuple
+from datetime import date
+import numpy as np
 from app.database import get_db
 from app.models.user import User
 from app.models.attendance import Attendance
@@ -12,6 +14,17 @@ from app.services.attendance_service import (
     get_daily_attendance_stats,
     create_attendance_from_commits
 )
+from app.services.commit_rollup_service import get_hourly_commit_counts
+from app.services.data_version_service import get_data_version
+from app.services.day_close_service import get_finalized_day
+from app.services.season_service import get_season_period
+from app.services.season_snapshot_service import get_snapshot_user, load_snapshot
+from app.services.stats_service import (
+    build_attendance_ranking,
+    build_attendance_stats,
+    encode_attendance,
+    resolve_date_range,
+)
 from app.config import config
 from app.utils.error_utils import (
     create_http_exception,
@@ -19,24 +32,43 @@ from app.utils.error_utils import (
     handle_not_found_error,
     service_result_to_response
 )
+from app.utils.bitset_utils import ATTENDANCE_FORMATS, LIST_FORMAT
+from app.utils.cache_utils import SingleFlight
+from app.utils.compression_utils import GZIP_MINIMUM_SIZE, CachedBody, accepts_gzip
+from app.utils.date_utils import get_project_season_name, kst_today
+from app.utils.etag_utils import etag_matches, gzip_etag, make_etag, not_modified_response
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["attendance"])
 
+# 전체 출석 체크는 날짜별로 하나만 실행하고, 최근 결과는 잠시 재사용
+CHECK_RESULT_TTL_SECONDS = int((config.ingestion or {}).get("check_result_ttl_seconds", 60))
+attendance_check_flight = SingleFlight(result_ttl_seconds=CHECK_RESULT_TTL_SECONDS)
+
 
 @router.post("/attendance/check")
 async def check_attendance_api(check_date: Optional[str] = None, db: Session = Depends(get_db)):
-    """모든 사용자의 출석 체크를 실행합니다."""
+    """
+    모든 사용자의 출석 체크를 실행합니다.
+    같은 날짜의 체크가 이미 진행 중이면 그 결과를 함께 기다리고,
+    CHECK_RESULT_TTL_SECONDS 안에 끝난 결과가 있으면 GitHub를 다시 호출하지 않고 반환합니다.
+    """
     date_to_check = None
     if check_date:
         try:
             date_to_check = date.fromisoformat(check_date)
         except ValueError:
             raise handle_validation_error("Invalid date format. Use YYYY-MM-DD", "check_date")
+    else:
+        date_to_check = date.today()
 
-    result = await check_all_attendances(date_to_check, db)
+    result = await attendance_check_flight.run(
+        date_to_check.isoformat(),
+        lambda: check_all_attendances(date_to_check, db),
+        should_cache=lambda r: r.get("status") != "error"
+    )
     return service_result_to_response(result)
 
 
@@ -44,9 +76,14 @@ async def check_attendance_api(check_date: Optional[str] = None, db: Session = D
 async def check_user_attendance_api(
         github_id: str,
         check_date: Optional[str] = None,
+        force: bool = False,
         db: Session = Depends(get_db)
 ):
-    """특정 사용자의 출석 체크를 실행합니다."""
+    """
+    특정 사용자의 출석 체크를 실행합니다.
+    최근에 조회한 (사용자, 날짜)는 캐시된 결과를 사용하며, 응답의 data_age_seconds로 데이터 경과 시간을 알려줍니다.
+    force=true면 캐시를 무시하고 GitHub를 다시 호출합니다.
+    """
     date_to_check = None
     if check_date:
         try:
@@ -69,7 +106,7 @@ async def check_user_attendance_api(
             detail="GitHub API token not configured"
         )
 
-    result = await check_user_commit_and_save(github_id, date_to_check, api_token, db)
+    result = await check_user_commit_and_save(github_id, date_to_check, api_token, db, force_refresh=force)
     return service_result_to_response(result)
 
 
@@ -80,13 +117,19 @@ async def get_attendance_history(
         end_date: Optional[str] = None,
         db: Session = Depends(get_db)
 ):
-    """특정 사용자의 출석 기록을 조회합니다."""
+    """특정 사용자의 출석 기록을 조회합니다. 시즌이 끝나 스냅샷이 있으면 시즌 전체 기록은 스냅샷에서 반환합니다."""
     try:
         start = date.fromisoformat(start_date)
         end = date.fromisoformat(end_date) if end_date else date.today()
     except ValueError:
         raise handle_validation_error("Invalid date format. Use YYYY-MM-DD", "start_date or end_date")
 
+    snapshot = load_snapshot()
+    if snapshot and start_date == snapshot["start_date"] and end_date in (None, snapshot["end_date"]):
+        snapshot_user = get_snapshot_user(github_id)
+        if snapshot_user is not None:
+            return snapshot_user["attendance_history"]
+
     user = db.query(User).filter(User.github_id == github_id).first()
     if not user:
         raise handle_not_found_error("사용자", github_id)
@@ -95,219 +138,211 @@ async def get_attendance_history(
     return history
 
 
-def _parse_date_range(start_date: Optional[str], end_date: Optional[str]):
-    """시작일과 종료일을 파싱합니다."""
-    # 시작일 설정
-    if start_date:
-        try:
-            start = date.fromisoformat(start_date)
-        except ValueError as e:
-            logger.error(f"Invalid start_date format: {e}")
-            raise handle_validation_error("Invalid date format. Use YYYY-MM-DD", "start_date")
-    else:
-        # 기본 시작일 (프로젝트 설정값 사용)
-        try:
-            project_config = config.project
-            if project_config and hasattr(project_config, 'start_date'):
-                start = date.fromisoformat(project_config.start_date)
-            else:
-                logger.warning("Project start_date not configured, using default")
-                start = date(2025, 3, 10)  # 기본값
-        except (ValueError, KeyError) as e:
-            logger.error(f"Error parsing project start_date: {e}")
-            start = date(2025, 3, 10)  # 기본값
-
-    # 프로젝트 종료일 계산
-    project_end_date = None
-    try:
-        project_config = config.project
-        if project_config and hasattr(project_config, 'total_days') and hasattr(project_config, 'start_date'):
-            project_start = date.fromisoformat(project_config.start_date)
-            total_days = int(project_config.total_days)
-            project_end_date = project_start + timedelta(days=total_days - 1)
-    except (ValueError, KeyError) as e:
-        logger.error(f"Error calculating project end date: {e}")
-    
-    # 종료일 설정
-    if end_date:
-        try:
-            end = date.fromisoformat(end_date)
-        except ValueError as e:
-            logger.error(f"Invalid end_date format: {e}")
-            raise handle_validation_error("Invalid date format. Use YYYY-MM-DD", "end_date")
-    else:
-        # 프로젝트가 종료되었으면 종료일로, 아니면 오늘 날짜로 설정
-        if project_end_date and date.today() > project_end_date:
-            end = project_end_date
-        else:
-            end = date.today()
-    
-    # 프로젝트가 종료되었는데 end가 프로젝트 종료일보다 뒤면 조정
-    if project_end_date and end > project_end_date:
-        end = project_end_date
-        
-    return start, end
-
-
-def _get_total_project_days():
-    """프로젝트 총 일수를 가져옵니다."""
-    total_project_days = 100  # 기본값
+# 마감된 날짜의 출석 기록은 관리자가 다시 열기 전에는 바뀌지 않으므로 오래 캐시
+FINALIZED_DAY_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 관리자가 다시 열어 고친 날짜는 또 고쳐질 수 있으므로 매번 ETag(새로 찍은 마감 시각)로 재검증
+REOPENED_DAY_CACHE_CONTROL = "public, no-cache"
+
+# 통계 응답은 데이터 버전과 파라미터로 캐시하고, 클라이언트는 매번 ETag로 재검증
+VERSIONED_CACHE_CONTROL = "no-cache"
+RESPONSE_CACHE_TTL_SECONDS = int((config.cache or {}).get("response_ttl_seconds", 3600))
+response_cache_flight = SingleFlight(result_ttl_seconds=RESPONSE_CACHE_TTL_SECONDS)
+
+
+async def _versioned_response(
+        request: Request,
+        db: Session,
+        key: Tuple[Hashable, ...],
+        compute: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    데이터 버전으로 캐시한 응답을 반환합니다.
+    직렬화한 JSON 본문을 캐시하므로 쓰기가 없는 동안에는 DB 조회와 직렬화 없이 응답하며,
+    같은 키의 동시 요청은 한 번만 계산합니다. If-None-Match가 현재 ETag와 같으면 304를 반환합니다.
+
+    Args:
+        request: 요청
+        db: 데이터베이스 세션
+        key: 응답을 구분하는 값 (엔드포인트 이름, 파라미터)
+        compute: 응답을 계산하는 비동기 함수
+
+    Returns:
+        Any: JSON 응답 또는 304 응답
+    """
+    # 기본 기간과 프로젝트 종료 여부가 오늘 날짜에 따라 달라지므로 키에 포함
+    key = (get_data_version(db), kst_today(), *key)
+    etag = make_etag(*key)
+    headers = {"ETag": etag, "Cache-Control": VERSIONED_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    # 압축한 본문과 압축하지 않은 본문은 ETag가 다르므로, 클라이언트가 가진 쪽의 ETag로 304를 반환
+    for variant in (gzip_etag(etag), etag):
+        if etag_matches(request, variant):
+            return not_modified_response({**headers, "ETag": variant})
+
+    async def render():
+        return CachedBody(ORJSONResponse(await compute()).body)
+
+    cached = await response_cache_flight.run(key, render)
+    if accepts_gzip(request) and len(cached.body) >= GZIP_MINIMUM_SIZE:
+        # 압축한 본문도 캐시해 두고 그대로 전달 (starlette 0.46부터 GZipMiddleware는 이미 압축한 응답을 다시 압축하지 않음)
+        headers.update({"ETag": gzip_etag(etag), "Content-Encoding": "gzip"})
+        return Response(content=cached.gzipped(), media_type="application/json", headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+def _get_season_period(db: Session, season: Optional[str]) -> Optional[Tuple[date, date]]:
+    """
+    season 파라미터의 시즌 기간을 조회합니다.
+
+    Returns:
+        Optional[Tuple[date, date]]: (시작일, 종료일). season이 없으면 None (설정 파일의 현재 시즌)
+    """
+    if season is None:
+        return None
+    period = get_season_period(db, season)
+    if period is None:
+        raise handle_not_found_error("시즌", season)
+    return period
+
+
+def _parse_date_param(value: Optional[str], name: str) -> Optional[date]:
+    """YYYY-MM-DD 형식의 날짜 파라미터를 파싱합니다. 값이 없으면 None입니다."""
+    if not value:
+        return None
     try:
-        project_config = config.project
-        if project_config and hasattr(project_config, 'total_days'):
-            total_project_days = int(project_config.total_days)
-    except (ValueError, KeyError) as e:
-        logger.error(f"Error parsing project total_days: {e}")
-    
-    return total_project_days
-
-
-def _calculate_user_stats(users, date_list, start, end, db):
-    """사용자별 출석 데이터를 계산합니다."""
-    user_stats = []
-
-    for user in users:
-        attendances = db.query(Attendance).filter(
-            Attendance.github_id == user.github_id,
-            Attendance.attendance_date >= start,
-            Attendance.attendance_date <= end
-        ).all()
-
-        # 출석 여부 맵 생성
-        attendance_map = {att.attendance_date.isoformat(): att.is_attended for att in attendances}
-
-        # 날짜별 출석 여부 리스트
-        attendance_list = [attendance_map.get(d, False) for d in date_list]
-
-        # 출석률 계산
-        attended_count = sum(1 for a in attendance_list if a)
-        attendance_rate = round(attended_count / len(date_list) * 100) if date_list else 0
-
-        user_stats.append({
-            "github_id": user.github_id,
-            "attendance_rate": attendance_rate,
-            "attended_count": attended_count,
-            "total_days": len(date_list),
-            "attendance": attendance_list
-        })
-
-    # 출석률 기준으로 정렬하고 순위 부여
-    user_stats.sort(key=lambda x: x["attendance_rate"], reverse=True)
-    for i, user in enumerate(user_stats):
-        user["rank"] = i + 1
-        
-    return user_stats
-
-
-def _calculate_daily_rates(date_list, user_stats, users):
-    """날짜별 출석률을 계산합니다."""
-    daily_rates = []
-    for i, d in enumerate(date_list):
-        attended_count = sum(1 for user in user_stats if user["attendance"][i])
-        daily_rate = round(attended_count / len(users) * 100) if users else 0
-        daily_rates.append({
-            "date": d,
-            "rate": daily_rate
-        })
-    return daily_rates
-
-
-def _calculate_attendance_summary(user_stats, users, date_list):
-    """전체 출석 통계를 계산합니다."""
-    total_present = sum(user["attended_count"] for user in user_stats)
-    total_possible = len(users) * len(date_list)
-    total_absent = total_possible - total_present
-    overall_attendance_rate = round(total_present / total_possible * 100) if total_possible else 0
-    
-    return {
-        "total_present": total_present,
-        "total_absent": total_absent,
-        "overall_attendance_rate": overall_attendance_rate
-    }
+        return date.fromisoformat(value)
+    except ValueError as e:
+        logger.error(f"Invalid {name} format: {e}")
+        raise handle_validation_error("Invalid date format. Use YYYY-MM-DD", name)
+
+
+def _parse_date_range(
+        start_date: Optional[str],
+        end_date: Optional[str],
+        period: Optional[Tuple[date, date]] = None
+) -> Tuple[date, date]:
+    """
+    시작일과 종료일 파라미터를 파싱합니다. 지정하지 않은 날짜는 resolve_date_range의 기본값을 사용합니다.
+    period(시즌 기간)가 있으면 설정 파일의 프로젝트 기간 대신 시즌 기간을 기본값과 상한으로 사용합니다.
+    """
+    return resolve_date_range(_parse_date_param(start_date, "start_date"), _parse_date_param(end_date, "end_date"), period)
+
+
+def _parse_attendance_format(attendance_format: Optional[str]) -> str:
+    """출석 여부 목록의 응답 형식을 확인합니다. None이면 기본 형식(list)입니다."""
+    attendance_format = attendance_format or LIST_FORMAT
+    if attendance_format not in ATTENDANCE_FORMATS:
+        raise handle_validation_error(f"Invalid format. Use one of: {', '.join(ATTENDANCE_FORMATS)}", "format")
+    return attendance_format
+
+
+def _encode_snapshot_users(users, attendance_format):
+    """스냅샷의 사용자별 출석 여부 목록을 응답 형식에 맞게 인코딩한 사본을 만듭니다."""
+    if attendance_format == LIST_FORMAT or not users:
+        return users
+    attended = np.array([user["attendance"] for user in users], dtype=bool).reshape(len(users), -1)
+    return [
+        {**user, "attendance": attendance}
+        for user, attendance in zip(users, encode_attendance(attended, attendance_format))
+    ]
 
 
 @router.get("/attendance/stats")
 async def get_attendance_stats(
+        request: Request,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_db),
+        format: Optional[str] = None,
+        season: Optional[str] = None
 ):
-    """출석 통계를 조회합니다."""
+    """
+    출석 통계를 조회합니다. 시즌이 끝나 스냅샷이 있으면 기본 기간의 통계는 스냅샷에서 반환합니다.
+    그 외에는 데이터 버전으로 캐시하며 ETag/304를 지원합니다.
+    format=bitset 또는 format=ranges이면 사용자별 출석 여부 목록을 압축된 형식으로 반환합니다.
+    season을 지정하면 해당 시즌 기간의 통계를 반환합니다. (기본값: 설정 파일의 현재 시즌)
+    """
     logger.info("get_attendance_stats")
-    logger.debug(f"start_date: {start_date}")
-    logger.debug(f"end_date: {end_date}")
+    attendance_format = _parse_attendance_format(format)
+    period = _get_season_period(db, season)
+    snapshot = load_snapshot() if start_date is None and end_date is None and season is None else None
+    if snapshot:
+        if attendance_format == LIST_FORMAT:
+            return ORJSONResponse(snapshot["stats"])
+        return ORJSONResponse({
+            **snapshot["stats"],
+            "users": _encode_snapshot_users(snapshot["stats"]["users"], attendance_format),
+            "attendance_format": attendance_format
+        })
+
+    start, end = _parse_date_range(start_date, end_date, period)
 
-    # 시작일과 종료일 설정
-    start, end = _parse_date_range(start_date, end_date)
-    
-    # 날짜 범위 생성
-    days_completed = (end - start).days + 1
-    
-    # 총 프로젝트 일수 설정
-    total_project_days = _get_total_project_days()
-    
-    # 프로젝트 종료 여부 확인
-    project_config = config.project
-    is_completed = False
-    if project_config and hasattr(project_config, 'start_date'):
-        project_start = date.fromisoformat(project_config.start_date)
-        project_end_date = project_start + timedelta(days=total_project_days - 1)
-        is_completed = date.today() > project_end_date
-        
-        # 프로젝트가 종료되었으면 days_completed를 total_days로 제한
-        if is_completed:
-            days_completed = min(days_completed, total_project_days)
-    
-    date_list = [(start + timedelta(days=i)).isoformat() for i in range(days_completed)]
-
-    # 사용자별 출석 데이터 조회
-    users = db.query(User).all()
-    user_stats = _calculate_user_stats(users, date_list, start, end, db)
-
-    # 날짜별 출석률 계산
-    daily_rates = _calculate_daily_rates(date_list, user_stats, users)
-
-    # 총 출석 통계 계산
-    attendance_summary = _calculate_attendance_summary(user_stats, users, date_list)
-    
-    return {
-        "start_date": start.isoformat(),
-        "end_date": end.isoformat(),
-        "days_completed": days_completed,
-        "total_days": total_project_days,  # 총 프로젝트 일수
-        "is_completed": is_completed,  # 프로젝트 완료 여부
-        "dates": date_list,
-        "users": user_stats,
-        "daily_rates": daily_rates,
-        **attendance_summary
-    }
+    async def build_stats():
+        return build_attendance_stats(db, start, end, attendance_format, period)
+
+    return await _versioned_response(
+        request, db, ("stats", start_date, end_date, attendance_format, season), build_stats
+    )
 
 
 @router.get("/attendance/stats/{date_str}")
-async def get_attendance_stats_for_date(date_str: str, db: Session = Depends(get_db)):
-    """특정 날짜의 출석 통계를 조회합니다."""
+async def get_attendance_stats_for_date(
+        date_str: str,
+        request: Request,
+        db: Session = Depends(get_db)
+):
+    """특정 날짜의 출석 통계를 조회합니다. 데이터 버전으로 캐시하며 ETag/304를 지원합니다."""
     logger.info("get_attendance_stats_for_date")
     try:
         check_date = date.fromisoformat(date_str)
     except ValueError:
         raise handle_validation_error("Invalid date format. Use YYYY-MM-DD", "date_str")
 
-    stats = await get_daily_attendance_stats(check_date, db)
-    return stats
+    return await _versioned_response(
+        request, db, ("daily", check_date),
+        lambda: get_daily_attendance_stats(check_date, db)
+    )
 
 
 @router.get("/attendance/ranking")
 async def get_attendance_ranking(
+        request: Request,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_db),
+        limit: Optional[int] = None,
+        offset: int = 0,
+        dense: bool = False,
+        season: Optional[str] = None
 ):
-    """출석률 순위를 조회합니다."""
+    """
+    출석률 순위를 조회합니다. 사용자별 현재/최장 연속 출석 일수를 함께 반환합니다.
+    순위는 SQL 윈도 함수로 계산하며 출석률이 같으면 같은 순위입니다. (dense=true면 DENSE_RANK)
+    limit/offset으로 일부만 조회할 수 있고, 데이터 버전으로 캐시하며 ETag/304를 지원합니다.
+    season을 지정하면 해당 시즌 기간의 순위를 반환합니다. (기본값: 설정 파일의 현재 시즌)
+    연속 출석 상태는 현재 시즌 기준이므로 지난 시즌 순위에서는 연속 출석 필드가 null입니다.
+    """
     logger.debug(f"start_date: {start_date}")
     logger.debug(f"end_date: {end_date}")
+    if limit is not None and limit < 1:
+        raise handle_validation_error("limit must be at least 1", "limit")
+    if offset < 0:
+        raise handle_validation_error("offset must not be negative", "offset")
+
+    period = _get_season_period(db, season)
+    snapshot = load_snapshot() if start_date is None and end_date is None and season is None and not dense else None
+    if snapshot:
+        return ORJSONResponse(snapshot["ranking"][offset:None if limit is None else offset + limit])
 
-    stats = await get_attendance_stats(start_date, end_date, db)
-    return stats["users"]
+    start, end = _parse_date_range(start_date, end_date, period)
+    # 연속 출석 상태는 현재 시즌 기준
+    with_streaks = season is None or season == get_project_season_name()
+
+    async def build_ranking():
+        return build_attendance_ranking(db, start, end, period, limit, offset, dense, with_streaks)
+
+    return await _versioned_response(
+        request, db, ("ranking", start_date, end_date, limit, offset, dense, season), build_ranking
+    )
 
 
 @router.post("/attendance/create-from-commits")
@@ -330,53 +365,46 @@ async def create_attendance_from_commits_api(check_date: Optional[str] = None, d
 async def get_hourly_commits(
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_db),
+        github_id: Optional[str] = None,
+        season: Optional[str] = None
 ):
-    """시간대별 커밋 수 분포를 조회합니다."""
-    from sqlalchemy.sql import extract, func
-    from app.models.github_commit import GitHubCommit
-    
-    # 시작일과 종료일 설정
-    start, end = _parse_date_range(start_date, end_date)
-    
-    # 시간대별 커밋 수를 가져오는 쿼리 (한국 시간 기준)
-    # 날짜 범위를 적용하여 프로젝트 기간 내의 커밋만 조회
-    query = db.query(
-        extract('hour', func.timezone('Asia/Seoul', GitHubCommit.commit_date)).label('hour'),
-        func.count().label('count')
-    )
-    
-    # 날짜 범위 필터 추가
-    start_datetime = datetime.combine(start, datetime.min.time())
-    end_datetime = datetime.combine(end, datetime.max.time())
-    query = query.filter(
-        GitHubCommit.commit_date >= start_datetime,
-        GitHubCommit.commit_date <= end_datetime
-    )
-    
-    hourly_commits = query.group_by('hour').order_by('hour').all()
-    
-    # 0-23시까지 비어있는 시간대를 0으로 채우기 위한 기본 데이터 구성
-    hourly_data = {hour: 0 for hour in range(24)}
-    
-    # 실제 데이터 채우기
-    for hour, count in hourly_commits:
-        hourly_data[hour] = count
-    
-    # 리스트 형태로 데이터 반환
-    result = [{"hour": hour, "count": count} for hour, count in hourly_data.items()]
-    
-    return result
+    """
+    시간대별(KST) 커밋 수 분포를 조회합니다.
+    커밋을 스캔하지 않고 수집 시 갱신되는 시간대별 커밋 집계를 합산합니다.
+    github_id를 지정하면 해당 사용자의 분포만, season을 지정하면 해당 시즌 기간의 분포를 반환합니다.
+    """
+    period = _get_season_period(db, season)
+    use_snapshot = start_date is None and end_date is None and github_id is None and season is None
+    snapshot = load_snapshot() if use_snapshot else None
+    if snapshot:
+        return snapshot["hourly_commits"]
+
+    start, end = _parse_date_range(start_date, end_date, period)
+    return get_hourly_commit_counts(db, start, end, github_id)
 
 
 @router.get("/attendance/{date_str}")
-async def get_attendance(date_str: str, db: Session = Depends(get_db)):
-    """특정 날짜의 출석 현황을 조회합니다."""
+async def get_attendance(date_str: str, request: Request, response: Response, db: Session = Depends(get_db)):
+    """
+    특정 날짜의 출석 현황을 조회합니다.
+    마감된 날짜는 Cache-Control(immutable, 다시 연 날짜는 no-cache)과 마감 시각으로 만든 ETag를 붙여 반환하고,
+    If-None-Match가 같으면 304를 반환합니다.
+    """
     try:
         check_date = date.fromisoformat(date_str)
     except ValueError:
         raise handle_validation_error("Invalid date format. Use YYYY-MM-DD", "date_str")
 
+    finalized_day = get_finalized_day(db, check_date)
+    if finalized_day is not None:
+        etag = make_etag("finalized", check_date, finalized_day.finalized_at)
+        cache_control = REOPENED_DAY_CACHE_CONTROL if finalized_day.reopened_at else FINALIZED_DAY_CACHE_CONTROL
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if etag_matches(request, etag):
+            return not_modified_response(headers)
+        response.headers.update(headers)
+
     attendance_data = db.query(
         Attendance.github_id,
         Attendance.attendance_date,
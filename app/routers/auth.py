@@ -8,6 +8,7 @@ from pydantic import BaseModel
 
 from app.database import get_db
 from app.models.user import User
+from app.services.attendance_service import on_users_changed
 from app.utils.auth_utils import create_access_token, get_current_user, TOKEN_COOKIE_NAME
 from app.config import config
 
@@ -99,6 +100,7 @@ async def auth_callback(code: str, db: Session = Depends(get_db)):
                 github_api_token=github_token
             )
             db.add(user)
+            on_users_changed(db)
             db.commit()
             db.refresh(user)
         else:
@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import func
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from app.database import get_db
-from app.services.github_service import get_user_commits, get_user_commits_stats
-from app.models.github_commit import GitHubCommit
+from app.services.attendance_matrix_service import load_commit_count_array
+from app.services.github_service import get_user_commits
+from app.services.season_service import get_season_period
+from app.services.season_snapshot_service import get_snapshot_user
+from app.services.stats_service import build_user_commit_stats, build_user_daily_commits
 from app.models.user import User
-from datetime import datetime, timedelta, date
+from app.utils.date_utils import get_project_period, kst_today
+from datetime import timedelta, date
 import logging
 import jwt
 from app.config import config
@@ -41,6 +45,87 @@ async def get_current_user(request: Request, db: Session = Depends(get_db)):
         return None
 
 
+def _parse_date_param(value: str, name: str) -> date:
+    """YYYY-MM-DD 형식의 날짜 파라미터를 파싱합니다."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name} 형식이 잘못되었습니다. YYYY-MM-DD 형식을 사용하세요.")
+
+
+# 일괄 일별 커밋 수 조회에서 github_id로 지정할 수 있는 최대 사용자 수
+DAILY_COUNTS_MAX_USERS = 100
+
+
+# /github-commits/{github_id}보다 먼저 선언해야 "daily-counts"가 github_id로 매칭되지 않음
+@router.get("/github-commits/daily-counts")
+async def read_users_daily_commits(
+    github_id: Annotated[Optional[List[str]], Query()] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    db: Session = Depends(get_db),
+    season: Optional[str] = None
+):
+    """
+    여러 사용자(또는 전체 사용자)의 일별 GitHub 커밋 수를 한 번에 조회합니다. (커뮤니티 히트맵용)
+    커밋 테이블 대신 attendances 테이블에 저장된 일별 커밋 수를 읽습니다.
+    기간은 시즌 기간으로 제한하고, github_id는 DAILY_COUNTS_MAX_USERS개까지 지정할 수 있습니다.
+    
+    Args:
+        github_id: GitHub 사용자 ID (여러 번 지정 가능, e.g. ?github_id=a&github_id=b). 없으면 전체 사용자
+        from_date: 시작 날짜 (YYYY-MM-DD 형식, 기본값: 시즌 시작일)
+        to_date: 종료 날짜 (YYYY-MM-DD 형식, 기본값: 오늘과 시즌 종료일 중 이른 날짜)
+        db: 데이터베이스 세션
+        season: 시즌 이름 (기본값: 설정 파일의 현재 시즌)
+        
+    Returns:
+        Dict: 실제 조회한 from_date, to_date와 사용자별 일별 커밋 수 목록 (i번째 값 = from_date + i일).
+            등록되지 않은 github_id가 있으면 unknown_github_ids에 담고 daily_counts에서는 뺍니다.
+    """
+    if season is None:
+        project_start, project_end = get_project_period()
+    else:
+        period = get_season_period(db, season)
+        if period is None:
+            raise HTTPException(status_code=404, detail=f"시즌을 찾을 수 없습니다: {season}")
+        project_start, project_end = period
+    start_date = _parse_date_param(from_date, "시작 날짜") if from_date else project_start
+    end_date = _parse_date_param(to_date, "종료 날짜") if to_date else min(kst_today(), project_end)
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="시작 날짜가 종료 날짜보다 늦습니다.")
+
+    # 응답 배열 크기가 (사용자 수 x 일수)이므로 시즌 기간 밖은 조회하지 않음
+    start_date, end_date = max(start_date, project_start), min(end_date, project_end)
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="조회 기간이 시즌 기간과 겹치지 않습니다.")
+
+    all_users = not github_id
+    unknown_github_ids = []
+    if all_users:
+        github_ids = [gid for (gid,) in db.query(User.github_id).order_by(User.github_id).all()]
+    else:
+        requested = list(dict.fromkeys(github_id))
+        if len(requested) > DAILY_COUNTS_MAX_USERS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"github_id는 최대 {DAILY_COUNTS_MAX_USERS}개까지 지정할 수 있습니다."
+            )
+        known = {gid for (gid,) in db.query(User.github_id).filter(User.github_id.in_(requested)).all()}
+        github_ids = [gid for gid in requested if gid in known]
+        unknown_github_ids = [gid for gid in requested if gid not in known]
+
+    num_days = (end_date - start_date).days + 1
+    counts = load_commit_count_array(db, start_date, num_days, github_ids, all_users=all_users)
+
+    # 본문이 커서 jsonable_encoder를 거치지 않고 바로 직렬화
+    return ORJSONResponse({
+        "from_date": start_date.isoformat(),
+        "to_date": end_date.isoformat(),
+        "daily_counts": dict(zip(github_ids, counts.tolist())),
+        **({"unknown_github_ids": unknown_github_ids} if unknown_github_ids else {})
+    })
+
+
 @router.get("/github-commits/{github_id}", response_model=dict)
 async def read_user_commits(
     github_id: str, 
@@ -185,75 +270,17 @@ async def read_user_commits_stats(
         db: 데이터베이스 세션
         
     Returns:
-        Dict: 커밋 통계 정보 (총 커밋 수, 저장소 수, 가장 최근 커밋 날짜)
+        Dict: 커밋 통계 정보 (총 커밋 수, 저장소 수, 가장 최근 커밋 날짜, 현재/최장 연속 출석 일수)
+            시즌이 끝나 스냅샷이 있으면 기본 기간의 통계는 스냅샷에서 반환합니다.
     """
+    snapshot_user = get_snapshot_user(github_id) if not from_date and not to_date else None
+    if snapshot_user is not None:
+        return snapshot_user["commit_stats"]
+
+    start_date = _parse_date_param(from_date, "시작 날짜") if from_date else None
+    end_date = _parse_date_param(to_date, "종료 날짜") if to_date else None
     try:
-        # 날짜 파라미터 처리
-        start_date = None
-        end_date = None
-        
-        # 날짜 파라미터가 없는 경우 프로젝트 기간 사용
-        if not from_date and not to_date and config.project:
-            # 프로젝트 시작일 가져오기
-            if hasattr(config.project, 'start_date'):
-                try:
-                    start_date = date.fromisoformat(config.project.start_date)
-                except ValueError:
-                    logger.warning("프로젝트 시작일 형식이 잘못되었습니다.")
-            
-            # 프로젝트 종료일 계산
-            if start_date and hasattr(config.project, 'total_days'):
-                try:
-                    total_days = int(config.project.total_days)
-                    project_end_date = start_date + timedelta(days=total_days - 1)
-                    # 프로젝트가 종료되었으면 프로젝트 종료일, 아니면 오늘 날짜 사용
-                    end_date = min(date.today(), project_end_date)
-                except ValueError:
-                    logger.warning("프로젝트 총 일수 형식이 잘못되었습니다.")
-                    end_date = date.today()
-            else:
-                end_date = date.today()
-        
-        # 명시적으로 지정된 날짜 범위가 있는 경우
-        if from_date:
-            try:
-                start_date = date.fromisoformat(from_date)
-            except ValueError:
-                raise HTTPException(status_code=400, detail="시작 날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식을 사용하세요.")
-        
-        if to_date:
-            try:
-                end_date = date.fromisoformat(to_date)
-            except ValueError:
-                raise HTTPException(status_code=400, detail="종료 날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식을 사용하세요.")
-        
-        # 통계 정보 조회
-        stats = await get_user_commits_stats(
-            db, 
-            github_id,
-            from_date=start_date,
-            to_date=end_date
-        )
-        
-        # 날짜 범위 정보 추가
-        stats["from_date"] = start_date.isoformat() if start_date else None
-        stats["to_date"] = end_date.isoformat() if end_date else None
-        
-        # 최근 커밋 날짜가 있는 경우 ISO 형식으로 변환
-        if stats.get("latest_commit_date"):
-            stats["latest_commit_date"] = stats["latest_commit_date"].isoformat()
-            
-            # 오늘과의 날짜 차이 계산
-            latest_date = datetime.fromisoformat(stats["latest_commit_date"].split("T")[0])
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            days_diff = (today - latest_date).days
-            
-            stats["days_since_last_commit"] = days_diff
-        else:
-            stats["days_since_last_commit"] = None
-            
-        return stats
-    
+        return await build_user_commit_stats(db, github_id, start_date, end_date)
     except Exception as e:
         logger.error(f"커밋 통계 조회 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail="커밋 통계를 조회하는 중 오류가 발생했습니다.")
@@ -277,114 +304,20 @@ async def read_user_daily_commits(
         
     Returns:
         Dict: 날짜별 커밋 수 정보
+            시즌이 끝나 스냅샷이 있으면 기본 기간의 커밋 수는 스냅샷에서 반환합니다.
     """
+    snapshot_user = get_snapshot_user(github_id) if not from_date and not to_date else None
+    if snapshot_user is not None:
+        return snapshot_user["daily_counts"]
+
+    start_date = _parse_date_param(from_date, "시작 날짜") if from_date else None
+    end_date = _parse_date_param(to_date, "종료 날짜") if to_date else None
+    # 날짜 범위 체크
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=400, detail="시작 날짜가 종료 날짜보다 늦습니다.")
+
     try:
-        # 날짜 파라미터 처리
-        start_date = None
-        end_date = None
-        
-        # 날짜 파라미터가 없는 경우 프로젝트 기간 또는 최근 1년 사용
-        if not from_date and not to_date:
-            # 기본값: 최근 1년 (약 365일)
-            end_date = date.today()
-            start_date = end_date - timedelta(days=365)
-            
-            # 프로젝트 설정 확인
-            if config.project:
-                # 프로젝트 시작일 확인
-                project_start = None
-                if hasattr(config.project, 'start_date'):
-                    try:
-                        project_start = date.fromisoformat(config.project.start_date)
-                        start_date = project_start  # 프로젝트 시작일 사용
-                    except ValueError:
-                        logger.warning("프로젝트 시작일 형식이 잘못되었습니다.")
-                
-                # 총 일수(total_days)를 이용하여 종료일 계산
-                if project_start and hasattr(config.project, 'total_days'):
-                    try:
-                        total_days = int(config.project.total_days)
-                        # 시작일 + 총 일수 - 1 = 종료일
-                        project_end_date = project_start + timedelta(days=total_days - 1)
-                        # 프로젝트가 종료되었으면 프로젝트 종료일 사용
-                        end_date = min(date.today(), project_end_date)
-                    except (ValueError, TypeError):
-                        logger.warning("프로젝트 총 일수(total_days) 형식이 잘못되었습니다.")
-                        
-                # total_days 없이 직접 종료일이 설정된 경우
-                elif hasattr(config.project, 'end_date'):
-                    try:
-                        project_end = date.fromisoformat(config.project.end_date)
-                        end_date = project_end
-                    except ValueError:
-                        logger.warning("프로젝트 종료일 형식이 잘못되었습니다.")
-        
-        # 명시적으로 지정된 날짜 범위가 있는 경우
-        if from_date:
-            try:
-                start_date = date.fromisoformat(from_date)
-            except ValueError:
-                raise HTTPException(status_code=400, detail="시작 날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식을 사용하세요.")
-        
-        if to_date:
-            try:
-                end_date = date.fromisoformat(to_date)
-            except ValueError:
-                raise HTTPException(status_code=400, detail="종료 날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식을 사용하세요.")
-                
-        # 날짜 범위 체크
-        if start_date and end_date and start_date > end_date:
-            raise HTTPException(status_code=400, detail="시작 날짜가 종료 날짜보다 늦습니다.")
-            
-        # 일별 커밋 수 쿼리 생성
-        query = db.query(
-            func.date(func.timezone('Asia/Seoul', GitHubCommit.commit_date)).label('commit_date'),
-            func.count().label('count')
-        ).filter(
-            GitHubCommit.github_id == github_id
-        ).group_by(
-            func.date(func.timezone('Asia/Seoul', GitHubCommit.commit_date))
-        ).order_by(
-            func.date(func.timezone('Asia/Seoul', GitHubCommit.commit_date))
-        )
-        
-        # 시간 보정 (KST 기준)
-        kst_offset = timedelta(hours=9)  # UTC+9
-        
-        # 날짜 필터 적용
-        if start_date:
-            start_datetime = datetime.combine(start_date, datetime.min.time()) - kst_offset
-            query = query.filter(GitHubCommit.commit_date >= start_datetime)
-            
-        if end_date:
-            end_datetime = datetime.combine(end_date, datetime.max.time()) - kst_offset
-            query = query.filter(GitHubCommit.commit_date <= end_datetime)
-            
-        # 쿼리 실행
-        results = query.all()
-        
-        # 결과를 딕셔너리로 변환
-        daily_commits = {}
-        
-        # 날짜 범위 내의 모든 날짜에 대해 빈 데이터 생성 (비어있는 날짜도 0으로 표시)
-        if start_date and end_date:
-            current_date = start_date
-            while current_date <= end_date:
-                daily_commits[current_date.isoformat()] = 0
-                current_date += timedelta(days=1)
-        
-        # 실제 데이터 채우기
-        for result in results:
-            date_str = result.commit_date.isoformat()
-            daily_commits[date_str] = result.count
-            
-        return {
-            "github_id": github_id,
-            "from_date": start_date.isoformat() if start_date else None,
-            "to_date": end_date.isoformat() if end_date else None,
-            "daily_commits": daily_commits
-        }
-        
+        return build_user_daily_commits(db, github_id, start_date, end_date)
     except Exception as e:
         logger.error(f"일별 커밋 수 조회 중 오류 발생: {str(e)}")
-        raise HTTPException(status_code=500, detail="일별 커밋 수를 조회하는 중 오류가 발생했습니다.")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="일별 커밋 수를 조회하는 중 오류가 발생했습니다.")
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List
+
+from app.database import get_db
+from app.services.season_service import list_seasons
+from app.utils.date_utils import get_project_season_name
+
+router = APIRouter()
+
+
+@router.get("/seasons")
+async def get_seasons(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+    """
+    시즌 목록을 시작일 순으로 조회합니다.
+    name은 출석 통계/순위/시간대별 커밋 API의 season 파라미터 값이며, is_current는 설정 파일의 현재 시즌 여부입니다.
+    """
+    current = get_project_season_name()
+    return [
+        {
+            "name": season.name,
+            "start_date": season.start_date.isoformat(),
+            "end_date": season.end_date.isoformat(),
+            "is_current": season.name == current
+        }
+        for season in list_seasons(db)
+    ]
@@ -2,10 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException, status, Header
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
+from datetime import datetime
 import httpx
 
 from app.database import get_db
 from app.models.user import User
+from app.services.attendance_service import on_users_changed
+from app.services.participant_service import set_user_active
 from app.config import config
 
 router = APIRouter()
@@ -39,6 +42,9 @@ class UserResponse(BaseModel):
     id: int
     github_id: str
     github_profile_url: Optional[str] = None
+    is_active: bool = True
+    activated_at: Optional[datetime] = None
+    deactivated_at: Optional[datetime] = None
 
 
 # 모든 사용자 조회
@@ -106,6 +112,7 @@ async def create_user(
     )
     
     db.add(new_user)
+    on_users_changed(db)
     db.commit()
     db.refresh(new_user)
     
@@ -144,3 +151,54 @@ async def update_user(
     db_user.github_profile_url = f"https://avatars.githubusercontent.com/{db_user.github_id}"
     
     return db_user
+
+
+async def _set_user_active(user_id: int, is_active: bool, db: Session):
+    """사용자의 참여 상태를 바꾸고, 바뀌었으면 사용자 수가 들어 있는 캐시를 버립니다."""
+    db_user = db.query(User).filter(User.id == user_id).first()
+    if not db_user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다."
+        )
+
+    try:
+        changed = set_user_active(db, db_user, is_active)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    if changed:
+        on_users_changed(db)
+        db.commit()
+        db.refresh(db_user)
+
+    db_user.github_profile_url = f"https://avatars.githubusercontent.com/{db_user.github_id}"
+    return db_user
+
+
+# 사용자 참여 종료 (관리자 권한 필요)
+@router.post("/users/{user_id}/deactivate", response_model=UserResponse, tags=["users"])
+async def deactivate_user(
+    user_id: int,
+    db: Session = Depends(get_db),
+    is_admin: bool = Depends(verify_admin_api_key)
+):
+    """
+    사용자를 비활성화합니다. 관리자 권한이 필요합니다.
+    비활성 사용자는 더 이상 수집하지 않고, 통계에는 참여 기간만 포함합니다.
+    """
+    return await _set_user_active(user_id, False, db)
+
+
+# 사용자 참여 재개 (관리자 권한 필요)
+@router.post("/users/{user_id}/activate", response_model=UserResponse, tags=["users"])
+async def activate_user(
+    user_id: int,
+    db: Session = Depends(get_db),
+    is_admin: bool = Depends(verify_admin_api_key)
+):
+    """
+    사용자를 활성화합니다. 관리자 권한이 필요합니다.
+    참여 기간은 사용자마다 하나만 기록하므로, 참여를 그만둔 사용자를 다시 활성화하면 409를 반환합니다.
+    """
+    return await _set_user_active(user_id, True, db)
@@ -1,11 +1,15 @@
 import asyncio
 import logging
-from datetime import date, datetime, timedelta
+from datetime import datetime, timedelta
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 from app.database import SessionLocal
-from app.services.attendance_service import check_all_attendances, create_attendance_from_commits
+from app.services.attendance_service import check_all_attendances
+from app.services.day_close_service import DAY_CLOSE_GRACE_MINUTES, close_pending_days, get_finalized_days
+from app.services.season_snapshot_service import is_season_over, load_snapshot
+from app.season_freeze import freeze_season
+from app.utils.date_utils import kst_today
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,22 +31,21 @@ async def run_attendance_check():
         # 데이터베이스 세션 생성
         db = SessionLocal()
         
-        # 오늘과 어제 날짜 계산
-        today = date.today()
+        # 오늘과 어제 날짜 계산 (KST). 마감된 날짜는 다시 수집하지 않음
+        today = kst_today()
         yesterday = today - timedelta(days=1)
         
-        dates_to_check = [yesterday, today]
+        finalized = get_finalized_days(db, [yesterday, today])
+        dates_to_check = [d for d in (yesterday, today) if d not in finalized]
         
         for check_date in dates_to_check:
             logger.info(f"날짜 {check_date.isoformat()} 출석 체크 중...")
             
-            # 기존 방식 출석 체크 (GitHub API 호출)
+            # GitHub API로 새 커밋을 가져오고, 바뀐 출석 칸에만 변화량 반영
+            # (전체 재계산이 필요하면 python -m app.recompute 사용)
             api_result = await check_all_attendances(check_date, db)
-            logger.info(f"{check_date.isoformat()} API 출석 체크 결과: {api_result['status']}")
-            
-            # 커밋 내역 기반 출석 체크 (DB에 저장된 커밋 사용)
-            commit_result = await create_attendance_from_commits(db, check_date)
-            logger.info(f"{check_date.isoformat()} 커밋 기반 출석 체크 결과: {commit_result['status']}")
+            updated_cells = sum(r.get("updated_cells", 0) for r in api_result.get("results", []))
+            logger.info(f"{check_date.isoformat()} 출석 체크 결과: {api_result['status']}, 갱신한 출석 칸 {updated_cells}개")
         
         logger.info("모든 날짜 출석 체크 완료")
         
@@ -51,6 +54,30 @@ async def run_attendance_check():
     finally:
         db.close()
 
+async def run_day_close():
+    """
+    마감할 수 있는 날짜를 마감합니다.
+    매일 KST 자정 + 유예 시간(DAY_CLOSE_GRACE_MINUTES)에 실행되도록 설정됩니다.
+    """
+    logger.info(f"날짜 마감 시작: {datetime.now()}")
+
+    db = SessionLocal()
+    try:
+        for result in await close_pending_days(db):
+            logger.info(f"{result.get('date')} 마감 결과: {result['status']} {result.get('message', '')}")
+
+        # 시즌이 끝났으면 마지막 날 마감 후 스냅샷을 저장하고 수집 작업을 멈춤
+        if is_season_over():
+            result = await freeze_season(db)
+            logger.info(f"시즌 스냅샷 결과: {result['status']} {result.get('message', '')}")
+            if result["status"] == "success":
+                scheduler.remove_all_jobs()
+                logger.info("시즌 종료 - 수집 작업을 모두 중지했습니다.")
+    except Exception as e:
+        logger.error(f"날짜 마감 중 오류 발생: {e}", exc_info=True)
+    finally:
+        db.close()
+
 def init_scheduler(run_scheduler=False):
     """
     스케줄러를 초기화하고 작업을 등록합니다.
@@ -64,27 +91,46 @@ def init_scheduler(run_scheduler=False):
     if not run_scheduler:
         # 비활성화 메시지는 lifespan에서 이미 출력하므로 여기서는 생략
         return scheduler
+
+    # 시즌 스냅샷이 있으면 더 수집할 것이 없음
+    if load_snapshot() is not None:
+        logger.info("시즌이 종료되어 스냅샷으로 제공 중입니다 - 수집 작업을 등록하지 않습니다.")
+        return scheduler
+
+    season_over = is_season_over()
     
-    # 1시간마다 출석 체크 수행
-    scheduler.add_job(
-        run_attendance_check,
-        IntervalTrigger(hours=1),
-        id="hourly_attendance_check",
-        replace_existing=True
-    )
+    # 1시간마다 출석 체크 수행 (시즌이 끝났으면 마감과 스냅샷 저장만 수행)
+    if not season_over:
+        scheduler.add_job(
+            run_attendance_check,
+            IntervalTrigger(hours=1),
+            id="hourly_attendance_check",
+            replace_existing=True
+        )
     
-    # 매일 자정(UTC 0시)에도 출석 체크 수행 (중요한 시점)
+    # 매일 KST 자정 + 유예 시간에 전날 마감 (마지막 수집 후 마감 기록)
     scheduler.add_job(
-        run_attendance_check,
-        CronTrigger(hour=0, minute=0, second=0),
-        id="daily_attendance_check",
+        run_day_close,
+        CronTrigger(
+            hour=DAY_CLOSE_GRACE_MINUTES // 60 % 24,
+            minute=DAY_CLOSE_GRACE_MINUTES % 60,
+            second=0,
+            timezone="Asia/Seoul"
+        ),
+        id="daily_day_close",
         replace_existing=True
     )
     
-    # 스케줄러 시작 시 한 번 출석 체크 수행
+    # 스케줄러 시작 시 한 번 출석 체크 수행 (중단된 동안 놓친 마감도 처리)
+    if not season_over:
+        scheduler.add_job(
+            run_attendance_check,
+            id="initial_attendance_check",
+            replace_existing=True
+        )
     scheduler.add_job(
-        run_attendance_check,
-        id="initial_attendance_check",
+        run_day_close,
+        id="initial_day_close",
         replace_existing=True
     )
     
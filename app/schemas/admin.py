@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Optional
 from pydantic import BaseModel
 
@@ -7,12 +7,19 @@ class AttendanceUpdateRequest(BaseModel):
     github_id: str
     date: str
     is_attended: bool
+    reopen: bool = False  # 마감된 날짜를 다시 열어 수정
 
 
 class AddUserRequest(BaseModel):
     github_id: str
 
 
+class SeasonCreateRequest(BaseModel):
+    name: str
+    start_date: date
+    end_date: date
+
+
 class LogEntry(BaseModel):
     timestamp: datetime
     level: str
@@ -0,0 +1,105 @@
+import argparse
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.user import User
+from app.services.attendance_service import get_user_attendance_history
+from app.services.commit_rollup_service import get_hourly_commit_counts
+from app.services.day_close_service import get_finalized_at
+from app.services.season_snapshot_service import is_season_over, new_snapshot, save_snapshot
+from app.services.stats_service import (
+    build_attendance_ranking,
+    build_attendance_stats,
+    build_user_commit_stats,
+    build_user_daily_commits,
+    resolve_date_range,
+)
+from app.utils.date_utils import get_project_period
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+async def build_season_snapshot(db: Session) -> Dict[str, Any]:
+    """
+    시즌 전체 기간의 API 응답을 모아 스냅샷을 만듭니다.
+    API와 같은 서비스 함수로 계산하므로 스냅샷에 담기는 값은 같은 API를 기본 파라미터로 호출한 결과와 같습니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        Dict: 스냅샷 (stats, ranking, hourly_commits, 사용자별 attendance_history / commit_stats / daily_counts)
+    """
+    season_start, season_end = get_project_period()
+    snapshot = new_snapshot(season_start, season_end)
+
+    start, end = resolve_date_range(None, None)
+    snapshot["stats"] = build_attendance_stats(db, start, end)
+    snapshot["ranking"] = build_attendance_ranking(db, start, end)
+    snapshot["hourly_commits"] = get_hourly_commit_counts(db, start, end)
+
+    for (github_id,) in db.query(User.github_id).order_by(User.github_id).all():
+        snapshot["users"][github_id] = {
+            "attendance_history": await get_user_attendance_history(github_id, season_start, season_end, db),
+            "commit_stats": await build_user_commit_stats(db, github_id),
+            "daily_counts": build_user_daily_commits(db, github_id),
+        }
+
+    return snapshot
+
+
+async def freeze_season(db: Session, path: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
+    """
+    시즌이 끝나고 마지막 날이 마감되었으면 스냅샷을 만들어 저장합니다.
+    저장한 뒤에는 통계 API가 DB 대신 스냅샷을 읽습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        path: 저장 경로 (None이면 설정값)
+        force: True면 시즌 종료/마감 여부와 관계없이 저장
+
+    Returns:
+        Dict: 처리 결과
+    """
+    _, season_end = get_project_period()
+    if not force:
+        if not is_season_over():
+            return {"status": "info", "message": f"시즌이 아직 끝나지 않았습니다. (종료일 {season_end.isoformat()})"}
+        if get_finalized_at(db, season_end) is None:
+            return {"status": "info", "message": f"시즌 마지막 날({season_end.isoformat()})이 아직 마감되지 않았습니다."}
+
+    snapshot = await build_season_snapshot(db)
+    saved_path = save_snapshot(snapshot, path)
+    logger.info(f"시즌 스냅샷 저장 완료: {saved_path} (사용자 {len(snapshot['users'])}명)")
+    return {"status": "success", "path": saved_path, "users": len(snapshot["users"])}
+
+
+def parse_args():
+    """명령행 인수를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="정원사들 시즌10 시즌 종료 스냅샷 생성")
+    parser.add_argument("--output", type=str, default=None, help="저장 경로 (기본값: 설정 파일의 cache.season_snapshot_path)")
+    parser.add_argument("--force", action="store_true", help="시즌 종료/마감 여부와 관계없이 저장합니다")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+
+    db = SessionLocal()
+    try:
+        result = await freeze_season(db, path=args.output, force=args.force)
+        logger.info(f"{result['status']}: {result.get('message') or result['path']}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,12 +6,27 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 
-from app.models.github_commit import GitHubCommit
 from app.models.user import User
 from app.models.attendance import Attendance
-from app.services.attendance_service import check_all_attendances
-from app.services.github_service import get_all_users_attendance_stats
-from app.utils.date_utils import get_kst_datetime_range
+from app.services.attendance_service import (
+    FinalizedDayError,
+    check_all_attendances,
+    find_attendance_mismatches,
+    get_finalized_day_set,
+    mark_day_reopened,
+    on_attendance_changed,
+    on_users_changed,
+    recompute_attendance_range
+)
+from app.services.attendance_matrix_service import rebuild_attendance_matrix
+from app.services.day_close_service import reopen_day
+from app.services.commit_rollup_service import rebuild_commit_hourly_rollups
+from app.services.season_service import create_season, season_partition_name, PARTITIONED_TABLES
+from app.services.streak_service import rebuild_streaks, verify_streaks
+from app.services.github_service import (
+    get_all_users_attendance_stats,
+    get_user_commit_details
+)
 from app.config import config
 from app.services.openai_service import get_openai_service
 
@@ -33,22 +48,7 @@ class AdminService:
                 github_id = item.get("github_id")
                 updated_users.append(github_id)
                 
-                start_datetime, end_datetime = get_kst_datetime_range(check_date)
-                
-                commits = db.query(GitHubCommit).filter(
-                    GitHubCommit.github_id == github_id,
-                    GitHubCommit.commit_date >= start_datetime,
-                    GitHubCommit.commit_date <= end_datetime
-                ).all()
-                
-                commit_details = []
-                for commit in commits:
-                    commit_details.append({
-                        "commit_id": commit.commit_id,
-                        "repository": commit.repository,
-                        "commit_date": commit.commit_date.isoformat(),
-                        "message": commit.message
-                    })
+                commit_details = get_user_commit_details(db, github_id, check_date)
                 
                 attendance = db.query(Attendance).filter(
                     Attendance.github_id == github_id,
@@ -89,56 +89,52 @@ class AdminService:
         return results
     
     @staticmethod
-    def update_user_attendance(github_id: str, date_str: str, is_attended: bool, db: Session) -> Dict[str, Any]:
+    def update_user_attendance(
+        github_id: str, date_str: str, is_attended: bool, db: Session, reopen: bool = False
+    ) -> Dict[str, Any]:
         user = db.query(User).filter(User.github_id == github_id).first()
         if not user:
             return None
         
+        check_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        # 마감된 날짜는 명시적으로 다시 열 때만 수정
+        finalized = bool(get_finalized_day_set(db, [check_date]))
+        if finalized and not reopen:
+            raise FinalizedDayError(f"{date_str}는 마감된 날짜입니다. 수정하려면 reopen을 지정하세요.")
+        
         attendance = db.query(Attendance).filter(
             Attendance.github_id == github_id,
-            Attendance.attendance_date == date_str
+            Attendance.attendance_date == check_date
         ).first()
         
-        check_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        start_datetime, end_datetime = get_kst_datetime_range(check_date)
-        
-        commits = db.query(GitHubCommit).filter(
-            GitHubCommit.github_id == github_id,
-            GitHubCommit.commit_date >= start_datetime,
-            GitHubCommit.commit_date <= end_datetime
-        ).all()
-        
-        commit_count = len(commits)
+        # 응답에 담을 커밋 목록을 한 번 조회하고 그 개수를 커밋 수로 사용
+        commit_details = get_user_commit_details(db, github_id, check_date)
+        commit_count = len(commit_details)
         
         if attendance:
             attendance.is_attended = is_attended
             attendance.commit_count = commit_count
             attendance.updated_at = datetime.utcnow()
-            db.commit()
             message = "출석 상태가 업데이트되었습니다."
             action = "updated"
         else:
             new_attendance = Attendance(
                 github_id=github_id,
-                attendance_date=date_str,
+                attendance_date=check_date,
                 is_attended=is_attended,
                 commit_count=commit_count,
                 created_at=datetime.utcnow(),
                 updated_at=datetime.utcnow()
             )
             db.add(new_attendance)
-            db.commit()
             message = "출석 상태가 새로 생성되었습니다."
             action = "created"
         
-        commit_details = []
-        for commit in commits:
-            commit_details.append({
-                "commit_id": commit.commit_id,
-                "repository": commit.repository,
-                "commit_date": commit.commit_date.isoformat(),
-                "message": commit.message
-            })
+        db.flush()
+        on_attendance_changed(db, [(github_id, check_date)])
+        if finalized:
+            mark_day_reopened(db, check_date)
+        db.commit()
         
         return {
             "success": True,
@@ -153,6 +149,81 @@ class AdminService:
             }
         }
     
+    @staticmethod
+    def rebuild_attendance_read_model(db: Session) -> Dict[str, Any]:
+        result = rebuild_attendance_matrix(db)
+        rebuild_streaks(db)
+        hourly_rollups = rebuild_commit_hourly_rollups(db)
+        # 읽기 모델 전체가 바뀌었으므로 데이터 버전을 올려 응답 캐시를 버리고, 커밋되면 날짜별 통계 캐시도 모두 버림
+        on_users_changed(db)
+        db.commit()
+        
+        return {
+            "success": True,
+            "message": "출석 매트릭스, 연속 출석 상태, 시간대별 커밋 집계를 다시 만들었습니다.",
+            "users": result["users"],
+            "days": result["days"],
+            "hourly_rollups": hourly_rollups
+        }
+    
+    @staticmethod
+    def add_season(name: str, start_date: date, end_date: date, db: Session) -> Dict[str, Any]:
+        try:
+            season = create_season(db, name, start_date, end_date)
+        except ValueError as e:
+            db.rollback()
+            return {"success": False, "message": str(e)}
+        db.commit()
+        
+        return {
+            "success": True,
+            "message": f"시즌 '{name}'을 추가했습니다.",
+            "name": season.name,
+            "start_date": season.start_date.isoformat(),
+            "end_date": season.end_date.isoformat(),
+            "partitions": [season_partition_name(table, season) for table in PARTITIONED_TABLES]
+        }
+    
+    @staticmethod
+    def verify_streaks(db: Session) -> Dict[str, Any]:
+        mismatches = verify_streaks(db)
+        
+        return {
+            "success": not mismatches,
+            "message": "연속 출석 상태가 출석 기록과 일치합니다." if not mismatches
+            else f"연속 출석 상태가 출석 기록과 다른 사용자가 {len(mismatches)}명 있습니다.",
+            "mismatches": mismatches
+        }
+    
+    @staticmethod
+    def reopen_finalized_day(day: date, db: Session) -> Dict[str, Any]:
+        return reopen_day(db, day)
+    
+    @staticmethod
+    def reconcile_attendance(start_date: date, end_date: date, repair: bool, db: Session) -> Dict[str, Any]:
+        if repair:
+            mismatches = recompute_attendance_range(db, start_date, end_date)
+            db.commit()
+        else:
+            mismatches = find_attendance_mismatches(db, start_date, end_date)
+        
+        if not mismatches:
+            message = "출석 기록이 커밋 내역과 일치합니다."
+        elif repair:
+            message = f"커밋 내역과 다른 출석 기록 {len(mismatches)}건을 고쳤습니다."
+        else:
+            message = f"커밋 내역과 다른 출석 기록이 {len(mismatches)}건 있습니다."
+        
+        return {
+            "success": True,
+            "message": message,
+            "repaired": repair and bool(mismatches),
+            "mismatches": [
+                {**row, "attendance_date": row["attendance_date"].isoformat()}
+                for row in mismatches
+            ]
+        }
+    
     @staticmethod
     def get_system_status() -> Dict[str, Any]:
         cpu_percent = psutil.cpu_percent(interval=1)
@@ -239,6 +310,7 @@ class AdminService:
         )
         
         db.add(new_user)
+        on_users_changed(db)
         db.commit()
         db.refresh(new_user)
         
@@ -344,14 +416,7 @@ class AdminService:
         for user_stat in users_stats:
             github_id = user_stat.get("github_id")
             
-            start_datetime, end_datetime = get_kst_datetime_range(display_date)
-            
-            user_commits = db.query(GitHubCommit).filter(
-                GitHubCommit.github_id == github_id,
-                GitHubCommit.commit_date >= start_datetime,
-                GitHubCommit.commit_date <= end_datetime,
-                GitHubCommit.is_private == False
-            ).all()
+            user_commits = get_user_commit_details(db, github_id, display_date, public_only=True)
             
             if user_commits:
                 today_commits[github_id] = user_commits
@@ -374,7 +439,7 @@ class AdminService:
                 commit_date_label = "종료일" if is_completed else "오늘"
                 prompt_base += f"\n{commit_date_label}의 공개 커밋 내역:\n"
                 for commit in today_commits[github_id]:
-                    prompt_base += f"- {commit.repository}: {commit.message.splitlines()[0]}\n"
+                    prompt_base += f"- {commit['repository']}: {commit['message'].splitlines()[0]}\n"
                 prompt_base += "\n"
             
             attendance_by_date = user_stat.get("attendance_by_date", {})
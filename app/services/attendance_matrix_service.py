@@ -0,0 +1,293 @@
+import logging
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.models.attendance import Attendance
+from app.models.attendance_matrix import AttendanceMatrix, DailyAttendanceCount
+from app.models.user import User
+from app.services.participant_service import get_active_window, in_window
+from app.utils.date_utils import get_project_period
+from app.utils.db_utils import upsert
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+ATTENDED = "1"
+ABSENT = "0"
+
+
+def _get_season() -> Tuple[date, int]:
+    """매트릭스가 다루는 시즌의 시작일과 일수를 반환합니다."""
+    season_start, season_end = get_project_period()
+    return season_start, (season_end - season_start).days + 1
+
+
+def _build_days(db: Session, github_ids: Set[str], season_start: date, total_days: int) -> Dict[str, List[str]]:
+    """attendances 테이블에서 사용자들의 시즌 전체 출석 문자열을 새로 만듭니다."""
+    days_by_user = {github_id: [ABSENT] * total_days for github_id in github_ids}
+    if not github_ids:
+        return days_by_user
+
+    season_end = season_start + timedelta(days=total_days - 1)
+    attended = db.query(Attendance.github_id, Attendance.attendance_date).filter(
+        Attendance.github_id.in_(github_ids),
+        Attendance.attendance_date >= season_start,
+        Attendance.attendance_date <= season_end,
+        Attendance.is_attended == True
+    ).all()
+
+    for github_id, attendance_date in attended:
+        days_by_user[github_id][(attendance_date - season_start).days] = ATTENDED
+
+    return days_by_user
+
+
+def _save_matrix_rows(db: Session, days_by_user: Dict[str, List[str]], season_start: date) -> None:
+    """사용자별 출석 문자열을 attendance_matrix 테이블에 저장합니다."""
+    rows = []
+    for github_id, days in days_by_user.items():
+        days_str = "".join(days)
+        rows.append({
+            "github_id": github_id,
+            "start_date": season_start,
+            "days": days_str,
+            "attended_count": days_str.count(ATTENDED)
+        })
+
+    upsert(
+        db,
+        AttendanceMatrix,
+        rows,
+        index_elements=["github_id"],
+        update_columns=["start_date", "days", "attended_count"],
+        constraint="uix_attendance_matrix_github_id"
+    )
+
+
+def _refresh_daily_counts(db: Session, dates: Iterable[date]) -> None:
+    """특정 날짜들의 출석 인원을 GROUP BY 한 번으로 다시 계산해 저장합니다."""
+    dates = set(dates)
+    if not dates:
+        return
+
+    counts = dict(
+        db.query(Attendance.attendance_date, func.count(Attendance.id)).join(
+            User, User.github_id == Attendance.github_id
+        ).filter(
+            Attendance.attendance_date.in_(dates),
+            Attendance.is_attended == True
+        ).group_by(Attendance.attendance_date).all()
+    )
+
+    upsert(
+        db,
+        DailyAttendanceCount,
+        [{"attendance_date": d, "attended_count": counts.get(d, 0)} for d in sorted(dates)],
+        index_elements=["attendance_date"],
+        update_columns=["attended_count"],
+        constraint="uix_daily_attendance_counts_date"
+    )
+
+
+def refresh_attendance_matrix(db: Session, cells: Iterable[Tuple[str, date]]) -> None:
+    """
+    변경된 (사용자, 날짜) 칸만 출석 매트릭스와 날짜별 출석 인원에 반영합니다.
+    변경 칸 수와 관계없이 일정한 횟수의 쿼리로 처리하며, 커밋은 호출자가 합니다.
+    매트릭스 행이 없거나 시즌이 바뀐 사용자는 시즌 전체를 다시 만듭니다.
+
+    Args:
+        db: 데이터베이스 세션
+        cells: 변경된 (github_id, 날짜) 목록
+    """
+    season_start, total_days = _get_season()
+    season_end = season_start + timedelta(days=total_days - 1)
+
+    cells = {(github_id, d) for github_id, d in cells if season_start <= d <= season_end}
+    if not cells:
+        return
+
+    github_ids = {github_id for github_id, _ in cells}
+    dates = {d for _, d in cells}
+
+    existing = {
+        github_id: (start_date, days)
+        for github_id, start_date, days in db.query(
+            AttendanceMatrix.github_id, AttendanceMatrix.start_date, AttendanceMatrix.days
+        ).filter(AttendanceMatrix.github_id.in_(github_ids)).all()
+    }
+
+    stale = {
+        github_id for github_id in github_ids
+        if github_id not in existing or existing[github_id][0] != season_start
+    }
+    current = github_ids - stale
+
+    days_by_user = _build_days(db, stale, season_start, total_days)
+    # 새로 만든 사용자의 출석일도 날짜별 출석 인원에 반영
+    for github_id in stale:
+        dates.update(
+            season_start + timedelta(days=i) for i, c in enumerate(days_by_user[github_id]) if c == ATTENDED
+        )
+
+    if current:
+        attended_cells = set(
+            db.query(Attendance.github_id, Attendance.attendance_date).filter(
+                Attendance.github_id.in_(current),
+                Attendance.attendance_date.in_(dates),
+                Attendance.is_attended == True
+            ).all()
+        )
+        for github_id in current:
+            days_by_user[github_id] = list(existing[github_id][1].ljust(total_days, ABSENT)[:total_days])
+        for github_id, d in cells:
+            if github_id in current:
+                days_by_user[github_id][(d - season_start).days] = (
+                    ATTENDED if (github_id, d) in attended_cells else ABSENT
+                )
+
+    _save_matrix_rows(db, days_by_user, season_start)
+    _refresh_daily_counts(db, dates)
+
+
+def rebuild_attendance_matrix(db: Session) -> Dict[str, int]:
+    """
+    모든 사용자의 출석 매트릭스와 날짜별 출석 인원을 attendances 테이블에서 다시 만듭니다.
+    처음 채우는 것은 마이그레이션(0011)이 하며, 시즌이 바뀌었거나 데이터를 보정한 뒤 실행합니다. 커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        Dict[str, int]: 다시 만든 사용자 수와 날짜 수
+    """
+    season_start, total_days = _get_season()
+    github_ids = {github_id for (github_id,) in db.query(User.github_id).all()}
+
+    db.query(AttendanceMatrix).delete(synchronize_session=False)
+    _save_matrix_rows(db, _build_days(db, github_ids, season_start, total_days), season_start)
+
+    dates = [season_start + timedelta(days=i) for i in range(total_days)]
+    _refresh_daily_counts(db, dates)
+
+    logger.info(f"출석 매트릭스 재생성 완료: 사용자 {len(github_ids)}명, {total_days}일")
+    return {"users": len(github_ids), "days": total_days}
+
+
+def load_attendance_array(db: Session, start: date, num_days: int, github_ids: Sequence[str]) -> Optional[np.ndarray]:
+    """
+    출석 매트릭스에서 start부터 num_days일 동안의 출석 여부를 (사용자 수, 일수) 불리언 배열로 읽습니다.
+    행 순서는 github_ids 순서를 따르며, 매트릭스 행이 없는 사용자는 모두 미출석입니다.
+
+    Args:
+        db: 데이터베이스 세션
+        start: 시작 날짜
+        num_days: 일수
+        github_ids: 배열 행 순서대로의 사용자 GitHub ID
+
+    Returns:
+        Optional[np.ndarray]: 출석 여부 배열.
+            범위가 시즌을 벗어나거나 매트릭스가 아직 만들어지지 않았으면 None
+    """
+    season_start, total_days = _get_season()
+    offset = (start - season_start).days
+    if offset < 0 or offset + num_days > total_days:
+        return None
+
+    rows = db.query(AttendanceMatrix.github_id, AttendanceMatrix.start_date, AttendanceMatrix.days).all()
+    if not rows or any(start_date != season_start for _, start_date, _ in rows):
+        return None
+
+    # 사용자별 출석 문자열을 이어 붙여 한 번에 배열로 변환
+    days_by_user = {github_id: days for github_id, _, days in rows}
+    joined = "".join(
+        days_by_user.get(github_id, "")[offset:offset + num_days].ljust(num_days, ABSENT) for github_id in github_ids
+    )
+    attended = np.frombuffer(joined.encode("ascii"), dtype=np.uint8) == ord(ATTENDED)
+    return attended.reshape(len(github_ids), num_days)
+
+
+def load_daily_attended_counts(db: Session, start: date, end: date) -> Dict[date, int]:
+    """
+    날짜별 출석 인원을 조회합니다.
+    참여를 그만둔 사용자의 참여 기간 밖 출석은 빼므로, 그날 참여 중이던 사용자 수(출석률 분모)와 기준이 같습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        start: 시작 날짜
+        end: 종료 날짜
+
+    Returns:
+        Dict[date, int]: 날짜별 출석 인원 (기록이 없는 날짜는 포함하지 않음)
+    """
+    counts = dict(
+        db.query(DailyAttendanceCount.attendance_date, DailyAttendanceCount.attended_count).filter(
+            DailyAttendanceCount.attendance_date >= start,
+            DailyAttendanceCount.attendance_date <= end
+        ).all()
+    )
+
+    # 비활성 사용자만 참여 기간이 제한되므로 이들의 출석만 확인 (ix_users_inactive_deactivated_at 부분 인덱스)
+    inactive_attendances = db.query(User.activated_at, User.deactivated_at, Attendance.attendance_date).join(
+        Attendance, Attendance.github_id == User.github_id
+    ).filter(
+        User.is_active == False,
+        Attendance.is_attended == True,
+        Attendance.attendance_date >= start,
+        Attendance.attendance_date <= end
+    ).all()
+    for activated_at, deactivated_at, attendance_date in inactive_attendances:
+        if attendance_date in counts and not in_window(attendance_date, get_active_window(False, activated_at, deactivated_at)):
+            counts[attendance_date] -= 1
+    return counts
+
+
+def load_commit_count_array(
+        db: Session,
+        start: date,
+        num_days: int,
+        github_ids: Sequence[str],
+        all_users: bool = False
+) -> np.ndarray:
+    """
+    attendances 테이블에 저장된 일별 커밋 수를 (사용자 수, 일수) 정수 배열로 읽습니다.
+    커밋이 있는 칸만 조회하고 나머지는 0으로 둡니다. 행 순서는 github_ids 순서를 따릅니다.
+
+    Args:
+        db: 데이터베이스 세션
+        start: 시작 날짜
+        num_days: 일수
+        github_ids: 배열 행 순서대로의 사용자 GitHub ID
+        all_users: github_ids가 전체 사용자 목록이면 True. 긴 IN 목록 대신 날짜 범위로만 조회하고 목록에 없는 행은 버립니다.
+
+    Returns:
+        np.ndarray: 일별 커밋 수 배열
+    """
+    counts = np.zeros((len(github_ids), num_days), dtype=np.int64)
+    if not github_ids or num_days <= 0:
+        return counts
+
+    end = start + timedelta(days=num_days - 1)
+    query = db.query(Attendance.github_id, Attendance.attendance_date, Attendance.commit_count).filter(
+        Attendance.attendance_date >= start,
+        Attendance.attendance_date <= end,
+        Attendance.commit_count > 0
+    )
+    if not all_users:
+        query = query.filter(Attendance.github_id.in_(github_ids))
+    rows = query.all()
+    if not rows:
+        return counts
+
+    row_index = {github_id: i for i, github_id in enumerate(github_ids)}
+    start_ordinal = start.toordinal()
+    users = np.fromiter((row_index.get(github_id, -1) for github_id, _, _ in rows), dtype=np.int64, count=len(rows))
+    days = np.fromiter((d.toordinal() - start_ordinal for _, d, _ in rows), dtype=np.int64, count=len(rows))
+    values = np.fromiter((count for _, _, count in rows), dtype=np.int64, count=len(rows))
+
+    known = users >= 0
+    counts[users[known], days[known]] = values[known]
+    return counts
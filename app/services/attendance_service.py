@@ -1,14 +1,23 @@
 import logging
-from datetime import datetime, date, timedelta
-from typing import List, Dict, Any, Optional
+from datetime import datetime, date, timedelta, timezone
+from typing import List, Dict, Any, Optional, Iterable, Set, Tuple
 
+from sqlalchemy import and_, case, event, literal, or_, select, true, union_all
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
 
 from app.config import config
 from app.models.attendance import Attendance
+from app.models.finalized_day import FinalizedDay
 from app.models.github_commit import GitHubCommit
 from app.models.user import User
-from app.services.github_service import fetch_and_save_commits, apply_date_filters
+from app.services.attendance_matrix_service import refresh_attendance_matrix
+from app.services.data_version_service import bump_data_version
+from app.services.github_service import fetch_and_save_commits, count_user_commits
+from app.services.participant_service import active_users_filter, participated_filter
+from app.services.streak_service import refresh_streaks
+from app.utils.cache_utils import TTLCache
+from app.utils.db_utils import upsert, get_dialect_insert
 from app.utils.error_utils import handle_service_error
 
 # 로깅 설정
@@ -18,25 +27,76 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 날짜별 출석 통계(get_daily_attendance_stats) 응답 캐시
+# 출석 기록이 바뀐 날짜는 on_attendance_changed에서, 사용자 변경 시에는 on_users_changed에서 표시해 두고
+# 트랜잭션이 커밋된 뒤 무효화합니다. 다른 프로세스(수집 워커 등)의 변경은 TTL이 지나면 반영됩니다.
+DAILY_STATS_CACHE_TTL_SECONDS = int((config.cache or {}).get("daily_stats_ttl_seconds", 300))
+daily_stats_cache = TTLCache(DAILY_STATS_CACHE_TTL_SECONDS, max_entries=1000)
+
+# 커밋되면 무효화할 날짜 (db.info 키). ALL_DAILY_STATS가 들어 있으면 캐시를 모두 버립니다.
+STALE_DAILY_STATS_KEY = "stale_daily_stats"
+ALL_DAILY_STATS = "all"
+
+
+class FinalizedDayError(ValueError):
+    """마감된 날짜의 출석 기록을 다시 열지 않고 바꾸려 할 때 발생합니다."""
+
+
+def get_finalized_day_set(db: Session, days: Iterable[date]) -> Set[date]:
+    """
+    주어진 날짜 중 마감된 날짜를 반환합니다. 마감된 날짜의 출석 기록은 다시 열기 경로로만 바꿉니다.
+
+    Args:
+        db: 데이터베이스 세션
+        days: 확인할 날짜 목록
+
+    Returns:
+        Set[date]: 마감된 날짜
+    """
+    days = set(days)
+    if not days:
+        return set()
+    return {d for (d,) in db.query(FinalizedDay.day).filter(FinalizedDay.day.in_(days)).all()}
+
+
+def mark_day_reopened(db: Session, day: date, now: Optional[datetime] = None) -> None:
+    """
+    마감된 날짜를 관리자가 다시 열어 고쳤다고 기록합니다.
+    마감 시각을 새로 찍어 그 날짜의 ETag를 바꾸고, 이후 응답은 매번 재검증하게 합니다. 커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        day: 다시 연 날짜 (KST)
+        now: 기준 시각 (None이면 현재 UTC 시각)
+    """
+    now = now or datetime.now(timezone.utc)
+    db.query(FinalizedDay).filter(FinalizedDay.day == day).update(
+        {FinalizedDay.finalized_at: now, FinalizedDay.reopened_at: now}, synchronize_session=False
+    )
+
 
 async def check_user_commit_and_save(
         github_id: str,
         check_date: date,
         github_api_token: str,
-        db: Session
+        db: Session,
+        force_refresh: bool = False
 ) -> Dict[str, Any]:
     """
     특정 사용자의 특정 날짜 출석을 확인하고 DB에 저장합니다.
-    GitHub API를 호출하여 커밋을 가져오고, 이를 DB에 저장한 후 출석 여부를 결정합니다.
+    GitHub API를 호출하여 커밋을 가져오고, 새로 저장된 커밋이 바꾼 출석 칸에만
+    커밋 수 변화량을 같은 트랜잭션으로 더합니다. 새 커밋이 없으면 출석 기록을 쓰지 않습니다.
+    최근에 같은 (사용자, 날짜)를 조회했다면 캐시된 조회 결과를 재사용합니다.
     
     Args:
         github_id: GitHub 사용자 ID
         check_date: 확인할 날짜
         github_api_token: GitHub API 토큰
         db: 데이터베이스 세션
+        force_refresh: True면 캐시를 무시하고 GitHub를 다시 호출
         
     Returns:
-        Dict: 처리 결과
+        Dict: 처리 결과 (cached, data_age_seconds, 갱신한 출석 칸 수 updated_cells 포함)
     """
     # 사용자 확인
     user = get_user_by_github_id(db, github_id)
@@ -46,14 +106,149 @@ async def check_user_commit_and_save(
 
     try:
         # GitHub API로 커밋을 가져와서 DB에 저장
-        fetch_result = await fetch_and_save_commits(db, github_id, check_date, github_api_token)
+        fetch_result = await fetch_and_save_commits(
+            db, github_id, check_date, github_api_token, use_cache=not force_refresh
+        )
         
-        # DB에 저장된 커밋을 기반으로 출석 정보 생성
-        return await create_attendance_from_db_commits(github_id, check_date, db)
+        # 새 커밋이 바꾼 출석 칸에만 변화량 반영
+        updated_cells = apply_attendance_deltas(db, fetch_result.get("changed_cells", {}))
+        db.commit()
+
+        attendance = db.query(Attendance.commit_count, Attendance.is_attended).filter(
+            Attendance.github_id == github_id,
+            Attendance.attendance_date == check_date
+        ).first()
+        commit_count, is_attended = attendance if attendance else (0, False)
+
+        return {
+            "status": "success",
+            "date": check_date.isoformat(),
+            "github_id": github_id,
+            "commit_count": commit_count,
+            "is_attended": is_attended,
+            "updated_cells": updated_cells,
+            "cached": fetch_result.get("cached", False),
+            "data_age_seconds": fetch_result.get("data_age_seconds", 0)
+        }
 
     except Exception as e:
+        # GitHub API 오류도 여기서 error로 반환되어 날짜 마감이 보류됨
         db.rollback()
-        return handle_service_error(e, f"{github_id} 사용자의 출석 확인")
+        return {**handle_service_error(e, f"{github_id} 사용자의 출석 확인"), "github_id": github_id}
+
+
+def on_attendance_changed(db: Session, cells: Iterable[Tuple[str, date]]) -> None:
+    """
+    출석 기록이 바뀐 (사용자, 날짜) 칸을 읽기 모델에 반영합니다.
+    attendances 테이블에 쓰는 모든 경로에서 커밋 전에 호출해 같은 트랜잭션으로 처리합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        cells: 변경된 (github_id, 날짜) 목록
+    """
+    cells = set(cells)
+    if not cells:
+        return
+    refresh_attendance_matrix(db, cells)
+    refresh_streaks(db, cells)
+    bump_data_version(db)
+    db.info.setdefault(STALE_DAILY_STATS_KEY, set()).update(d for _, d in cells)
+
+
+def on_users_changed(db: Session) -> None:
+    """
+    사용자가 추가, 삭제되거나 참여 상태가 바뀌었을 때 커밋 전에 호출합니다.
+    데이터 버전을 올리고, 커밋되면 전체 사용자 수가 들어 있는 날짜별 출석 통계 캐시를 모두 버립니다.
+
+    Args:
+        db: 데이터베이스 세션
+    """
+    bump_data_version(db)
+    db.info.setdefault(STALE_DAILY_STATS_KEY, set()).add(ALL_DAILY_STATS)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stale_daily_stats(session: Session) -> None:
+    """출석 기록이나 사용자를 바꾼 트랜잭션이 커밋되면 해당 날짜의 출석 통계 캐시를 버립니다."""
+    stale = session.info.pop(STALE_DAILY_STATS_KEY, ())
+    if ALL_DAILY_STATS in stale:
+        daily_stats_cache.clear()
+        return
+    for d in stale:
+        daily_stats_cache.invalidate(d)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_stale_daily_stats(session: Session) -> None:
+    """롤백된 트랜잭션의 무효화 표시는 버립니다."""
+    session.info.pop(STALE_DAILY_STATS_KEY, None)
+
+
+def apply_attendance_deltas(db: Session, deltas: Dict[Tuple[str, date], int]) -> int:
+    """
+    (github_id, 날짜)별 커밋 수 변화량을 출석 기록에 더합니다.
+    증가분은 INSERT ... ON CONFLICT 한 번으로, 감소분(커밋 날짜 변경)은 칸별 UPDATE로 반영합니다.
+    마감된 날짜의 칸은 반영하지 않습니다. (커밋은 저장되어 있으므로 다시 열면 반영됨) 커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        deltas: (github_id, 날짜)별 커밋 수 변화량
+
+    Returns:
+        int: 반영한 칸 수
+    """
+    finalized = get_finalized_day_set(db, (d for _, d in deltas))
+    if finalized:
+        logger.info(f"마감된 날짜의 출석 변화는 반영하지 않음: {', '.join(sorted(d.isoformat() for d in finalized))}")
+        deltas = {cell: delta for cell, delta in deltas.items() if cell[1] not in finalized}
+    if not deltas:
+        return 0
+
+    increments = [
+        {"github_id": github_id, "attendance_date": d, "commit_count": delta, "is_attended": True}
+        for (github_id, d), delta in sorted(deltas.items()) if delta > 0
+    ]
+    insert = get_dialect_insert(db)
+    if increments and insert is not None:
+        stmt = insert(Attendance).values(increments)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["github_id", "attendance_date"],
+            set_={
+                "commit_count": Attendance.commit_count + stmt.excluded.commit_count,
+                "is_attended": True,
+                "updated_at": func.now()
+            }
+        )
+        db.execute(stmt)
+        increments = []
+
+    for row in increments:
+        attendance = db.query(Attendance).filter(
+            Attendance.github_id == row["github_id"],
+            Attendance.attendance_date == row["attendance_date"]
+        ).first()
+        if attendance is None:
+            db.add(Attendance(**row))
+        else:
+            attendance.commit_count += row["commit_count"]
+            attendance.is_attended = True
+
+    for (github_id, d), delta in deltas.items():
+        if delta >= 0:
+            continue
+        new_count = Attendance.commit_count + delta
+        db.query(Attendance).filter(
+            Attendance.github_id == github_id,
+            Attendance.attendance_date == d
+        ).update({
+            Attendance.commit_count: case((new_count > 0, new_count), else_=0),
+            Attendance.is_attended: new_count > 0,
+            Attendance.updated_at: func.now()
+        }, synchronize_session=False)
+
+    db.flush()
+    on_attendance_changed(db, deltas.keys())
+    return len(deltas)
 
 
 def get_user_by_github_id(db: Session, github_id: str) -> Optional[User]:
@@ -91,13 +286,11 @@ async def create_attendance_from_db_commits(
         if not user:
             logger.warning(f"사용자를 찾을 수 없음: {github_id}")
             return {"status": "error", "message": f"사용자를 찾을 수 없음: {github_id}"}
+        if get_finalized_day_set(db, [check_date]):
+            raise FinalizedDayError(f"{check_date.isoformat()}는 마감된 날짜입니다.")
         
         # 해당 날짜에 사용자의 커밋 수 조회
-        query = db.query(GitHubCommit).filter(GitHubCommit.github_id == github_id)
-        query = apply_date_filters(query, check_date, check_date)
-        commits = query.all()
-        
-        commit_count = len(commits)
+        commit_count = count_user_commits(db, github_id, check_date, check_date)
         is_attended = commit_count > 0
         
         # 출석 기록 조회 또는 생성
@@ -121,6 +314,8 @@ async def create_attendance_from_db_commits(
             attendance.is_attended = is_attended
             attendance.updated_at = datetime.now()
 
+        db.flush()
+        on_attendance_changed(db, [(github_id, check_date)])
         db.commit()
 
         return {
@@ -138,7 +333,8 @@ async def create_attendance_from_db_commits(
 
 async def check_all_attendances(
         check_date: Optional[date] = None,
-        db: Session = None
+        db: Session = None,
+        force_refresh: bool = False
 ) -> Dict[str, Any]:
     """
     모든 사용자의 특정 날짜 출석을 확인하고 DB에 저장합니다.
@@ -146,6 +342,7 @@ async def check_all_attendances(
     Args:
         check_date: 확인할 날짜 (None이면 오늘)
         db: 데이터베이스 세션
+        force_refresh: True면 조회 캐시를 무시하고 모든 사용자를 GitHub에서 다시 조회
         
     Returns:
         Dict: 처리 결과
@@ -174,7 +371,8 @@ async def check_all_attendances(
         return {"status": "error", "message": "GitHub API 토큰이 설정되지 않았습니다."}
 
     results = []
-    users = db.query(User).all()
+    # 참여를 그만둔 사용자는 GitHub에서 조회하지 않음
+    users = db.query(User).filter(active_users_filter()).all()
 
     for user in users:
         # 사용자별 토큰이 있으면 그것을 사용
@@ -185,7 +383,8 @@ async def check_all_attendances(
             github_id=str(user.github_id),
             check_date=check_date,
             github_api_token=github_api_token,
-            db=db
+            db=db,
+            force_refresh=force_refresh
         )
 
         results.append(result)
@@ -236,9 +435,294 @@ async def get_user_attendance_history(
     return results
 
 
+def upsert_attendances(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    출석 행들을 uix_github_id_attendance_date 제약조건 기준으로 한 번에 저장합니다.
+    커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        rows: github_id, attendance_date, commit_count, is_attended를 담은 행 목록
+    """
+    upsert(
+        db,
+        Attendance,
+        rows,
+        index_elements=["github_id", "attendance_date"],
+        update_columns=["commit_count", "is_attended"],
+        constraint="uix_github_id_attendance_date"
+    )
+
+
+def _participant_ids(start_date: date, end_date: date):
+    """기간 중 하루라도 참여한 사용자의 github_id 서브쿼리입니다. 재계산과 대사가 같은 사용자 범위를 씁니다."""
+    return select(User.github_id).where(participated_filter(start_date, end_date))
+
+
+def _open_day(column, include_finalized: bool):
+    """마감된 날짜를 제외하는 조건입니다. include_finalized면 모든 날짜를 포함합니다."""
+    return true() if include_finalized else column.not_in(select(FinalizedDay.day))
+
+
+def derive_attendance_rows(
+        db: Session,
+        start_date: date,
+        end_date: date,
+        include_finalized: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    DB에 저장된 커밋으로 기간 내 출석 행을 계산합니다.
+    find_attendance_mismatches와 같은 기준으로, 기간 중 참여한 사용자의 커밋이 있는 칸과
+    커밋이 없는데 출석 행에 커밋 수나 출석이 남아 있는 칸(0으로 되돌릴 칸)만 만듭니다.
+    커밋이 없고 출석 행도 없는 칸은 만들지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        include_finalized: 마감된 날짜도 포함할지 여부 (기본값은 제외)
+
+    Returns:
+        List[Dict]: github_id, attendance_date, commit_count, is_attended를 담은 행 목록 (날짜, 사용자 순)
+    """
+    user_ids = _participant_ids(start_date, end_date)
+    counts = {
+        (github_id, d): commit_count
+        for github_id, d, commit_count in db.query(
+            GitHubCommit.github_id,
+            GitHubCommit.commit_date_kst,
+            func.count(GitHubCommit.id)
+        ).filter(
+            GitHubCommit.commit_date_kst >= start_date,
+            GitHubCommit.commit_date_kst <= end_date,
+            GitHubCommit.github_id.in_(user_ids),
+            _open_day(GitHubCommit.commit_date_kst, include_finalized)
+        ).group_by(GitHubCommit.github_id, GitHubCommit.commit_date_kst).all()
+    }
+    leftovers = db.query(Attendance.github_id, Attendance.attendance_date).filter(
+        Attendance.attendance_date >= start_date,
+        Attendance.attendance_date <= end_date,
+        Attendance.github_id.in_(user_ids),
+        _open_day(Attendance.attendance_date, include_finalized),
+        or_(Attendance.commit_count != 0, Attendance.is_attended == True)
+    ).all()
+    for cell in leftovers:
+        counts.setdefault(tuple(cell), 0)
+
+    return [
+        {
+            "github_id": github_id,
+            "attendance_date": d,
+            "commit_count": commit_count,
+            "is_attended": commit_count > 0
+        }
+        for (github_id, d), commit_count in sorted(counts.items(), key=lambda item: (item[0][1], item[0][0]))
+    ]
+
+
+def recompute_attendance_range(db: Session, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+    """
+    기간 내 출석 기록을 커밋 내역으로 다시 계산해 달라진 칸만 한 번의 upsert로 저장합니다.
+    달라진 칸은 find_attendance_mismatches로 찾으므로 대사(reconcile)와 결과가 같고,
+    읽기 모델 갱신(on_attendance_changed)도 달라진 칸에만 합니다.
+    마감된 날짜는 건너뜁니다. (관리자 다시 열기 경로로만 고침) 커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+
+    Returns:
+        List[Dict]: 고친 행 목록 (find_attendance_mismatches와 같은 형식)
+    """
+    mismatches = find_attendance_mismatches(db, start_date, end_date)
+    repair_attendance_mismatches(db, mismatches)
+    return mismatches
+
+
+def diff_attendance_rows(db: Session, rows: List[Dict[str, Any]], start_date: date, end_date: date) -> List[Dict[str, Any]]:
+    """
+    계산된 출석 행과 attendances 테이블의 현재 값을 비교합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        rows: derive_attendance_rows의 결과
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+
+    Returns:
+        List[Dict]: 차이가 있는 행 목록 (현재 값은 stored_commit_count, stored_is_attended. 행이 없으면 None)
+    """
+    stored = {
+        (github_id, attendance_date): (commit_count, is_attended)
+        for github_id, attendance_date, commit_count, is_attended in db.query(
+            Attendance.github_id,
+            Attendance.attendance_date,
+            Attendance.commit_count,
+            Attendance.is_attended
+        ).filter(
+            Attendance.attendance_date >= start_date,
+            Attendance.attendance_date <= end_date
+        ).all()
+    }
+
+    diffs = []
+    for row in rows:
+        stored_commit_count, stored_is_attended = stored.get((row["github_id"], row["attendance_date"]), (None, None))
+        if stored_commit_count != row["commit_count"] or stored_is_attended != row["is_attended"]:
+            diffs.append({
+                **row,
+                "stored_commit_count": stored_commit_count,
+                "stored_is_attended": stored_is_attended
+            })
+    return diffs
+
+
+def find_attendance_mismatches(
+        db: Session,
+        start_date: date,
+        end_date: date,
+        include_finalized: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    github_commits에서 계산한 (사용자, 날짜)별 커밋 수와 attendances를 SQL 한 번으로 비교합니다.
+    커밋이 있는데 출석 행이 없거나 값이 다른 칸과, 커밋이 없는데 출석 행에 커밋 수나 출석이 남아 있는 칸을
+    두 anti-join의 UNION ALL로 찾습니다. 커밋이 없고 출석 행도 없는 칸은 일치로 봅니다.
+    마감된 날짜는 바꿀 수 없으므로 기본적으로 비교하지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        start_date: 시작 날짜
+        end_date: 종료 날짜
+        include_finalized: 마감된 날짜도 비교할지 여부 (관리자 다시 열기에서 사용)
+
+    Returns:
+        List[Dict]: 차이가 있는 행 목록 (diff_attendance_rows와 같은 형식, 날짜와 사용자 순)
+    """
+    user_ids = _participant_ids(start_date, end_date)
+    derived = select(
+        GitHubCommit.github_id.label("github_id"),
+        GitHubCommit.commit_date_kst.label("attendance_date"),
+        func.count(GitHubCommit.id).label("commit_count")
+    ).where(
+        GitHubCommit.commit_date_kst >= start_date,
+        GitHubCommit.commit_date_kst <= end_date,
+        GitHubCommit.github_id.in_(user_ids),
+        _open_day(GitHubCommit.commit_date_kst, include_finalized)
+    ).group_by(GitHubCommit.github_id, GitHubCommit.commit_date_kst).cte("derived")
+    stored = select(
+        Attendance.github_id,
+        Attendance.attendance_date,
+        Attendance.commit_count,
+        Attendance.is_attended
+    ).where(
+        Attendance.attendance_date >= start_date,
+        Attendance.attendance_date <= end_date,
+        Attendance.github_id.in_(user_ids),
+        _open_day(Attendance.attendance_date, include_finalized)
+    ).cte("stored")
+
+    same_cell = and_(
+        stored.c.github_id == derived.c.github_id,
+        stored.c.attendance_date == derived.c.attendance_date
+    )
+    stored_count = func.coalesce(stored.c.commit_count, 0)
+
+    # 커밋은 있는데 출석 행이 없거나 커밋 수/출석 여부가 다른 칸
+    derived_side = select(
+        derived.c.github_id,
+        derived.c.attendance_date,
+        derived.c.commit_count,
+        stored.c.commit_count.label("stored_commit_count"),
+        stored.c.is_attended.label("stored_is_attended")
+    ).select_from(derived.outerjoin(stored, same_cell)).where(or_(
+        stored.c.github_id.is_(None),
+        stored_count != derived.c.commit_count,
+        stored.c.is_attended.is_not(True)
+    ))
+    # 커밋이 없는데 출석 행에 커밋 수나 출석이 남아 있는 칸
+    stored_side = select(
+        stored.c.github_id,
+        stored.c.attendance_date,
+        literal(0).label("commit_count"),
+        stored.c.commit_count.label("stored_commit_count"),
+        stored.c.is_attended.label("stored_is_attended")
+    ).select_from(stored.outerjoin(derived, same_cell)).where(
+        derived.c.github_id.is_(None),
+        or_(stored_count != 0, stored.c.is_attended.is_(True))
+    )
+
+    mismatches = union_all(derived_side, stored_side).subquery()
+    query = select(mismatches).order_by(mismatches.c.attendance_date, mismatches.c.github_id)
+    return [
+        {
+            "github_id": github_id,
+            "attendance_date": attendance_date,
+            "commit_count": commit_count,
+            "is_attended": commit_count > 0,
+            "stored_commit_count": stored_commit_count,
+            "stored_is_attended": stored_is_attended
+        }
+        for github_id, attendance_date, commit_count, stored_commit_count, stored_is_attended in db.execute(query).all()
+    ]
+
+
+def repair_attendance_mismatches(db: Session, mismatches: List[Dict[str, Any]]) -> int:
+    """
+    find_attendance_mismatches가 찾은 칸을 커밋 내역 기준 값으로 한 번의 upsert로 고칩니다. 커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        mismatches: find_attendance_mismatches의 결과
+
+    Returns:
+        int: 고친 행 수
+    """
+    rows = [
+        {
+            "github_id": row["github_id"],
+            "attendance_date": row["attendance_date"],
+            "commit_count": row["commit_count"],
+            "is_attended": row["is_attended"]
+        }
+        for row in mismatches
+    ]
+    upsert_attendances(db, rows)
+    on_attendance_changed(db, [(row["github_id"], row["attendance_date"]) for row in rows])
+    return len(rows)
+
+
+def recompute_attendance_for_date(db: Session, check_date: date) -> List[Dict[str, Any]]:
+    """
+    DB에 저장된 커밋으로 특정 날짜의 출석 기록을 다시 계산합니다.
+    사용자별 커밋 수를 KST 하루에 대한 GROUP BY 한 번으로 구하고,
+    현재 기록과 다른 칸만 한 번의 upsert로 저장합니다. 커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        check_date: 계산할 날짜
+
+    Returns:
+        List[Dict]: 커밋이 있거나 0으로 되돌린 사용자별 처리 결과 (create_attendance_from_db_commits와 같은 형식)
+    """
+    rows = derive_attendance_rows(db, check_date, check_date)
+    repair_attendance_mismatches(db, diff_attendance_rows(db, rows, check_date, check_date))
+    return [
+        {
+            "status": "success",
+            "date": check_date.isoformat(),
+            "github_id": row["github_id"],
+            "commit_count": row["commit_count"],
+            "is_attended": row["is_attended"]
+        }
+        for row in rows
+    ]
+
+
 async def create_attendance_from_commits(db: Session, check_date: Optional[date] = None) -> Dict[str, Any]:
     """
     DB에 저장된 GitHub 커밋 내역을 기반으로 모든 사용자의 출석 기록을 생성합니다.
+    사용자 수와 관계없이 집계 쿼리 1회와 upsert 1회로 처리합니다.
     
     Args:
         db: 데이터베이스 세션
@@ -265,16 +749,12 @@ async def create_attendance_from_commits(db: Session, check_date: Optional[date]
                 "project_completed": True
             }
     
-    # 모든 사용자 가져오기
-    users = db.query(User).all()
-    results = []
-    
-    for user in users:
-        github_id = user.github_id
-        
-        # DB에 저장된 커밋을 기반으로 출석 정보 생성
-        result = await create_attendance_from_db_commits(github_id, check_date, db)
-        results.append(result)
+    try:
+        results = recompute_attendance_for_date(db, check_date)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        return handle_service_error(e, f"{check_date.isoformat()} 커밋 기반 출석 일괄 계산")
     
     return {
         "status": "success",
@@ -285,6 +765,8 @@ async def create_attendance_from_commits(db: Session, check_date: Optional[date]
 async def get_daily_attendance_stats(check_date: date, db: Session) -> Dict[str, Any]:
     """
     특정 날짜의 출석 통계를 조회합니다.
+    출석자 수와 관계없이 쿼리 두 번(전체 사용자 수, 출석자 JOIN 조회)으로 계산하며,
+    결과는 날짜별로 캐시하고 해당 날짜의 출석 기록이 바뀌면 무효화합니다.
     
     Args:
         check_date: 조회할 날짜
@@ -293,37 +775,35 @@ async def get_daily_attendance_stats(check_date: date, db: Session) -> Dict[str,
     Returns:
         Dict: 출석 통계
     """
-    # 전체 사용자 수
-    total_users = db.query(User).count()
-
-    # 출석한 사용자 수
-    present_count = db.query(Attendance).filter(
-        Attendance.attendance_date == check_date,
-        Attendance.is_attended == True
-    ).count()
+    cached = daily_stats_cache.get(check_date)
+    if cached is not None:
+        return cached[0]
+
+    # 그날 참여 중이던 사용자 수
+    total_users = db.query(func.count(User.id)).filter(participated_filter(check_date, check_date)).scalar()
+
+    # 출석한 사용자 정보 (그날 참여 중이던 사용자만, 분모와 같은 기준)
+    present_users = [
+        {"github_id": github_id, "commit_count": commit_count}
+        for github_id, commit_count in db.query(Attendance.github_id, Attendance.commit_count).join(
+            User, User.github_id == Attendance.github_id
+        ).filter(
+            Attendance.attendance_date == check_date,
+            Attendance.is_attended == True,
+            participated_filter(check_date, check_date)
+        ).order_by(Attendance.id).all()
+    ]
+    present_count = len(present_users)
 
     # 출석률
     attendance_rate = (present_count / total_users * 100) if total_users > 0 else 0
 
-    # 출석한 사용자 정보
-    attendances = db.query(Attendance).filter(
-        Attendance.attendance_date == check_date,
-        Attendance.is_attended == True
-    ).all()
-
-    present_users = []
-    for attendance in attendances:
-        user = get_user_by_github_id(db, attendance.github_id)
-        if user:
-            present_users.append({
-                "github_id": user.github_id,
-                "commit_count": attendance.commit_count,
-            })
-
-    return {
+    stats = {
         "date": check_date.isoformat(),
         "total_users": total_users,
         "present_count": present_count,
         "attendance_rate": attendance_rate,
         "present_users": present_users
     }
+    daily_stats_cache.set(check_date, stats)
+    return stats
@@ -0,0 +1,135 @@
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import case, insert as sql_insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.models.commit_hourly_rollup import CommitHourlyRollup
+from app.models.github_commit import GitHubCommit
+from app.utils.db_utils import get_dialect_insert
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+HOURS_PER_DAY = 24
+
+
+def apply_hourly_commit_deltas(db: Session, deltas: Dict[Tuple[str, date, int], int]) -> None:
+    """
+    (github_id, KST 날짜, KST 시)별 커밋 수 변화량을 시간대별 커밋 집계에 더합니다.
+    증가분은 INSERT ... ON CONFLICT 한 번으로, 감소분(커밋 시각 변경)은 칸별 UPDATE로 반영합니다.
+    커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        deltas: (github_id, KST 날짜, KST 시)별 커밋 수 변화량
+    """
+    if not deltas:
+        return
+
+    increments = [
+        {"github_id": github_id, "commit_date_kst": d, "commit_hour_kst": hour, "commit_count": delta}
+        for (github_id, d, hour), delta in sorted(deltas.items()) if delta > 0
+    ]
+    insert = get_dialect_insert(db)
+    if increments and insert is not None:
+        stmt = insert(CommitHourlyRollup).values(increments)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["commit_date_kst", "commit_hour_kst", "github_id"],
+            set_={
+                "commit_count": CommitHourlyRollup.commit_count + stmt.excluded.commit_count,
+                "updated_at": func.now()
+            }
+        )
+        db.execute(stmt)
+        increments = []
+
+    for row in increments:
+        rollup = db.query(CommitHourlyRollup).filter(
+            CommitHourlyRollup.commit_date_kst == row["commit_date_kst"],
+            CommitHourlyRollup.commit_hour_kst == row["commit_hour_kst"],
+            CommitHourlyRollup.github_id == row["github_id"]
+        ).first()
+        if rollup is None:
+            db.add(CommitHourlyRollup(**row))
+        else:
+            rollup.commit_count += row["commit_count"]
+
+    for (github_id, d, hour), delta in deltas.items():
+        if delta >= 0:
+            continue
+        new_count = CommitHourlyRollup.commit_count + delta
+        db.query(CommitHourlyRollup).filter(
+            CommitHourlyRollup.commit_date_kst == d,
+            CommitHourlyRollup.commit_hour_kst == hour,
+            CommitHourlyRollup.github_id == github_id
+        ).update({
+            CommitHourlyRollup.commit_count: case((new_count > 0, new_count), else_=0),
+            CommitHourlyRollup.updated_at: func.now()
+        }, synchronize_session=False)
+
+    db.flush()
+
+
+def get_hourly_commit_counts(
+        db: Session,
+        start: date,
+        end: date,
+        github_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    기간 중 KST 시간대별 커밋 수를 시간대별 커밋 집계에서 조회합니다.
+    커밋을 한 건씩 읽는 대신 (날짜, 시, 사용자)별로 미리 센 행만 합산합니다.
+    사용자를 지정하면 최대 24 × 일수 행입니다.
+
+    Args:
+        db: 데이터베이스 세션
+        start: 시작 날짜 (KST)
+        end: 종료 날짜 (KST)
+        github_id: 특정 사용자의 분포만 조회할 때의 GitHub ID (None이면 전체)
+
+    Returns:
+        List[Dict]: 0시부터 23시까지의 {"hour", "count"} 목록 (커밋이 없는 시간대는 0)
+    """
+    query = db.query(
+        CommitHourlyRollup.commit_hour_kst,
+        func.sum(CommitHourlyRollup.commit_count)
+    ).filter(
+        CommitHourlyRollup.commit_date_kst >= start,
+        CommitHourlyRollup.commit_date_kst <= end
+    )
+    if github_id is not None:
+        query = query.filter(CommitHourlyRollup.github_id == github_id)
+
+    counts = [0] * HOURS_PER_DAY
+    for hour, count in query.group_by(CommitHourlyRollup.commit_hour_kst).all():
+        counts[hour] = int(count or 0)
+    return [{"hour": hour, "count": count} for hour, count in enumerate(counts)]
+
+
+def rebuild_commit_hourly_rollups(db: Session) -> int:
+    """
+    시간대별 커밋 집계를 github_commits 테이블에서 다시 만듭니다. 커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        int: 다시 만든 집계 행 수
+    """
+    db.query(CommitHourlyRollup).delete(synchronize_session=False)
+    derived = select(
+        GitHubCommit.commit_date_kst,
+        GitHubCommit.commit_hour_kst,
+        GitHubCommit.github_id,
+        func.count(GitHubCommit.id)
+    ).group_by(GitHubCommit.commit_date_kst, GitHubCommit.commit_hour_kst, GitHubCommit.github_id)
+    db.execute(sql_insert(CommitHourlyRollup).from_select(
+        ["commit_date_kst", "commit_hour_kst", "github_id", "commit_count"], derived
+    ))
+
+    count = db.query(func.count(CommitHourlyRollup.id)).scalar()
+    logger.info(f"시간대별 커밋 집계 재생성 완료: {count}행")
+    return count
@@ -0,0 +1,86 @@
+import logging
+import time
+from typing import Dict, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.config import config
+from app.models.data_version import DataVersion
+from app.utils.db_utils import get_dialect_insert
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 출석 기록과 사용자 목록이 바뀔 때 올라가는 카운터
+ATTENDANCE_DATA = "attendance"
+
+# 다른 프로세스(수집 워커, 재계산 CLI 등)가 올린 버전을 확인하는 간격 (초)
+# 이 프로세스에서 올린 버전은 커밋 직후 바로 반영됩니다.
+DATA_VERSION_CHECK_SECONDS = float((config.cache or {}).get("data_version_check_seconds", 5))
+
+# 카운터 이름별 (확인 시각, 버전)
+_known_versions: Dict[str, Tuple[float, int]] = {}
+
+
+def bump_data_version(db: Session, name: str = ATTENDANCE_DATA) -> None:
+    """
+    데이터 버전을 1 올립니다. 데이터를 바꾼 트랜잭션 안에서 호출하며, 커밋은 호출자가 합니다.
+    커밋되면 이 프로세스의 버전 캐시를 버려 다음 조회부터 새 버전을 읽습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        name: 카운터 이름
+    """
+    insert = get_dialect_insert(db)
+    if insert is not None:
+        stmt = insert(DataVersion).values(name=name, version=1)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={"version": DataVersion.version + 1, "updated_at": func.now()}
+        ))
+    else:
+        updated = db.query(DataVersion).filter(DataVersion.name == name).update(
+            {DataVersion.version: DataVersion.version + 1}, synchronize_session=False
+        )
+        if not updated:
+            db.add(DataVersion(name=name, version=1))
+            db.flush()
+
+    db.info.setdefault("bumped_data_versions", set()).add(name)
+
+
+def get_data_version(db: Session, name: str = ATTENDANCE_DATA) -> int:
+    """
+    현재 데이터 버전을 반환합니다.
+    마지막으로 DB에서 읽은 지 DATA_VERSION_CHECK_SECONDS가 지나지 않았으면 DB를 읽지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        name: 카운터 이름
+
+    Returns:
+        int: 데이터 버전 (카운터가 아직 없으면 0)
+    """
+    known = _known_versions.get(name)
+    now = time.monotonic()
+    if known is not None and now - known[0] < DATA_VERSION_CHECK_SECONDS:
+        return known[1]
+
+    version = db.query(DataVersion.version).filter(DataVersion.name == name).scalar() or 0
+    _known_versions[name] = (now, version)
+    return version
+
+
+def forget_data_versions() -> None:
+    """이 프로세스의 버전 캐시를 모두 버립니다."""
+    _known_versions.clear()
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_bumped_versions(session: Session) -> None:
+    """버전을 올린 트랜잭션이 커밋되면 해당 카운터의 캐시를 버립니다."""
+    for name in session.info.pop("bumped_data_versions", ()):
+        _known_versions.pop(name, None)
+
@@ -0,0 +1,178 @@
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import config
+from app.models.finalized_day import FinalizedDay
+from app.services.attendance_service import (
+    check_all_attendances,
+    find_attendance_mismatches,
+    mark_day_reopened,
+    repair_attendance_mismatches,
+)
+from app.utils.date_utils import KST_OFFSET, get_project_period
+from app.utils.error_utils import handle_service_error
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# KST 자정이 지나고 이 시간(분)이 더 지나야 전날을 마감합니다.
+# 자정 직전 커밋이 GitHub 이벤트 API에 늦게 나타나는 경우를 기다리기 위한 유예 시간입니다.
+DAY_CLOSE_GRACE_MINUTES = int((config.ingestion or {}).get("day_close_grace_minutes", 60))
+# 마감 작업이 한 번에 확인하는 최근 날짜 수 (스케줄러가 멈춰 있던 동안 놓친 날짜 포함)
+DAY_CLOSE_LOOKBACK_DAYS = int((config.ingestion or {}).get("day_close_lookback_days", 3))
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def day_close_time(day: date) -> datetime:
+    """
+    날짜를 마감할 수 있는 시각(UTC)을 반환합니다. (다음 날 KST 자정 + 유예 시간)
+
+    Args:
+        day: 마감할 날짜 (KST)
+
+    Returns:
+        datetime: 마감 가능 시각 (UTC, timezone 포함)
+    """
+    next_midnight_kst = datetime.combine(day + timedelta(days=1), time.min)
+    return (next_midnight_kst - KST_OFFSET + timedelta(minutes=DAY_CLOSE_GRACE_MINUTES)).replace(tzinfo=timezone.utc)
+
+
+def latest_closable_day(now: Optional[datetime] = None) -> date:
+    """
+    지금 마감할 수 있는 가장 최근 날짜를 반환합니다.
+
+    Args:
+        now: 기준 시각 (None이면 현재 UTC 시각)
+
+    Returns:
+        date: 마감 가능한 가장 최근 날짜 (KST)
+    """
+    now = now or _utcnow()
+    if now.tzinfo is not None:
+        now = now.astimezone(timezone.utc).replace(tzinfo=None)
+    return (now + KST_OFFSET - timedelta(minutes=DAY_CLOSE_GRACE_MINUTES)).date() - timedelta(days=1)
+
+
+def get_finalized_days(db: Session, days: Optional[Iterable[date]] = None) -> Dict[date, datetime]:
+    """
+    마감된 날짜와 마감 시각을 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        days: 조회할 날짜 목록 (None이면 전체)
+
+    Returns:
+        Dict[date, datetime]: 날짜별 마감 시각
+    """
+    query = db.query(FinalizedDay.day, FinalizedDay.finalized_at)
+    if days is not None:
+        query = query.filter(FinalizedDay.day.in_(set(days)))
+    return dict(query.all())
+
+
+def get_finalized_at(db: Session, day: date) -> Optional[datetime]:
+    """날짜가 마감되었으면 마감 시각을, 아니면 None을 반환합니다."""
+    return get_finalized_days(db, [day]).get(day)
+
+
+def get_finalized_day(db: Session, day: date) -> Optional[FinalizedDay]:
+    """날짜가 마감되었으면 마감 기록(마감 시각, 다시 연 시각)을, 아니면 None을 반환합니다."""
+    return db.query(FinalizedDay).filter(FinalizedDay.day == day).first()
+
+
+async def close_day(db: Session, day: date, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    날짜를 마감합니다.
+    조회 캐시를 무시하고 모든 사용자의 커밋을 마지막으로 한 번 더 가져와 반영한 뒤 마감 기록을 남깁니다.
+    한 사용자라도 수집에 실패하면 마감하지 않고 다음 실행에서 다시 시도합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        day: 마감할 날짜 (KST)
+        now: 기준 시각 (None이면 현재 UTC 시각)
+
+    Returns:
+        Dict: 처리 결과 (finalized: 이번에 마감했는지 여부)
+    """
+    now = now or _utcnow()
+    if get_finalized_at(db, day) is not None:
+        return {"status": "info", "message": f"{day.isoformat()}는 이미 마감되었습니다.", "date": day.isoformat(), "finalized": False}
+    if day > latest_closable_day(now):
+        return {"status": "info", "message": f"{day.isoformat()}는 아직 마감할 수 없습니다.", "date": day.isoformat(), "finalized": False}
+
+    try:
+        result = await check_all_attendances(day, db, force_refresh=True)
+        failed = [r.get("github_id") for r in result.get("results", []) if r.get("status") == "error"]
+        if result.get("status") == "error" or failed:
+            logger.warning(f"{day.isoformat()} 마감 보류: {result.get('message') or f'수집 실패 사용자 {len(failed)}명'}")
+            return {
+                "status": "error",
+                "message": result.get("message") or f"수집에 실패한 사용자가 있어 마감하지 않았습니다: {', '.join(map(str, failed))}",
+                "date": day.isoformat(),
+                "finalized": False
+            }
+
+        db.add(FinalizedDay(day=day, finalized_at=now))
+        db.commit()
+        logger.info(f"{day.isoformat()} 마감 완료")
+        return {"status": "success", "date": day.isoformat(), "finalized": True}
+    except Exception as e:
+        db.rollback()
+        return handle_service_error(e, f"{day.isoformat()} 마감")
+
+
+async def close_pending_days(db: Session, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    마감할 수 있는데 아직 마감되지 않은 최근 날짜(DAY_CLOSE_LOOKBACK_DAYS일, 시즌 안)를 오래된 순서로 마감합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        now: 기준 시각 (None이면 현재 UTC 시각)
+
+    Returns:
+        List[Dict]: 날짜별 마감 결과
+    """
+    latest = latest_closable_day(now)
+    season_start, season_end = get_project_period()
+    days = [
+        d for d in (latest - timedelta(days=i) for i in reversed(range(DAY_CLOSE_LOOKBACK_DAYS)))
+        if season_start <= d <= season_end
+    ]
+    finalized = get_finalized_days(db, days)
+    return [await close_day(db, d, now) for d in days if d not in finalized]
+
+
+def reopen_day(db: Session, day: date, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    마감된 날짜를 다시 열어 저장된 커밋 내역 기준으로 출석 기록을 고칩니다. (관리자 전용)
+    마감 이후 도착한 커밋은 github_commits에만 저장되어 있으므로 이 경로로 반영합니다.
+    고친 칸이 있으면 마감 시각을 새로 찍고 다시 연 날짜로 기록해 응답을 매번 재검증하게 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        day: 다시 열 날짜 (KST)
+        now: 기준 시각 (None이면 현재 UTC 시각)
+
+    Returns:
+        Dict: 처리 결과 (reopened: 출석 기록을 고쳤는지 여부, mismatches: 고친 칸 수)
+    """
+    if get_finalized_at(db, day) is None:
+        return {"status": "info", "message": f"{day.isoformat()}는 마감되지 않은 날짜입니다.", "date": day.isoformat(), "reopened": False}
+
+    try:
+        mismatches = find_attendance_mismatches(db, day, day, include_finalized=True)
+        if mismatches:
+            repair_attendance_mismatches(db, mismatches)
+            mark_day_reopened(db, day, now or _utcnow())
+            db.commit()
+        logger.info(f"{day.isoformat()} 다시 열기: {len(mismatches)}칸 수정")
+        return {"status": "success", "date": day.isoformat(), "reopened": bool(mismatches), "mismatches": len(mismatches)}
+    except Exception as e:
+        db.rollback()
+        return handle_service_error(e, f"{day.isoformat()} 다시 열기")
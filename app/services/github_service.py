@@ -1,18 +1,38 @@
 import logging
-from datetime import datetime, date
-from typing import Optional, List, Dict, Any
+from collections import defaultdict
+from datetime import datetime, date, timezone
+from itertools import groupby
+from operator import itemgetter
+from typing import Optional, List, Dict, Any, Tuple
 
 import httpx
+from sqlalchemy import and_, event, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, Query
 from sqlalchemy.sql import func
 
 from app.config import config
 from app.models.github_commit import GitHubCommit
-from app.utils.date_utils import get_kst_datetime_range
+from app.models.github_commit_key import GitHubCommitKey
+from app.services.commit_rollup_service import apply_hourly_commit_deltas
+from app.utils.cache_utils import TTLCache
+from app.utils.date_utils import get_kst_datetime_range, to_kst_datetime
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# (github_id, 날짜)별 GitHub 커밋 조회 결과 캐시
+# 스케줄러, 수동 체크 API, 관리자 갱신이 같은 프로세스에서 공유합니다.
+FETCH_CACHE_TTL_SECONDS = int((config.ingestion or {}).get("fetch_cache_ttl_seconds", 300))
+commit_fetch_cache = TTLCache(FETCH_CACHE_TTL_SECONDS)
+
+# 조회 결과를 저장한 트랜잭션이 커밋될 때까지 캐시에 넣지 않고 세션에 보관하는 키
+PENDING_FETCH_CACHE_KEY = "pending_commit_fetch_cache"
+
+
+class GitHubAPIError(Exception):
+    """GitHub API 호출이 실패했을 때 (rate limit, 5xx 등). 커밋이 없는 것과 구분합니다."""
+
 
 def apply_date_filters(
     query: Query, 
@@ -30,13 +50,14 @@ def apply_date_filters(
     Returns:
         Query: 필터가 적용된 쿼리 객체
     """
+    # 같은 범위의 KST 날짜 조건은 PostgreSQL이 기간 밖의 시즌 파티션을 제외할 수 있게 함
     if from_date:
         start_datetime, _ = get_kst_datetime_range(from_date)
-        query = query.filter(GitHubCommit.commit_date >= start_datetime)
+        query = query.filter(GitHubCommit.commit_date >= start_datetime, GitHubCommit.commit_date_kst >= from_date)
     
     if to_date:
         _, end_datetime = get_kst_datetime_range(to_date)
-        query = query.filter(GitHubCommit.commit_date <= end_datetime)
+        query = query.filter(GitHubCommit.commit_date <= end_datetime, GitHubCommit.commit_date_kst <= to_date)
         
     return query
 
@@ -74,6 +95,70 @@ async def get_user_commits(
         .all()
 
 
+def count_user_commits(
+    db: Session,
+    github_id: str,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> int:
+    """
+    특정 사용자의 커밋 수를 COUNT 집계로 조회합니다.
+    github_id 동등 조건과 commit_date 범위 조건만 사용하므로
+    (github_id, commit_date) 인덱스로 행을 읽지 않고 셀 수 있습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        github_id: GitHub 사용자 ID
+        from_date: 시작 날짜
+        to_date: 종료 날짜
+
+    Returns:
+        int: 커밋 수
+    """
+    query = db.query(func.count(GitHubCommit.id)).filter(GitHubCommit.github_id == github_id)
+    query = apply_date_filters(query, from_date, to_date)
+    return query.scalar() or 0
+
+
+def get_user_commit_details(
+    db: Session,
+    github_id: str,
+    check_date: date,
+    public_only: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    특정 사용자의 특정 날짜(KST) 커밋 상세 정보를 필요한 컬럼만 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        github_id: GitHub 사용자 ID
+        check_date: 조회할 날짜
+        public_only: True면 공개 저장소 커밋만 조회
+
+    Returns:
+        List[Dict[str, Any]]: 커밋 상세 목록 (commit_id, repository, commit_date, message)
+    """
+    query = db.query(
+        GitHubCommit.commit_id,
+        GitHubCommit.repository,
+        GitHubCommit.commit_date,
+        GitHubCommit.message
+    ).filter(GitHubCommit.github_id == github_id)
+    query = apply_date_filters(query, check_date, check_date)
+    if public_only:
+        query = query.filter(GitHubCommit.is_private == False)
+
+    return [
+        {
+            "commit_id": commit_id,
+            "repository": repository,
+            "commit_date": commit_date.isoformat(),
+            "message": message
+        }
+        for commit_id, repository, commit_date, message in query.order_by(GitHubCommit.commit_date).all()
+    ]
+
+
 async def get_user_commits_stats(
     db: Session, 
     github_id: str,
@@ -92,28 +177,17 @@ async def get_user_commits_stats(
     Returns:
         Dict: 커밋 통계 정보 (총 커밋 수, 저장소 수, 가장 최근 커밋 날짜)
     """
-    # 쿼리 생성
-    query = db.query(GitHubCommit).filter(GitHubCommit.github_id == github_id)
+    # 총 커밋 수, 저장소 수(중복 제거), 가장 최근 커밋 날짜를 집계 쿼리 한 번으로 조회
+    query = db.query(
+        func.count(GitHubCommit.id),
+        func.count(func.distinct(GitHubCommit.repository)),
+        func.max(GitHubCommit.commit_date)
+    ).filter(GitHubCommit.github_id == github_id)
     
     # 날짜 범위 필터 적용
     query = apply_date_filters(query, from_date, to_date)
     
-    # 총 커밋 수 조회
-    total_commits = query.count()
-    
-    # 저장소 수 조회 (중복 제거)
-    repos_query = db.query(GitHubCommit.repository).filter(GitHubCommit.github_id == github_id)
-    repos_query = apply_date_filters(repos_query, from_date, to_date)
-    
-    repositories = repos_query.distinct().all()
-    total_repos = len(repositories)
-    
-    # 가장 최근 커밋 날짜 조회
-    latest_commit = query.order_by(GitHubCommit.commit_date.desc()).first()
-    
-    latest_commit_date = None
-    if latest_commit:
-        latest_commit_date = latest_commit.commit_date
+    total_commits, total_repos, latest_commit_date = query.one()
     
     return {
         "total_commits": total_commits,
@@ -134,6 +208,9 @@ async def get_github_commits(github_id: str, check_date: date, api_token: str) -
     
     Returns:
         List[Dict[str, Any]]: 커밋 목록
+
+    Raises:
+        GitHubAPIError: GitHub API가 200이 아닌 응답을 반환한 경우
     """
     date_str = check_date.isoformat()
     url = f"https://api.github.com/search/commits?q=author:{github_id}+committer-date:{date_str}"
@@ -156,12 +233,19 @@ async def get_github_commits(github_id: str, check_date: date, api_token: str) -
             return data.get("items", [])
         else:
             logger.error(f"GitHub API 오류: {response.status_code}, {response.text}")
-            return []
+            raise GitHubAPIError(f"GitHub API 오류: {github_id} {date_str} (HTTP {response.status_code})")
 
 
-async def save_github_commits(db: Session, commits: List[Dict[str, Any]], github_id: str) -> int:
+async def save_github_commits(
+    db: Session,
+    commits: List[Dict[str, Any]],
+    github_id: str
+) -> Tuple[int, Dict[Tuple[str, date], int]]:
     """
     GitHub API에서 가져온 커밋 내역을 데이터베이스에 저장합니다.
+    커밋마다 savepoint를 사용해 잘못된 커밋 하나가 나머지 저장을 막지 않으며,
+    시간대별 커밋 집계도 같은 트랜잭션에서 갱신합니다. 트랜잭션 커밋은 호출자가 합니다.
+    같은 커밋은 github_commit_keys의 유니크 제약조건으로 동시에 수집해도 한 번만 저장합니다.
     
     Args:
         db: 데이터베이스 세션
@@ -169,9 +253,12 @@ async def save_github_commits(db: Session, commits: List[Dict[str, Any]], github
         github_id: GitHub 사용자 ID
     
     Returns:
-        int: 성공적으로 저장된 커밋 수
+        Tuple[int, Dict]: (성공적으로 저장된 커밋 수,
+            새로 추가되거나 날짜가 바뀐 커밋으로 인한 (github_id, KST 날짜)별 커밋 수 변화량)
     """
     saved_count = 0
+    changed_cells = defaultdict(int)
+    changed_hours = defaultdict(int)
     
     for commit_data in commits:
         try:
@@ -185,93 +272,162 @@ async def save_github_commits(db: Session, commits: List[Dict[str, Any]], github
             # 저장소가 private인지 확인
             is_private = commit_data.get("repository", {}).get("private", False)
             
-            # 커밋 날짜 파싱
+            # 커밋 날짜 파싱 (저장은 UTC 기준)
             commit_date_str = commit_node.get("committer", {}).get("date", "")
-            commit_date = datetime.fromisoformat(commit_date_str.replace("Z", "+00:00"))
-            
-            # 데이터베이스에 저장할 객체 생성
-            db_commit = GitHubCommit(
-                github_id=github_id,
-                commit_id=commit_id,
-                repository=repository,
-                message=message,
-                commit_url=commit_url,
-                commit_date=commit_date,
-                is_private=is_private
-            )
-            
-            # 중복 체크: commit_id와 repository로 기존 커밋 레코드가 있는지 확인
-            existing_commit = db.query(GitHubCommit).filter(
-                GitHubCommit.commit_id == commit_id, 
-                GitHubCommit.repository == repository
-            ).first()
+            commit_date = datetime.fromisoformat(commit_date_str.replace("Z", "+00:00")).astimezone(timezone.utc)
+            commit_datetime_kst = to_kst_datetime(commit_date)
             
-            if existing_commit:
-                # 기존 레코드 업데이트
-                existing_commit.repository = repository
-                existing_commit.message = message
-                existing_commit.commit_url = commit_url
-                existing_commit.commit_date = commit_date
-                existing_commit.is_private = is_private
-                existing_commit.updated_at = func.now()
-                logger.info(f"기존 커밋 업데이트: {commit_id} in {repository}")
-            else:
-                # 새 레코드 추가
-                db.add(db_commit)
+            cell_deltas = []
+            hour_deltas = []
+            with db.begin_nested():
+                # 중복 체크: commit_id와 repository로 기존 커밋 레코드가 있는지 확인
+                existing_commit = db.query(GitHubCommit).filter(
+                    GitHubCommit.commit_id == commit_id, 
+                    GitHubCommit.repository == repository
+                ).first()
                 
-            db.commit()
+                if existing_commit:
+                    # 커밋 날짜가 다른 KST 날짜로 바뀐 경우에만 출석 칸이 바뀜
+                    old_cell = (existing_commit.github_id, existing_commit.commit_date_kst)
+                    new_cell = (existing_commit.github_id, commit_datetime_kst.date())
+                    if old_cell != new_cell:
+                        cell_deltas = [(old_cell, -1), (new_cell, 1)]
+                    old_hour = old_cell + (existing_commit.commit_hour_kst,)
+                    new_hour = new_cell + (commit_datetime_kst.hour,)
+                    if old_hour != new_hour:
+                        hour_deltas = [(old_hour, -1), (new_hour, 1)]
+
+                    # 기존 레코드 업데이트
+                    existing_commit.repository = repository
+                    existing_commit.message = message
+                    existing_commit.commit_url = commit_url
+                    existing_commit.commit_date = commit_date
+                    existing_commit.commit_date_kst = commit_datetime_kst.date()
+                    existing_commit.commit_hour_kst = commit_datetime_kst.hour
+                    existing_commit.is_private = is_private
+                    existing_commit.updated_at = func.now()
+                    logger.info(f"기존 커밋 업데이트: {commit_id} in {repository}")
+                else:
+                    # 새 레코드 추가. 키를 먼저 저장해 같은 커밋을 동시에 저장하는 다른 수집은 유니크 제약조건에서 막힘
+                    # (github_commits의 유니크 제약조건에는 파티션 키가 들어가 있어 날짜가 다르면 막지 못함)
+                    db.add(GitHubCommitKey(commit_id=commit_id, repository=repository))
+                    db.flush()
+                    db.add(GitHubCommit(
+                        github_id=github_id,
+                        commit_id=commit_id,
+                        repository=repository,
+                        message=message,
+                        commit_url=commit_url,
+                        commit_date=commit_date,
+                        commit_date_kst=commit_datetime_kst.date(),
+                        commit_hour_kst=commit_datetime_kst.hour,
+                        is_private=is_private
+                    ))
+                    cell_deltas = [((github_id, commit_datetime_kst.date()), 1)]
+                    hour_deltas = [((github_id, commit_datetime_kst.date(), commit_datetime_kst.hour), 1)]
+            
             saved_count += 1
+            for cell, delta in cell_deltas:
+                changed_cells[cell] += delta
+            for hour, delta in hour_deltas:
+                changed_hours[hour] += delta
             
+        except IntegrityError:
+            # 다른 수집이 같은 커밋을 먼저 저장함 (savepoint만 롤백됨)
+            logger.info(f"이미 저장된 커밋: {commit_id} in {repository}")
+            continue
         except Exception as e:
-            # 기타 오류 처리
-            db.rollback()
+            # 기타 오류 처리 (savepoint만 롤백됨)
             logger.error(f"커밋 저장 중 오류: {str(e)}")
             continue
     
-    return saved_count
+    apply_hourly_commit_deltas(db, {hour: delta for hour, delta in changed_hours.items() if delta})
+    return saved_count, {cell: delta for cell, delta in changed_cells.items() if delta}
 
 
-async def fetch_and_save_commits(db: Session, github_id: str, check_date: date, api_token: str = None) -> Dict[str, Any]:
+async def fetch_and_save_commits(
+    db: Session,
+    github_id: str,
+    check_date: date,
+    api_token: str = None,
+    use_cache: bool = True
+) -> Dict[str, Any]:
     """
-    특정 사용자의 GitHub 커밋을 조회하고 데이터베이스에 저장합니다.
+    특정 사용자의 GitHub 커밋을 조회하고 데이터베이스에 저장합니다. 커밋은 호출자가 합니다.
+    FETCH_CACHE_TTL_SECONDS 안에 같은 (사용자, 날짜)를 조회한 적이 있으면
+    GitHub 호출과 저장을 생략하고 이전 결과를 반환합니다.
+    조회 결과는 저장한 트랜잭션이 커밋된 뒤에만 캐시하며, GitHub API 오류는 캐시하지 않습니다.
     
     Args:
         db: 데이터베이스 세션
         github_id: GitHub 사용자 ID
         check_date: 조회할 날짜
         api_token: GitHub API 토큰 (선택적)
+        use_cache: 조회 결과 캐시 사용 여부 (False면 항상 GitHub를 호출)
     
     Returns:
-        Dict[str, Any]: 결과 정보 (총 커밋 수, 저장된 커밋 수)
+        Dict[str, Any]: 결과 정보 (총 커밋 수, 저장된 커밋 수, 캐시 사용 여부, 데이터 경과 시간(초),
+            이번 저장으로 바뀐 (github_id, KST 날짜)별 커밋 수 변화량 changed_cells)
+
+    Raises:
+        GitHubAPIError: GitHub API 호출이 실패한 경우
     """
+    cache_key = (github_id, check_date)
+    if use_cache:
+        cached = commit_fetch_cache.get(cache_key)
+        if cached is not None:
+            result, age = cached
+            return {**result, "cached": True, "data_age_seconds": round(age, 1), "changed_cells": {}}
+
     # GitHub API에서 커밋 데이터 조회
     commits = await get_github_commits(github_id, check_date, api_token)
     
+    changed_cells = {}
+
     # 조회된 커밋이 없는 경우
     if not commits:
-        return {
+        result = {
             "github_id": github_id,
             "date": check_date.isoformat(),
             "total_commits": 0,
             "saved_commits": 0,
             "status": "no_commits"
         }
-    
-    # 커밋 데이터 저장
-    saved_count = await save_github_commits(db, commits, github_id)
-    
-    return {
-        "github_id": github_id,
-        "date": check_date.isoformat(),
-        "total_commits": len(commits),
-        "saved_commits": saved_count,
-        "status": "success"
-    }
+    else:
+        # 커밋 데이터 저장
+        saved_count, changed_cells = await save_github_commits(db, commits, github_id)
+
+        result = {
+            "github_id": github_id,
+            "date": check_date.isoformat(),
+            "total_commits": len(commits),
+            "saved_commits": saved_count,
+            "status": "success"
+        }
+
+    db.info.setdefault(PENDING_FETCH_CACHE_KEY, {})[cache_key] = result
+    return {**result, "cached": False, "data_age_seconds": 0, "changed_cells": changed_cells}
     
     
+@event.listens_for(Session, "after_commit")
+def _cache_committed_fetches(session: Session) -> None:
+    """조회 결과를 저장한 트랜잭션이 커밋되면 조회 결과를 캐시에 넣습니다."""
+    for cache_key, result in session.info.pop(PENDING_FETCH_CACHE_KEY, {}).items():
+        commit_fetch_cache.set(cache_key, result)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_fetches(session: Session) -> None:
+    """롤백된 트랜잭션의 조회 결과는 캐시하지 않습니다."""
+    session.info.pop(PENDING_FETCH_CACHE_KEY, None)
+
+
 async def get_all_users_attendance_stats(db: Session, start_date: str, end_date: str) -> List[Dict[str, Any]]:
     """
     모든 사용자의 출석 통계 정보를 조회합니다.
+    사용자와 기간 내 출석 기록을 (github_id, 날짜) 순으로 한 번에 조회하고,
+    사용자별로 묶어 한 번 순회하며 계산합니다.
+    참여를 그만둔 사용자는 참여 기간이 기간과 겹칠 때만, 참여 기간 안의 날짜로만 계산합니다.
     
     Args:
         db: 데이터베이스 세션
@@ -279,32 +435,66 @@ async def get_all_users_attendance_stats(db: Session, start_date: str, end_date:
         end_date: 종료 날짜 (YYYY-MM-DD 형식)
         
     Returns:
-        List[Dict[str, Any]]: 사용자별 출석 통계 목록
+        List[Dict[str, Any]]: 사용자별 출석 통계 목록 (github_id 순)
     """
     from app.models.user import User
     from app.models.attendance import Attendance
+    from app.services.participant_service import get_active_window, in_window, participated_filter
     
-    # 모든 사용자 조회
-    users = db.query(User).all()
+    start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+
+    # 기간 중 참여한 사용자와 기간 내 출석 기록 (출석 기록이 없는 사용자는 attendance_date가 NULL인 행 하나)
+    rows = db.execute(
+        select(
+            User.github_id,
+            User.is_active,
+            User.activated_at,
+            User.deactivated_at,
+            Attendance.attendance_date,
+            Attendance.commit_count,
+            Attendance.is_attended
+        ).outerjoin(
+            Attendance,
+            and_(
+                Attendance.github_id == User.github_id,
+                Attendance.attendance_date >= start_date,
+                Attendance.attendance_date <= end_date
+            )
+        ).where(
+            participated_filter(start, end)
+        ).order_by(User.github_id, Attendance.attendance_date).execution_options(yield_per=1000)
+    ).tuples()
     
     # 결과를 저장할 리스트
     results = []
     
-    for user in users:
-        github_id = user.github_id
-        
-        # 해당 사용자의 출석 데이터 조회
-        attendances = db.query(Attendance).filter(
-            Attendance.github_id == github_id,
-            Attendance.attendance_date >= start_date,
-            Attendance.attendance_date <= end_date
-        ).order_by(Attendance.attendance_date).all()
+    for github_id, user_rows in groupby(rows, key=itemgetter(0)):
+        window = None
+        attended_days = 0
+        total_commits = 0
+        attendance_by_date = {}
+        for _, is_active, activated_at, deactivated_at, attendance_date, commit_count, is_attended in user_rows:
+            if window is None:
+                window = get_active_window(is_active, activated_at, deactivated_at)
+            if attendance_date is None or not in_window(attendance_date, window):
+                continue
+            attended_days += 1 if is_attended else 0
+            total_commits += commit_count
+            # 날짜별 출석 정보
+            attendance_by_date[attendance_date.isoformat()] = {
+                "commit_count": commit_count,
+                "is_attended": is_attended
+            }
+
+        # 출석 기록은 커밋이 있는 날짜에만 생기므로 참여 기간과 겹치는 일수를 기준으로 출석률을 계산
+        first, last = window
+        total_days = (min(end, last or end) - max(start, first or start)).days + 1
         
         # 출석 데이터가 없으면 기본 정보만 포함
-        if not attendances:
+        if not attendance_by_date:
             results.append({
                 "github_id": github_id,
-                "total_days": 0,
+                "total_days": total_days,
                 "attended_days": 0,
                 "attendance_rate": 0,
                 "total_commits": 0,
@@ -312,27 +502,12 @@ async def get_all_users_attendance_stats(db: Session, start_date: str, end_date:
             })
             continue
         
-        # 통계 계산
-        total_days = len(attendances)
-        attended_days = sum(1 for a in attendances if a.is_attended)
-        total_commits = sum(a.commit_count for a in attendances)
-        attendance_rate = round(attended_days / total_days * 100, 1) if total_days > 0 else 0
-        
-        # 날짜별 출석 정보
-        attendance_by_date = {}
-        for a in attendances:
-            date_str = a.attendance_date.isoformat()
-            attendance_by_date[date_str] = {
-                "commit_count": a.commit_count,
-                "is_attended": a.is_attended
-            }
-        
         # 결과에 추가
         results.append({
             "github_id": github_id,
             "total_days": total_days,
             "attended_days": attended_days,
-            "attendance_rate": attendance_rate,
+            "attendance_rate": round(attended_days / total_days * 100, 1) if total_days > 0 else 0,
             "total_commits": total_commits,
             "attendance_by_date": attendance_by_date
         })
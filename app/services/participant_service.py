@@ -0,0 +1,96 @@
+import logging
+from datetime import date, datetime, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+from app.utils.date_utils import get_kst_datetime_range, to_kst_date
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 참여 기간 (KST 시작일, KST 종료일). None이면 그쪽으로 제한 없음
+ActiveWindow = Tuple[Optional[date], Optional[date]]
+
+
+def active_users_filter():
+    """참여 중인 사용자 조건 (ix_users_active_github_id 부분 인덱스 사용)"""
+    return User.is_active == True
+
+
+def participated_filter(start_date: date, end_date: date):
+    """
+    기간 중 하루라도 참여한 사용자 조건입니다.
+    참여 중인 사용자는 항상 포함하고, 비활성 사용자는 참여 기간이 기간과 겹칠 때만 포함합니다.
+
+    Args:
+        start_date: 시작 날짜 (KST)
+        end_date: 종료 날짜 (KST)
+    """
+    range_start, _ = get_kst_datetime_range(start_date)
+    _, range_end = get_kst_datetime_range(end_date)
+    return or_(
+        User.is_active == True,
+        and_(
+            User.deactivated_at >= range_start,
+            or_(User.activated_at.is_(None), User.activated_at <= range_end)
+        )
+    )
+
+
+def get_active_window(is_active: bool, activated_at: Optional[datetime], deactivated_at: Optional[datetime]) -> ActiveWindow:
+    """
+    통계에 포함할 사용자의 참여 기간을 KST 날짜로 반환합니다.
+    참여 중인 사용자는 기간 제한이 없고, 비활성 사용자는 참여 시작일부터 종료일까지입니다.
+
+    Args:
+        is_active: 참여 중 여부
+        activated_at: 참여 시작 시각
+        deactivated_at: 참여 종료 시각
+
+    Returns:
+        ActiveWindow: (시작일, 종료일). 제한이 없는 쪽은 None
+    """
+    if is_active or deactivated_at is None:
+        return None, None
+    return (to_kst_date(activated_at) if activated_at else None), to_kst_date(deactivated_at)
+
+
+def in_window(d: date, window: ActiveWindow) -> bool:
+    """날짜가 참여 기간 안인지 확인합니다."""
+    first, last = window
+    return (first is None or d >= first) and (last is None or d <= last)
+
+
+def set_user_active(db: Session, user: User, is_active: bool, now: Optional[datetime] = None) -> bool:
+    """
+    사용자의 참여 상태를 바꿉니다.
+    비활성화하면 deactivated_at을 기록합니다. 사용자마다 참여 기간은 (activated_at, deactivated_at) 하나뿐이어서
+    다시 활성화하면 이전 참여 기간이 통계에서 사라지므로, 참여를 그만둔 사용자의 재활성화는 거부합니다.
+    커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        user: 사용자
+        is_active: 바꿀 상태
+        now: 기준 시각 (None이면 현재 UTC 시각)
+
+    Returns:
+        bool: 상태가 바뀌었으면 True (이미 같은 상태면 False)
+
+    Raises:
+        ValueError: 참여를 그만둔 사용자를 다시 활성화하려는 경우
+    """
+    if user.is_active == is_active:
+        return False
+    if is_active:
+        raise ValueError(f"참여를 그만둔 사용자는 다시 활성화할 수 없습니다: {user.github_id}")
+
+    user.is_active = False
+    user.deactivated_at = now or datetime.now(timezone.utc)
+    db.flush()
+
+    logger.info(f"사용자 참여 상태 변경: {user.github_id} is_active={is_active}")
+    return True
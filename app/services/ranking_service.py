@@ -0,0 +1,124 @@
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Float, Integer, and_, case, cast, func, literal, select
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance
+from app.models.user import User
+from app.services.participant_service import get_active_window, participated_filter
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def _inactive_user_bounds(db: Session, start: date, end: date) -> Dict[str, Tuple[date, date, int]]:
+    """
+    기간 중 참여를 그만둔 사용자별로 출석을 집계할 (시작일, 종료일, 일수)를 계산합니다.
+    비활성 사용자만 조회하므로 ix_users_inactive_deactivated_at 부분 인덱스를 사용합니다.
+    """
+    rows = db.query(User.github_id, User.activated_at, User.deactivated_at).filter(
+        User.is_active == False,
+        participated_filter(start, end)
+    ).all()
+
+    bounds = {}
+    for github_id, activated_at, deactivated_at in rows:
+        window_start, window_end = get_active_window(False, activated_at, deactivated_at)
+        first = max(start, window_start) if window_start else start
+        last = min(end, window_end) if window_end else end
+        bounds[github_id] = (first, last, max((last - first).days + 1, 0))
+    return bounds
+
+
+def _rounded_rate(attended, total_days):
+    """
+    출석률을 정수로 반올림하는 SQL 식입니다.
+    출석 통계(파이썬 round(attended / total_days * 100))와 같은 값이 되도록 같은 부동소수점 식을 계산하고,
+    소수부가 정확히 0.5일 때는 짝수 쪽으로 반올림합니다. 일수가 0이면 0입니다.
+    """
+    rate = cast(attended, Float) / cast(func.nullif(total_days, 0), Float) * 100
+    floor = func.floor(rate)
+    return cast(case(
+        (total_days == 0, 0),
+        (rate - floor > 0.5, floor + 1),
+        (rate - floor < 0.5, floor),
+        # 0.5: floor가 짝수면 floor, 홀수면 floor + 1
+        else_=func.floor(rate * 0.5 + 0.25) * 2
+    ), Integer)
+
+
+def get_ranking(
+        db: Session,
+        start: date,
+        end: date,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        dense: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    출석률 순위를 SQL 집계와 윈도 함수(RANK 또는 DENSE_RANK)로 조회합니다.
+    출석률이 같으면 같은 순위이며, 같은 순위 안에서는 github_id 순으로 정렬합니다.
+    참여를 그만둔 사용자는 참여 기간 안의 날짜만으로 출석률을 계산합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        start: 시작 날짜
+        end: 종료 날짜
+        limit: 최대 반환 개수 (None이면 전체)
+        offset: 건너뛸 개수
+        dense: True면 DENSE_RANK(1, 2, 2, 3), False면 RANK(1, 2, 2, 4)
+
+    Returns:
+        List[Dict]: 순위순 github_id, attendance_rate, attended_count, total_days, rank
+    """
+    num_days = max((end - start).days + 1, 0)
+    bounds = _inactive_user_bounds(db, start, end)
+
+    # 비활성 사용자만 사용자별 집계 기간이 다르므로 CASE로 전달
+    if bounds:
+        first_day = case({gid: b[0] for gid, b in bounds.items()}, value=User.github_id, else_=start)
+        last_day = case({gid: b[1] for gid, b in bounds.items()}, value=User.github_id, else_=end)
+        total_days = case({gid: b[2] for gid, b in bounds.items()}, value=User.github_id, else_=num_days)
+    else:
+        first_day, last_day, total_days = literal(start), literal(end), literal(num_days)
+
+    counts = select(
+        User.github_id.label("github_id"),
+        func.count(Attendance.id).label("attended_count"),
+        total_days.label("total_days")
+    ).outerjoin(
+        Attendance,
+        and_(
+            Attendance.github_id == User.github_id,
+            Attendance.is_attended == True,
+            # 상수 범위는 PostgreSQL이 계획 단계에서 기간 밖의 시즌 파티션을 제외할 수 있게 함
+            Attendance.attendance_date >= start,
+            Attendance.attendance_date <= end,
+            Attendance.attendance_date >= first_day,
+            Attendance.attendance_date <= last_day
+        )
+    ).where(
+        participated_filter(start, end)
+    ).group_by(User.github_id).subquery()
+
+    rates = select(
+        counts.c.github_id,
+        _rounded_rate(counts.c.attended_count, counts.c.total_days).label("attendance_rate"),
+        counts.c.attended_count,
+        counts.c.total_days
+    ).subquery()
+
+    rank_function = func.dense_rank if dense else func.rank
+    query = select(
+        rates.c.github_id,
+        rates.c.attendance_rate,
+        rates.c.attended_count,
+        rates.c.total_days,
+        rank_function().over(order_by=rates.c.attendance_rate.desc()).label("rank")
+    ).order_by(rates.c.attendance_rate.desc(), rates.c.github_id).offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+
+    return [dict(row._mapping) for row in db.execute(query)]
@@ -0,0 +1,122 @@
+import logging
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.season import Season
+from app.utils.date_utils import get_project_period, get_project_season_name
+from app.utils.db_utils import get_dialect_name
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# PostgreSQL에서 시즌 기간별로 파티션을 나누는 테이블과 파티션 키 (KST 날짜)
+# 시즌에 속하지 않는 날짜의 행은 {테이블}_default 파티션에 저장됩니다.
+PARTITIONED_TABLES = {
+    "github_commits": "commit_date_kst",
+    "attendances": "attendance_date",
+}
+
+
+def get_season_period(db: Session, name: str) -> Optional[Tuple[date, date]]:
+    """
+    시즌 이름으로 시즌 기간을 조회합니다.
+    seasons 테이블에 없더라도 설정 파일의 현재 시즌 이름이면 설정의 기간을 반환합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        name: 시즌 이름
+
+    Returns:
+        Optional[Tuple[date, date]]: (시작일, 종료일) 또는 None (없는 시즌)
+    """
+    season = db.query(Season).filter(Season.name == name).first()
+    if season is not None:
+        return season.start_date, season.end_date
+    if name == get_project_season_name():
+        return get_project_period()
+    return None
+
+
+def list_seasons(db: Session) -> List[Season]:
+    """모든 시즌을 시작일 순으로 조회합니다."""
+    return db.query(Season).order_by(Season.start_date).all()
+
+
+def season_partition_name(table: str, season: Season) -> str:
+    """시즌의 파티션 테이블 이름을 반환합니다. (e.g. attendances_season_1)"""
+    return f"{table}_season_{season.id}"
+
+
+def create_season(db: Session, name: str, start_date: date, end_date: date) -> Season:
+    """
+    시즌을 추가하고 PostgreSQL이면 시즌 기간의 파티션을 만듭니다. 커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        name: 시즌 이름
+        start_date: 시즌 시작일 (KST)
+        end_date: 시즌 종료일 (KST, 포함)
+
+    Returns:
+        Season: 추가한 시즌
+
+    Raises:
+        ValueError: 기간이 잘못되었거나 이름 또는 기간이 기존 시즌과 겹치는 경우
+    """
+    if end_date < start_date:
+        raise ValueError("시즌 종료일이 시작일보다 빠릅니다.")
+    if db.query(Season.id).filter(Season.name == name).first():
+        raise ValueError(f"이미 있는 시즌 이름입니다: {name}")
+    # 파티션 범위는 겹칠 수 없음
+    overlapping = db.query(Season).filter(Season.start_date <= end_date, Season.end_date >= start_date).first()
+    if overlapping is not None:
+        raise ValueError(f"기간이 시즌 {overlapping.name}과 겹칩니다.")
+
+    season = Season(name=name, start_date=start_date, end_date=end_date)
+    db.add(season)
+    db.flush()
+    ensure_season_partitions(db, season)
+    return season
+
+
+def ensure_season_partitions(db: Session, season: Season) -> List[str]:
+    """
+    PostgreSQL에서 시즌 기간의 github_commits, attendances 파티션을 만듭니다. 커밋은 호출자가 합니다.
+    기본 파티션에 이미 들어 있던 시즌 기간의 행은 새 파티션으로 옮긴 뒤 붙입니다.
+    PostgreSQL이 아니거나 테이블이 파티션 테이블이 아니면 아무것도 하지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        season: 시즌
+
+    Returns:
+        List[str]: 새로 만든 파티션 이름
+    """
+    if get_dialect_name(db) != "postgresql":
+        return []
+
+    # 범위 파티션의 상한은 포함하지 않으므로 종료일 다음 날
+    start, end = season.start_date.isoformat(), (season.end_date + timedelta(days=1)).isoformat()
+    created = []
+    for table, key in PARTITIONED_TABLES.items():
+        is_partitioned = db.execute(
+            text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"), {"table": table}
+        ).first()
+        partition = season_partition_name(table, season)
+        if not is_partitioned or db.execute(text("SELECT to_regclass(:name)"), {"name": partition}).scalar():
+            continue
+
+        db.execute(text(f"CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS)"))
+        db.execute(text(
+            f"WITH moved AS (DELETE FROM {table}_default WHERE {key} >= :start AND {key} < :end RETURNING *) "
+            f"INSERT INTO {partition} SELECT * FROM moved"
+        ), {"start": season.start_date, "end": season.end_date + timedelta(days=1)})
+        db.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {partition} FOR VALUES FROM ('{start}') TO ('{end}')"))
+        created.append(partition)
+
+    if created:
+        logger.info(f"시즌 {season.name} 파티션 생성: {', '.join(created)}")
+    return created
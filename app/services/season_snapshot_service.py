@@ -0,0 +1,108 @@
+import gzip
+import json
+import logging
+import os
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import config
+from app.utils.date_utils import get_project_period, kst_today
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 시즌이 끝난 뒤 통계 API가 DB 대신 읽는 스냅샷 파일 (gzip JSON)
+SEASON_SNAPSHOT_PATH = (config.cache or {}).get("season_snapshot_path", "data/season_snapshot.json.gz")
+
+# 스냅샷 파일 경로별 (수정 시각, 내용). 파일이 바뀌면 다시 읽음
+_loaded: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def is_season_over(today: Optional[date] = None) -> bool:
+    """
+    시즌(프로젝트 기간)이 끝났는지 확인합니다.
+
+    Args:
+        today: 기준 날짜 (None이면 KST 오늘)
+
+    Returns:
+        bool: 시즌 종료일이 지났으면 True
+    """
+    _, season_end = get_project_period()
+    return (today or kst_today()) > season_end
+
+
+def save_snapshot(snapshot: Dict[str, Any], path: Optional[str] = None) -> str:
+    """
+    시즌 스냅샷을 gzip JSON 파일로 저장합니다. 임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 완전한 파일을 봅니다.
+
+    Args:
+        snapshot: 스냅샷 내용
+        path: 저장 경로 (None이면 SEASON_SNAPSHOT_PATH)
+
+    Returns:
+        str: 저장한 경로
+    """
+    path = path or SEASON_SNAPSHOT_PATH
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"), default=str)
+    os.replace(tmp_path, path)
+    _loaded.pop(path, None)
+    return path
+
+
+def load_snapshot(path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    현재 시즌의 스냅샷을 반환합니다.
+    파일이 없거나, 설정의 시즌과 기간이 다르면 None을 반환합니다.
+
+    Args:
+        path: 스냅샷 경로 (None이면 SEASON_SNAPSHOT_PATH)
+
+    Returns:
+        Optional[Dict]: 스냅샷 내용 또는 None
+    """
+    path = path or SEASON_SNAPSHOT_PATH
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
+
+    cached = _loaded.get(path)
+    if cached is None or cached[0] != mtime:
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                cached = (mtime, json.load(f))
+        except (OSError, ValueError) as e:
+            logger.error(f"시즌 스냅샷을 읽을 수 없습니다: {path} {e}")
+            return None
+        _loaded[path] = cached
+
+    snapshot = cached[1]
+    season_start, season_end = get_project_period()
+    if snapshot.get("start_date") != season_start.isoformat() or snapshot.get("end_date") != season_end.isoformat():
+        return None
+    return snapshot
+
+
+def get_snapshot_user(github_id: str) -> Optional[Dict[str, Any]]:
+    """스냅샷에서 사용자별 데이터(출석 기록, 커밋 통계, 일별 커밋 수)를 반환합니다. 없으면 None."""
+    snapshot = load_snapshot()
+    if snapshot is None:
+        return None
+    return snapshot["users"].get(github_id)
+
+
+def new_snapshot(season_start: date, season_end: date) -> Dict[str, Any]:
+    """스냅샷의 기본 구조를 만듭니다."""
+    return {
+        "start_date": season_start.isoformat(),
+        "end_date": season_end.isoformat(),
+        "frozen_at": datetime.now(timezone.utc).isoformat(),
+        "users": {}
+    }
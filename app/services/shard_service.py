@@ -0,0 +1,292 @@
+import logging
+import zlib
+from datetime import datetime, date, timedelta, timezone
+from typing import List, Dict, Any, Optional
+
+from sqlalchemy import update, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import config
+from app.models.ingestion_shard_lease import IngestionShardLease
+from app.models.user import User
+from app.services.attendance_service import check_user_commit_and_save
+from app.services.participant_service import active_users_filter
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_NUM_SHARDS = 8
+DEFAULT_LEASE_SECONDS = 300
+
+
+def get_ingestion_settings() -> Dict[str, int]:
+    """
+    분산 수집 설정을 반환합니다. 설정 파일에 값이 없으면 기본값을 사용합니다.
+
+    Returns:
+        Dict[str, int]: num_shards, lease_seconds
+    """
+    ingestion_config = config.ingestion or {}
+    return {
+        "num_shards": int(ingestion_config.get("num_shards", DEFAULT_NUM_SHARDS)),
+        "lease_seconds": int(ingestion_config.get("lease_seconds", DEFAULT_LEASE_SECONDS)),
+    }
+
+
+def get_shard_id(github_id: str, num_shards: int) -> int:
+    """
+    GitHub ID를 샤드 번호로 변환합니다.
+    프로세스와 머신이 달라도 같은 결과가 나오도록 crc32를 사용합니다.
+
+    Args:
+        github_id: GitHub 사용자 ID
+        num_shards: 전체 샤드 수
+
+    Returns:
+        int: 샤드 번호
+    """
+    return zlib.crc32(github_id.encode("utf-8")) % num_shards
+
+
+def make_run_key(check_date: date, run_id: str) -> str:
+    """
+    수집 실행 단위 키를 생성합니다.
+    같은 run_id로 시작한 워커들은 같은 샤드 리스를 두고 경쟁합니다.
+    워커마다 시작 시각으로 run_id를 만들면 실행이 갈라져 샤드를 중복 수집하므로, 실행을 띄우는 쪽이 정해 넘깁니다.
+
+    Args:
+        check_date: 확인할 날짜
+        run_id: 실행 식별자 (같은 실행에 참여하는 모든 워커가 같은 값을 사용)
+
+    Returns:
+        str: 실행 단위 키
+    """
+    return f"{check_date.isoformat()}@{run_id}"
+
+
+def ensure_shard_leases(db: Session, run_key: str, num_shards: int) -> None:
+    """
+    실행 단위의 샤드 리스 행을 준비합니다. 여러 워커가 동시에 호출해도 안전합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        run_key: 실행 단위 키
+        num_shards: 전체 샤드 수
+    """
+    existing = {
+        shard_id for (shard_id,) in db.query(IngestionShardLease.shard_id).filter(
+            IngestionShardLease.run_key == run_key
+        ).all()
+    }
+
+    for shard_id in range(num_shards):
+        if shard_id in existing:
+            continue
+        try:
+            db.add(IngestionShardLease(run_key=run_key, shard_id=shard_id))
+            db.commit()
+        except IntegrityError:
+            # 다른 워커가 먼저 생성한 경우
+            db.rollback()
+
+
+def claim_shard(db: Session, run_key: str, worker_id: str, lease_seconds: int) -> Optional[int]:
+    """
+    처리되지 않은 샤드 하나의 리스를 획득합니다.
+    소유자가 없거나 리스가 만료된 샤드만 획득할 수 있으며,
+    조건부 UPDATE로 동시에 하나의 워커만 성공합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        run_key: 실행 단위 키
+        worker_id: 워커 ID
+        lease_seconds: 리스 유지 시간 (초)
+
+    Returns:
+        Optional[int]: 획득한 샤드 번호 또는 None (남은 샤드 없음)
+    """
+    now = datetime.now(timezone.utc)
+    claimable = or_(
+        IngestionShardLease.owner.is_(None),
+        IngestionShardLease.lease_expires_at < now
+    )
+
+    candidates = db.query(IngestionShardLease.shard_id).filter(
+        IngestionShardLease.run_key == run_key,
+        IngestionShardLease.completed_at.is_(None),
+        claimable
+    ).order_by(IngestionShardLease.shard_id).all()
+
+    for (shard_id,) in candidates:
+        result = db.execute(
+            update(IngestionShardLease)
+            .where(
+                IngestionShardLease.run_key == run_key,
+                IngestionShardLease.shard_id == shard_id,
+                IngestionShardLease.completed_at.is_(None),
+                claimable
+            )
+            .values(
+                owner=worker_id,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                heartbeat_at=now
+            )
+        )
+        db.commit()
+
+        if result.rowcount == 1:
+            logger.info(f"샤드 리스 획득: {run_key} shard={shard_id} worker={worker_id}")
+            return shard_id
+
+    return None
+
+
+def renew_lease(db: Session, run_key: str, shard_id: int, worker_id: str, lease_seconds: int) -> bool:
+    """
+    보유 중인 샤드 리스를 연장합니다 (하트비트).
+
+    Args:
+        db: 데이터베이스 세션
+        run_key: 실행 단위 키
+        shard_id: 샤드 번호
+        worker_id: 워커 ID
+        lease_seconds: 리스 유지 시간 (초)
+
+    Returns:
+        bool: 연장 성공 여부. False면 다른 워커가 리스를 인계한 것입니다.
+    """
+    now = datetime.now(timezone.utc)
+    result = db.execute(
+        update(IngestionShardLease)
+        .where(
+            IngestionShardLease.run_key == run_key,
+            IngestionShardLease.shard_id == shard_id,
+            IngestionShardLease.owner == worker_id,
+            IngestionShardLease.completed_at.is_(None)
+        )
+        .values(
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            heartbeat_at=now
+        )
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def complete_shard(db: Session, run_key: str, shard_id: int, worker_id: str) -> bool:
+    """
+    샤드 처리를 완료로 표시합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        run_key: 실행 단위 키
+        shard_id: 샤드 번호
+        worker_id: 워커 ID
+
+    Returns:
+        bool: 완료 표시 성공 여부
+    """
+    result = db.execute(
+        update(IngestionShardLease)
+        .where(
+            IngestionShardLease.run_key == run_key,
+            IngestionShardLease.shard_id == shard_id,
+            IngestionShardLease.owner == worker_id
+        )
+        .values(completed_at=datetime.now(timezone.utc))
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def get_shard_users(db: Session, shard_id: int, num_shards: int) -> List[User]:
+    """
+    특정 샤드에 속한 참여 중인 사용자 목록을 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        shard_id: 샤드 번호
+        num_shards: 전체 샤드 수
+
+    Returns:
+        List[User]: 사용자 목록
+    """
+    users = db.query(User).filter(active_users_filter()).order_by(User.id).all()
+    return [user for user in users if get_shard_id(user.github_id, num_shards) == shard_id]
+
+
+async def run_ingestion_worker(
+        db: Session,
+        check_date: date,
+        worker_id: str,
+        run_id: str,
+        num_shards: Optional[int] = None,
+        lease_seconds: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    샤드 리스를 획득하며 남은 샤드가 없을 때까지 사용자 출석을 수집합니다.
+    사용자 한 명을 처리할 때마다 하트비트로 리스를 연장하고,
+    리스를 잃으면 해당 샤드 처리를 중단합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        check_date: 확인할 날짜
+        worker_id: 워커 ID
+        run_id: 실행 식별자 (같은 실행에 참여하는 워커는 같은 값을 사용)
+        num_shards: 전체 샤드 수 (None이면 설정값)
+        lease_seconds: 리스 유지 시간 (None이면 설정값)
+
+    Returns:
+        Dict: 처리 결과
+    """
+    settings = get_ingestion_settings()
+    num_shards = num_shards or settings["num_shards"]
+    lease_seconds = lease_seconds or settings["lease_seconds"]
+
+    common_github_api_token = config.github.get("api_token", "")
+    if not common_github_api_token:
+        return {"status": "error", "message": "GitHub API 토큰이 설정되지 않았습니다."}
+
+    run_key = make_run_key(check_date, run_id)
+    ensure_shard_leases(db, run_key, num_shards)
+
+    completed_shards = []
+    lost_shards = []
+    results = []
+
+    while True:
+        shard_id = claim_shard(db, run_key, worker_id, lease_seconds)
+        if shard_id is None:
+            break
+
+        lease_lost = False
+        for user in get_shard_users(db, shard_id, num_shards):
+            github_api_token = user.github_api_token or common_github_api_token
+            result = await check_user_commit_and_save(
+                github_id=str(user.github_id),
+                check_date=check_date,
+                github_api_token=github_api_token,
+                db=db
+            )
+            results.append(result)
+
+            if not renew_lease(db, run_key, shard_id, worker_id, lease_seconds):
+                logger.warning(f"샤드 리스 상실: {run_key} shard={shard_id} worker={worker_id}")
+                lease_lost = True
+                break
+
+        if lease_lost:
+            lost_shards.append(shard_id)
+        elif complete_shard(db, run_key, shard_id, worker_id):
+            completed_shards.append(shard_id)
+
+    return {
+        "status": "success",
+        "date": check_date.isoformat(),
+        "run_key": run_key,
+        "worker_id": worker_id,
+        "completed_shards": completed_shards,
+        "lost_shards": lost_shards,
+        "results": results
+    }
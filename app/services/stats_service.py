@@ -0,0 +1,521 @@
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.config import config
+from app.models.attendance import Attendance
+from app.models.github_commit import GitHubCommit
+from app.models.user import User
+from app.services.attendance_matrix_service import load_attendance_array, load_daily_attended_counts
+from app.services.github_service import get_user_commits_stats
+from app.services.participant_service import get_active_window, participated_filter
+from app.services.ranking_service import get_ranking
+from app.services.streak_service import get_streaks
+from app.utils.bitset_utils import BITSET_FORMAT, LIST_FORMAT, RANGES_FORMAT, encode_bitsets, encode_ranges
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 연속 출석 상태가 아직 없는 사용자의 기본값
+EMPTY_STREAK = {"current_streak": 0, "longest_streak": 0, "last_attended_date": None}
+# 연속 출석 상태는 현재 시즌 기준이므로 지난 시즌 순위에는 값을 넣지 않음
+NO_STREAK = {"current_streak": None, "longest_streak": None, "last_attended_date": None}
+
+
+def resolve_date_range(
+        start_date: Optional[date],
+        end_date: Optional[date],
+        period: Optional[Tuple[date, date]] = None
+) -> Tuple[date, date]:
+    """
+    통계 기간의 시작일과 종료일을 정합니다. 지정하지 않은 날짜는 기본값을 사용합니다.
+    period(시즌 기간)가 있으면 설정 파일의 프로젝트 기간 대신 시즌 기간을 기본값과 상한으로 사용합니다.
+
+    Args:
+        start_date: 시작 날짜 (None이면 프로젝트/시즌 시작일)
+        end_date: 종료 날짜 (None이면 오늘, 프로젝트/시즌이 끝났으면 종료일)
+        period: 시즌 기간 (선택적)
+
+    Returns:
+        Tuple[date, date]: (시작일, 종료일)
+    """
+    if period is not None:
+        season_start, season_end = period
+        return start_date or season_start, min(end_date or date.today(), season_end)
+
+    # 시작일 설정
+    start = start_date
+    if start is None:
+        # 기본 시작일 (프로젝트 설정값 사용)
+        try:
+            project_config = config.project
+            if project_config and hasattr(project_config, 'start_date'):
+                start = date.fromisoformat(project_config.start_date)
+            else:
+                logger.warning("Project start_date not configured, using default")
+                start = date(2025, 3, 10)  # 기본값
+        except (ValueError, KeyError) as e:
+            logger.error(f"Error parsing project start_date: {e}")
+            start = date(2025, 3, 10)  # 기본값
+
+    # 프로젝트 종료일 계산
+    project_end_date = None
+    try:
+        project_config = config.project
+        if project_config and hasattr(project_config, 'total_days') and hasattr(project_config, 'start_date'):
+            project_start = date.fromisoformat(project_config.start_date)
+            total_days = int(project_config.total_days)
+            project_end_date = project_start + timedelta(days=total_days - 1)
+    except (ValueError, KeyError) as e:
+        logger.error(f"Error calculating project end date: {e}")
+
+    # 종료일 설정
+    end = end_date
+    if end is None:
+        # 프로젝트가 종료되었으면 종료일로, 아니면 오늘 날짜로 설정
+        if project_end_date and date.today() > project_end_date:
+            end = project_end_date
+        else:
+            end = date.today()
+
+    # 프로젝트가 종료되었는데 end가 프로젝트 종료일보다 뒤면 조정
+    if project_end_date and end > project_end_date:
+        end = project_end_date
+
+    return start, end
+
+
+def _get_total_project_days():
+    """프로젝트 총 일수를 가져옵니다."""
+    total_project_days = 100  # 기본값
+    try:
+        project_config = config.project
+        if project_config and hasattr(project_config, 'total_days'):
+            total_project_days = int(project_config.total_days)
+    except (ValueError, KeyError) as e:
+        logger.error(f"Error parsing project total_days: {e}")
+    
+    return total_project_days
+
+
+def _get_days_completed(start, end, period: Optional[Tuple[date, date]] = None):
+    """
+    통계에 포함할 일수를 계산합니다. period(시즌 기간)가 있으면 설정 파일의 프로젝트 기간 대신 사용합니다.
+
+    Returns:
+        Tuple[int, int, bool]: (진행 일수, 총 프로젝트 일수, 프로젝트 종료 여부)
+    """
+    # 날짜 범위 생성
+    days_completed = (end - start).days + 1
+
+    if period is not None:
+        season_start, season_end = period
+        total_season_days = (season_end - season_start).days + 1
+        is_completed = date.today() > season_end
+        if is_completed:
+            days_completed = min(days_completed, total_season_days)
+        return days_completed, total_season_days, is_completed
+    
+    # 총 프로젝트 일수 설정
+    total_project_days = _get_total_project_days()
+    
+    # 프로젝트 종료 여부 확인
+    project_config = config.project
+    is_completed = False
+    if project_config and hasattr(project_config, 'start_date'):
+        project_start = date.fromisoformat(project_config.start_date)
+        project_end_date = project_start + timedelta(days=total_project_days - 1)
+        is_completed = date.today() > project_end_date
+        
+        # 프로젝트가 종료되었으면 days_completed를 total_days로 제한
+        if is_completed:
+            days_completed = min(days_completed, total_project_days)
+
+    return days_completed, total_project_days, is_completed
+
+
+def _load_attendance_matrix(github_ids, date_list, start, end, db):
+    """
+    사용자별 날짜별 출석 여부를 (사용자 수, 일수) 불리언 배열로 조회합니다. 행 순서는 github_ids를 따릅니다.
+    출석 매트릭스(읽기 모델)에서 읽고, 범위가 시즌을 벗어나면 attendances 범위 쿼리 한 번으로 대신합니다.
+    """
+    attended = load_attendance_array(db, start, len(date_list), github_ids)
+    if attended is not None:
+        return attended, True
+
+    rows = db.query(Attendance.github_id, Attendance.attendance_date).filter(
+        Attendance.attendance_date >= start,
+        Attendance.attendance_date <= end,
+        Attendance.is_attended == True
+    ).all()
+
+    user_index = {github_id: i for i, github_id in enumerate(github_ids)}
+    date_index = {d: i for i, d in enumerate(date_list)}
+    user_idx, date_idx = [], []
+    for github_id, attendance_date in rows:
+        i = user_index.get(github_id)
+        j = date_index.get(attendance_date.isoformat())
+        if i is not None and j is not None:
+            user_idx.append(i)
+            date_idx.append(j)
+
+    attended = np.zeros((len(github_ids), len(date_list)), dtype=bool)
+    attended[user_idx, date_idx] = True
+    return attended, False
+
+
+def _get_active_mask(users, start, num_days):
+    """
+    사용자별로 start부터 num_days일의 각 날짜가 참여 기간 안인지 나타내는 (사용자 수, 일수) 불리언 배열을 만듭니다.
+    참여 중인 사용자는 모든 날짜가 참여 기간입니다.
+    """
+    first = np.zeros(len(users), dtype=np.int64)
+    last = np.full(len(users), num_days - 1, dtype=np.int64)
+    for i, user in enumerate(users):
+        window_start, window_end = get_active_window(user.is_active, user.activated_at, user.deactivated_at)
+        if window_start is not None:
+            first[i] = (window_start - start).days
+        if window_end is not None:
+            last[i] = (window_end - start).days
+
+    day_index = np.arange(num_days)
+    return (day_index >= first[:, None]) & (day_index <= last[:, None])
+
+
+def _to_rates(counts, totals):
+    """출석 수와 일수(또는 인원) 배열로 백분율을 반올림한 정수 배열을 만듭니다. 분모가 0이면 0입니다."""
+    rates = np.divide(counts, totals, out=np.zeros(len(counts)), where=totals > 0) * 100
+    # round()와 같은 짝수 반올림
+    return np.rint(rates).astype(np.int64)
+
+
+def encode_attendance(attended, attendance_format):
+    """(사용자 수, 일수) 출석 배열을 응답 형식에 맞게 사용자별로 인코딩합니다."""
+    if attendance_format == BITSET_FORMAT:
+        return encode_bitsets(attended)
+    if attendance_format == RANGES_FORMAT:
+        return encode_ranges(attended)
+    return attended.tolist()
+
+
+def _calculate_user_stats(users, attended, active, attendance_format=LIST_FORMAT):
+    """
+    사용자별 출석 데이터를 계산합니다.
+    attended는 참여 기간 밖의 날짜를 미출석으로 처리한 출석 배열이고, 출석률은 참여 기간(active) 일수로 계산합니다.
+    출석률 내림차순으로 순위를 매기며, 출석률이 같으면 users 순서를 유지합니다.
+    출석 여부 목록은 attendance_format(list, bitset, ranges) 형식으로 담습니다.
+    """
+    attended_counts = attended.sum(axis=1)
+    total_days = active.sum(axis=1)
+    rates = _to_rates(attended_counts, total_days)
+    order = np.argsort(-rates, kind="stable")
+
+    attendance_lists = encode_attendance(attended, attendance_format)
+    attended_counts, total_days, rates = attended_counts.tolist(), total_days.tolist(), rates.tolist()
+    return [
+        {
+            "github_id": users[i].github_id,
+            "attendance_rate": rates[i],
+            "attended_count": attended_counts[i],
+            "total_days": total_days[i],
+            "attendance": attendance_lists[i],
+            "rank": rank
+        }
+        for rank, i in enumerate(order.tolist(), start=1)
+    ]
+
+
+def _calculate_daily_rates(date_list, attended, active, daily_counts=None):
+    """
+    날짜별 출석률을 계산합니다.
+    daily_counts(날짜별 출석 인원 읽기 모델)가 주어지면 그 값을 사용합니다.
+    분모는 그날 참여 중이던 사용자 수입니다.
+    """
+    if daily_counts is not None:
+        attended_counts = np.array([daily_counts.get(date.fromisoformat(d), 0) for d in date_list], dtype=np.int64)
+    else:
+        attended_counts = attended.sum(axis=0)
+    rates = _to_rates(attended_counts, active.sum(axis=0))
+    return [{"date": d, "rate": rate} for d, rate in zip(date_list, rates.tolist())]
+
+
+def _calculate_attendance_summary(attended, active):
+    """전체 출석 통계를 계산합니다."""
+    total_present = int(attended.sum())
+    total_possible = int(active.sum())
+    total_absent = total_possible - total_present
+    overall_attendance_rate = round(total_present / total_possible * 100) if total_possible else 0
+    
+    return {
+        "total_present": total_present,
+        "total_absent": total_absent,
+        "overall_attendance_rate": overall_attendance_rate
+    }
+
+
+def build_attendance_stats(
+        db: Session,
+        start: date,
+        end: date,
+        attendance_format: str = LIST_FORMAT,
+        period: Optional[Tuple[date, date]] = None
+) -> Dict[str, Any]:
+    """
+    기간의 출석 통계(GET /api/attendance/stats 응답 본문)를 계산합니다.
+    기본 형식(list)이 아니면 응답에 attendance_format을 함께 담습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        start: 시작 날짜
+        end: 종료 날짜 (resolve_date_range로 정한 값)
+        attendance_format: 사용자별 출석 여부 목록 형식 (list, bitset, ranges)
+        period: 시즌 기간 (있으면 설정 파일의 프로젝트 기간 대신 사용)
+
+    Returns:
+        Dict: 출석 통계
+    """
+    days_completed, total_project_days, is_completed = _get_days_completed(start, end, period)
+
+    date_list = [(start + timedelta(days=i)).isoformat() for i in range(days_completed)]
+
+    # 사용자별 출석 데이터 조회 (기간 중 참여한 사용자만, 그만둔 사용자는 참여 기간만 계산)
+    users = db.query(User).filter(participated_filter(start, end)).all()
+    active = _get_active_mask(users, start, len(date_list))
+    attended, from_matrix = _load_attendance_matrix([user.github_id for user in users], date_list, start, end, db)
+    # 참여 기간 밖의 날짜는 미출석으로 처리
+    attended &= active
+    user_stats = _calculate_user_stats(users, attended, active, attendance_format)
+
+    # 날짜별 출석률 계산 (읽기 모델이 있으면 날짜별 출석 인원 테이블 사용)
+    daily_counts = load_daily_attended_counts(db, start, end) if from_matrix else None
+    daily_rates = _calculate_daily_rates(date_list, attended, active, daily_counts)
+
+    # 총 출석 통계 계산
+    attendance_summary = _calculate_attendance_summary(attended, active)
+    
+    return {
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "days_completed": days_completed,
+        "total_days": total_project_days,  # 총 프로젝트 일수
+        "is_completed": is_completed,  # 프로젝트 완료 여부
+        "dates": date_list,
+        "users": user_stats,
+        "daily_rates": daily_rates,
+        **attendance_summary,
+        **({"attendance_format": attendance_format} if attendance_format != LIST_FORMAT else {})
+    }
+
+
+def build_attendance_ranking(
+        db: Session,
+        start: date,
+        end: date,
+        period: Optional[Tuple[date, date]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        dense: bool = False,
+        with_streaks: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    기간의 출석률 순위(GET /api/attendance/ranking 응답 본문)를 계산합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        start: 시작 날짜
+        end: 종료 날짜 (resolve_date_range로 정한 값)
+        period: 시즌 기간 (있으면 설정 파일의 프로젝트 기간 대신 사용)
+        limit: 최대 사용자 수 (None이면 전체)
+        offset: 건너뛸 사용자 수
+        dense: True면 DENSE_RANK로 순위 계산
+        with_streaks: 연속 출석 상태를 담을지 여부 (현재 시즌이 아니면 False로 두고 null로 채움)
+
+    Returns:
+        List[Dict]: 순위 목록
+    """
+    days_completed, _, _ = _get_days_completed(start, end, period)
+    ranking = get_ranking(db, start, start + timedelta(days=days_completed - 1), limit, offset, dense)
+
+    if not with_streaks:
+        for user in ranking:
+            user.update(NO_STREAK)
+        return ranking
+
+    streaks = get_streaks(db, [user["github_id"] for user in ranking])
+    for user in ranking:
+        user.update(streaks.get(user["github_id"], EMPTY_STREAK))
+    return ranking
+
+
+def _default_commit_stats_range() -> Tuple[Optional[date], Optional[date]]:
+    """커밋 통계의 기본 기간입니다. 프로젝트 시작일부터 오늘(프로젝트가 끝났으면 종료일)까지입니다."""
+    start_date = None
+    end_date = None
+    if not config.project:
+        return start_date, end_date
+
+    # 프로젝트 시작일 가져오기
+    if hasattr(config.project, 'start_date'):
+        try:
+            start_date = date.fromisoformat(config.project.start_date)
+        except ValueError:
+            logger.warning("프로젝트 시작일 형식이 잘못되었습니다.")
+
+    # 프로젝트 종료일 계산
+    if start_date and hasattr(config.project, 'total_days'):
+        try:
+            total_days = int(config.project.total_days)
+            project_end_date = start_date + timedelta(days=total_days - 1)
+            # 프로젝트가 종료되었으면 프로젝트 종료일, 아니면 오늘 날짜 사용
+            end_date = min(date.today(), project_end_date)
+        except ValueError:
+            logger.warning("프로젝트 총 일수 형식이 잘못되었습니다.")
+            end_date = date.today()
+    else:
+        end_date = date.today()
+    return start_date, end_date
+
+
+def _default_daily_commits_range() -> Tuple[date, date]:
+    """일별 커밋 수의 기본 기간입니다. 프로젝트 기간이 설정되어 있으면 프로젝트 기간, 아니면 최근 1년입니다."""
+    # 기본값: 최근 1년 (약 365일)
+    end_date = date.today()
+    start_date = end_date - timedelta(days=365)
+
+    # 프로젝트 설정 확인
+    if config.project:
+        # 프로젝트 시작일 확인
+        project_start = None
+        if hasattr(config.project, 'start_date'):
+            try:
+                project_start = date.fromisoformat(config.project.start_date)
+                start_date = project_start  # 프로젝트 시작일 사용
+            except ValueError:
+                logger.warning("프로젝트 시작일 형식이 잘못되었습니다.")
+
+        # 총 일수(total_days)를 이용하여 종료일 계산
+        if project_start and hasattr(config.project, 'total_days'):
+            try:
+                total_days = int(config.project.total_days)
+                # 시작일 + 총 일수 - 1 = 종료일
+                project_end_date = project_start + timedelta(days=total_days - 1)
+                # 프로젝트가 종료되었으면 프로젝트 종료일 사용
+                end_date = min(date.today(), project_end_date)
+            except (ValueError, TypeError):
+                logger.warning("프로젝트 총 일수(total_days) 형식이 잘못되었습니다.")
+
+        # total_days 없이 직접 종료일이 설정된 경우
+        elif hasattr(config.project, 'end_date'):
+            try:
+                end_date = date.fromisoformat(config.project.end_date)
+            except ValueError:
+                logger.warning("프로젝트 종료일 형식이 잘못되었습니다.")
+    return start_date, end_date
+
+
+async def build_user_commit_stats(
+        db: Session,
+        github_id: str,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None
+) -> Dict[str, Any]:
+    """
+    사용자의 커밋 통계(GET /api/github-commits/{github_id}/stats 응답 본문)를 계산합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        github_id: GitHub 사용자 ID
+        from_date: 시작 날짜 (둘 다 None이면 프로젝트 기간)
+        to_date: 종료 날짜
+
+    Returns:
+        Dict: 커밋 통계 정보 (총 커밋 수, 저장소 수, 가장 최근 커밋 날짜, 현재/최장 연속 출석 일수)
+    """
+    if from_date is None and to_date is None:
+        from_date, to_date = _default_commit_stats_range()
+
+    stats = await get_user_commits_stats(db, github_id, from_date=from_date, to_date=to_date)
+
+    # 날짜 범위 정보 추가
+    stats["from_date"] = from_date.isoformat() if from_date else None
+    stats["to_date"] = to_date.isoformat() if to_date else None
+
+    # 최근 커밋 날짜가 있는 경우 ISO 형식으로 변환
+    if stats.get("latest_commit_date"):
+        stats["latest_commit_date"] = stats["latest_commit_date"].isoformat()
+
+        # 오늘과의 날짜 차이 계산
+        latest_date = datetime.fromisoformat(stats["latest_commit_date"].split("T")[0])
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        stats["days_since_last_commit"] = (today - latest_date).days
+    else:
+        stats["days_since_last_commit"] = None
+
+    # 연속 출석 정보 추가
+    streak = get_streaks(db, [github_id]).get(github_id, {})
+    stats["current_streak"] = streak.get("current_streak", 0)
+    stats["longest_streak"] = streak.get("longest_streak", 0)
+    stats["last_attended_date"] = streak.get("last_attended_date")
+    return stats
+
+
+def build_user_daily_commits(
+        db: Session,
+        github_id: str,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None
+) -> Dict[str, Any]:
+    """
+    사용자의 일별 커밋 수(GET /api/github-commits/{github_id}/daily-counts 응답 본문)를 계산합니다.
+    기간 안의 커밋이 없는 날짜도 0으로 채웁니다.
+
+    Args:
+        db: 데이터베이스 세션
+        github_id: GitHub 사용자 ID
+        from_date: 시작 날짜 (둘 다 None이면 프로젝트 기간 또는 최근 1년)
+        to_date: 종료 날짜
+
+    Returns:
+        Dict: 날짜별 커밋 수 정보
+    """
+    if from_date is None and to_date is None:
+        from_date, to_date = _default_daily_commits_range()
+
+    # 일별 커밋 수 쿼리 생성 (저장된 KST 날짜 컬럼 사용)
+    query = db.query(
+        GitHubCommit.commit_date_kst.label('commit_date'),
+        func.count().label('count')
+    ).filter(
+        GitHubCommit.github_id == github_id
+    ).group_by(
+        GitHubCommit.commit_date_kst
+    ).order_by(
+        GitHubCommit.commit_date_kst
+    )
+    if from_date:
+        query = query.filter(GitHubCommit.commit_date_kst >= from_date)
+    if to_date:
+        query = query.filter(GitHubCommit.commit_date_kst <= to_date)
+
+    # 날짜 범위 내의 모든 날짜에 대해 빈 데이터 생성 (비어있는 날짜도 0으로 표시)
+    daily_commits = {}
+    if from_date and to_date:
+        current_date = from_date
+        while current_date <= to_date:
+            daily_commits[current_date.isoformat()] = 0
+            current_date += timedelta(days=1)
+
+    # 실제 데이터 채우기
+    for result in query.all():
+        daily_commits[result.commit_date.isoformat()] = result.count
+
+    return {
+        "github_id": github_id,
+        "from_date": from_date.isoformat() if from_date else None,
+        "to_date": to_date.isoformat() if to_date else None,
+        "daily_commits": daily_commits
+    }
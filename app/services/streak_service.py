@@ -0,0 +1,211 @@
+import logging
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance
+from app.models.user import User
+from app.models.user_streak import UserStreak
+from app.utils.date_utils import kst_today
+from app.utils.db_utils import upsert
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def compute_streak(attended_dates: Iterable[date]) -> Tuple[int, int, Optional[date]]:
+    """
+    출석 날짜 목록으로 연속 출석 상태를 계산합니다.
+
+    Args:
+        attended_dates: 출석한 날짜 목록 (순서 무관)
+
+    Returns:
+        Tuple[int, int, Optional[date]]: (마지막 출석일로 끝나는 연속 일수, 최장 연속 일수, 마지막 출석일)
+    """
+    current = longest = 0
+    previous = None
+    for d in sorted(set(attended_dates)):
+        current = current + 1 if previous is not None and d - previous == timedelta(days=1) else 1
+        longest = max(longest, current)
+        previous = d
+    return current, longest, previous
+
+
+def _streak_row(github_id: str, current: int, longest: int, last_attended_date: Optional[date]) -> Dict[str, Any]:
+    return {
+        "github_id": github_id,
+        "current_streak": current,
+        "longest_streak": longest,
+        "last_attended_date": last_attended_date
+    }
+
+
+def _save_streaks(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """연속 출석 상태를 user_streaks 테이블에 저장합니다."""
+    upsert(
+        db,
+        UserStreak,
+        rows,
+        index_elements=["github_id"],
+        update_columns=["current_streak", "longest_streak", "last_attended_date"],
+        constraint="uix_user_streaks_github_id"
+    )
+
+
+def _build_streak_rows(db: Session, github_ids: Set[str]) -> List[Dict[str, Any]]:
+    """attendances 테이블에서 사용자들의 연속 출석 상태를 쿼리 한 번으로 새로 계산합니다."""
+    if not github_ids:
+        return []
+
+    dates_by_user = {github_id: [] for github_id in github_ids}
+    for github_id, attendance_date in db.query(Attendance.github_id, Attendance.attendance_date).filter(
+        Attendance.github_id.in_(github_ids),
+        Attendance.is_attended == True
+    ).all():
+        dates_by_user[github_id].append(attendance_date)
+
+    return [_streak_row(github_id, *compute_streak(dates)) for github_id, dates in sorted(dates_by_user.items())]
+
+
+def refresh_streaks(db: Session, cells: Iterable[Tuple[str, date]]) -> None:
+    """
+    변경된 (사용자, 날짜) 칸을 연속 출석 상태에 반영합니다. 커밋은 호출자가 합니다.
+    마지막 출석일 다음 날 이후의 변경(일반적인 매일 출석)은 저장된 상태만으로 갱신하고,
+    마지막 출석일 이전의 변경(과거 데이터 보정, 출석 취소)이나 상태가 없는 사용자만
+    attendances에서 다시 계산합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        cells: 변경된 (github_id, 날짜) 목록
+    """
+    cells = set(cells)
+    if not cells:
+        return
+
+    github_ids = {github_id for github_id, _ in cells}
+    attended_cells = set(
+        db.query(Attendance.github_id, Attendance.attendance_date).filter(
+            Attendance.github_id.in_(github_ids),
+            Attendance.attendance_date.in_({d for _, d in cells}),
+            Attendance.is_attended == True
+        ).all()
+    )
+    existing = {
+        github_id: (current, longest, last_attended_date)
+        for github_id, current, longest, last_attended_date in db.query(
+            UserStreak.github_id, UserStreak.current_streak, UserStreak.longest_streak, UserStreak.last_attended_date
+        ).filter(UserStreak.github_id.in_(github_ids)).all()
+    }
+
+    rows = []
+    rebuild = set()
+    for github_id in github_ids:
+        if github_id not in existing:
+            rebuild.add(github_id)
+            continue
+
+        current, longest, last_attended_date = existing[github_id]
+        changed = False
+        for d in sorted(d for g, d in cells if g == github_id):
+            is_attended = (github_id, d) in attended_cells
+            if last_attended_date is not None and d <= last_attended_date:
+                # 마지막 출석일 이전 변경은 이미 출석인 날을 다시 출석으로 쓴 경우만 무시할 수 있음
+                if d == last_attended_date and is_attended:
+                    continue
+                rebuild.add(github_id)
+                break
+            if not is_attended:
+                continue
+            if last_attended_date is not None and d == last_attended_date + timedelta(days=1):
+                current += 1
+            else:
+                current = 1
+            longest = max(longest, current)
+            last_attended_date = d
+            changed = True
+
+        if github_id not in rebuild and changed:
+            rows.append(_streak_row(github_id, current, longest, last_attended_date))
+
+    rows.extend(_build_streak_rows(db, rebuild))
+    _save_streaks(db, rows)
+
+
+def rebuild_streaks(db: Session) -> Dict[str, int]:
+    """
+    모든 사용자의 연속 출석 상태를 attendances 테이블에서 다시 만듭니다. 커밋은 호출자가 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        Dict[str, int]: 다시 만든 사용자 수
+    """
+    github_ids = {github_id for (github_id,) in db.query(User.github_id).all()}
+
+    db.query(UserStreak).delete(synchronize_session=False)
+    _save_streaks(db, _build_streak_rows(db, github_ids))
+
+    logger.info(f"연속 출석 상태 재생성 완료: 사용자 {len(github_ids)}명")
+    return {"users": len(github_ids)}
+
+
+def verify_streaks(db: Session) -> List[Dict[str, Any]]:
+    """
+    저장된 연속 출석 상태를 attendances 테이블에서 새로 계산한 값과 비교합니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        List[Dict]: 값이 다른 사용자 목록 (stored: 저장된 값, expected: 새로 계산한 값).
+            출석한 적이 없는 사용자는 저장된 값이 없어도 일치로 봅니다.
+    """
+    github_ids = {github_id for (github_id,) in db.query(User.github_id).all()}
+    stored = {
+        github_id: _streak_row(github_id, current, longest, last_attended_date)
+        for github_id, current, longest, last_attended_date in db.query(
+            UserStreak.github_id, UserStreak.current_streak, UserStreak.longest_streak, UserStreak.last_attended_date
+        ).all()
+    }
+
+    mismatches = []
+    for expected in _build_streak_rows(db, github_ids):
+        github_id = expected["github_id"]
+        actual = stored.get(github_id, _streak_row(github_id, 0, 0, None))
+        if actual != expected:
+            mismatches.append({"github_id": github_id, "stored": stored.get(github_id), "expected": expected})
+    return mismatches
+
+
+def get_streaks(db: Session, github_ids: Optional[Iterable[str]] = None, today: Optional[date] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    사용자별 연속 출석 정보를 조회합니다.
+    현재 연속 일수는 마지막 출석일이 오늘(KST) 또는 어제일 때만 유지되고, 그보다 오래되면 0입니다.
+
+    Args:
+        db: 데이터베이스 세션
+        github_ids: 조회할 사용자 목록 (None이면 전체)
+        today: 기준 날짜 (None이면 KST 오늘)
+
+    Returns:
+        Dict[str, Dict]: github_id별 current_streak, longest_streak, last_attended_date(ISO 문자열 또는 None)
+    """
+    today = today or kst_today()
+    query = db.query(
+        UserStreak.github_id, UserStreak.current_streak, UserStreak.longest_streak, UserStreak.last_attended_date
+    )
+    if github_ids is not None:
+        query = query.filter(UserStreak.github_id.in_(set(github_ids)))
+
+    streaks = {}
+    for github_id, current, longest, last_attended_date in query.all():
+        is_current = last_attended_date is not None and last_attended_date >= today - timedelta(days=1)
+        streaks[github_id] = {
+            "current_streak": current if is_current else 0,
+            "longest_streak": longest,
+            "last_attended_date": last_attended_date.isoformat() if last_attended_date else None
+        }
+    return streaks
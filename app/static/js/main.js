@@ -1,3 +1,6 @@
+// 출석 통계 API (사용자별 출석 여부를 비트셋으로 받아 응답 크기를 줄임)
+const ATTENDANCE_STATS_URL = '/api/attendance/stats?format=bitset';
+
 document.addEventListener('DOMContentLoaded', function () {
     // 전역 변수로 출석부 데이터 저장
     let attendanceData = null;
@@ -119,7 +122,7 @@ document.addEventListener('DOMContentLoaded', function () {
     
     // 진행률 데이터 로드
     function loadProgressData() {
-        fetch('/api/attendance/stats')
+        fetch(ATTENDANCE_STATS_URL)
             .then(response => response.json())
             .then(data => {
                 // 진행률 계산
@@ -163,7 +166,7 @@ document.addEventListener('DOMContentLoaded', function () {
     // 오늘의 출석 현황 로드
     function loadTodayAttendance() {
         // 먼저 프로젝트 종료 여부 확인
-        fetch('/api/attendance/stats')
+        fetch(ATTENDANCE_STATS_URL)
             .then(response => response.json())
             .then(data => {
                 const isCompleted = data.is_completed;
@@ -472,6 +475,35 @@ document.addEventListener('DOMContentLoaded', function () {
         });
     }
 
+    // 비트셋(base64) 형식의 출석 여부를 날짜별 true/false 목록으로 변환
+    // 첫 날짜가 첫 바이트의 최상위 비트
+    function decodeAttendanceBitset(encoded, numDays) {
+        const bytes = atob(encoded);
+        const attendance = new Array(numDays);
+        for (let i = 0; i < numDays; i++) {
+            attendance[i] = ((bytes.charCodeAt(i >> 3) >> (7 - (i & 7))) & 1) === 1;
+        }
+        return attendance;
+    }
+
+    // 연속 출석 구간([시작, 끝] 인덱스) 형식의 출석 여부를 날짜별 true/false 목록으로 변환
+    function decodeAttendanceRanges(ranges, numDays) {
+        const attendance = new Array(numDays).fill(false);
+        ranges.forEach(([start, end]) => attendance.fill(true, start, end + 1));
+        return attendance;
+    }
+
+    // 출석 통계 응답의 사용자별 출석 여부를 날짜별 true/false 목록으로 복원
+    function decodeAttendanceStats(data) {
+        const numDays = data.dates.length;
+        if (data.attendance_format === 'bitset') {
+            data.users.forEach(user => user.attendance = decodeAttendanceBitset(user.attendance, numDays));
+        } else if (data.attendance_format === 'ranges') {
+            data.users.forEach(user => user.attendance = decodeAttendanceRanges(user.attendance, numDays));
+        }
+        return data;
+    }
+
     // 전체 출석부 로드
     function loadFullAttendance() {
         // 시간별 커밋 수 데이터 가져오기
@@ -493,8 +525,9 @@ document.addEventListener('DOMContentLoaded', function () {
             });
         
         // 출석 통계 데이터 가져오기
-        fetch('/api/attendance/stats')
+        fetch(ATTENDANCE_STATS_URL)
             .then(response => response.json())
+            .then(decodeAttendanceStats)
             .then(data => {
                 // 전역 변수에 데이터 저장
                 attendanceData = data;
@@ -0,0 +1,65 @@
+import base64
+from typing import List
+
+import numpy as np
+
+# 출석 여부 목록의 응답 형식
+# - list: 날짜별 true/false 목록 (기본값)
+# - bitset: 날짜 순서대로 1비트씩(첫 날짜가 첫 바이트의 최상위 비트) 담은 바이트열의 base64 문자열
+# - ranges: 연속 출석 구간의 [시작 인덱스, 끝 인덱스] 목록 (끝 포함)
+LIST_FORMAT = "list"
+BITSET_FORMAT = "bitset"
+RANGES_FORMAT = "ranges"
+ATTENDANCE_FORMATS = (LIST_FORMAT, BITSET_FORMAT, RANGES_FORMAT)
+
+
+def encode_bitsets(attended: np.ndarray) -> List[str]:
+    """
+    (사용자 수, 일수) 불리언 배열의 각 행을 base64 비트셋 문자열로 인코딩합니다.
+
+    Args:
+        attended: 출석 여부 배열
+
+    Returns:
+        List[str]: 행별 base64 문자열
+    """
+    packed = np.packbits(attended, axis=1)
+    return [base64.b64encode(row).decode("ascii") for row in packed]
+
+
+def encode_ranges(attended: np.ndarray) -> List[List[List[int]]]:
+    """
+    (사용자 수, 일수) 불리언 배열의 각 행을 연속 출석 구간 목록으로 인코딩합니다.
+
+    Args:
+        attended: 출석 여부 배열
+
+    Returns:
+        List[List[List[int]]]: 행별 [시작 인덱스, 끝 인덱스] 목록
+    """
+    num_users = attended.shape[0]
+    padded = np.zeros((num_users, attended.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = attended
+    edges = np.diff(padded, axis=1)
+
+    # 행 우선 순서라 행별로 시작과 끝이 같은 개수, 같은 순서로 나옴
+    start_rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    bounds = np.column_stack((starts, ends - 1)).tolist()
+
+    splits = np.searchsorted(start_rows, np.arange(num_users + 1)).tolist()
+    return [bounds[splits[i]:splits[i + 1]] for i in range(num_users)]
+
+
+def decode_bitset(encoded: str, num_days: int) -> List[bool]:
+    """base64 비트셋 문자열을 날짜별 출석 여부 목록으로 되돌립니다."""
+    packed = np.frombuffer(base64.b64decode(encoded), dtype=np.uint8)
+    return np.unpackbits(packed, count=num_days).astype(bool).tolist()
+
+
+def decode_ranges(ranges: List[List[int]], num_days: int) -> List[bool]:
+    """연속 출석 구간 목록을 날짜별 출석 여부 목록으로 되돌립니다."""
+    attended = [False] * num_days
+    for start, end in ranges:
+        attended[start:end + 1] = [True] * (end - start + 1)
+    return attended
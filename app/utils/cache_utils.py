@@ -0,0 +1,140 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    유효 기간이 있는 프로세스 내 캐시입니다.
+    값을 꺼낼 때 저장된 지 얼마나 지났는지(초)를 함께 반환합니다.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """
+        유효 기간 안의 값을 조회합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[Tuple[Any, float]]: (값, 저장 후 경과 시간(초)) 또는 None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        age = time.monotonic() - stored_at
+        if age >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+        return value, age
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값을 저장합니다. 최대 개수를 넘으면 가장 오래된 항목부터 버립니다."""
+        if self.ttl_seconds <= 0:
+            return
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """특정 키의 값을 버립니다."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 값을 버립니다."""
+        self._entries.clear()
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 비동기 작업을 하나로 합칩니다.
+    진행 중인 작업이 있으면 새로 실행하지 않고 그 결과를 함께 기다리며,
+    끝난 결과는 result_ttl_seconds 동안 재사용합니다.
+    작업을 실행하던 호출이 취소되면(클라이언트 연결 끊김 등) 기다리던 호출 중 하나가 자기 작업으로 다시 실행합니다.
+    """
+
+    def __init__(self, result_ttl_seconds: float = 0):
+        self.result_ttl_seconds = result_ttl_seconds
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._recent = TTLCache(result_ttl_seconds)
+
+    def get_recent(self, key: Hashable) -> Optional[Any]:
+        """
+        유효 기간 안의 최근 결과를 반환합니다.
+
+        Args:
+            key: 작업 키
+
+        Returns:
+            Optional[Any]: 최근 결과 또는 None
+        """
+        recent = self._recent.get(key)
+        return recent[0] if recent is not None else None
+
+    def forget(self, key: Hashable) -> None:
+        """최근 결과를 버립니다. 다음 호출은 작업을 새로 실행합니다."""
+        self._recent.invalidate(key)
+
+    def clear(self) -> None:
+        """최근 결과를 모두 버립니다."""
+        self._recent.clear()
+
+    async def run(
+            self,
+            key: Hashable,
+            func: Callable[[], Awaitable[Any]],
+            should_cache: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        키에 해당하는 작업을 한 번만 실행하고 결과를 공유합니다.
+
+        Args:
+            key: 작업 키
+            func: 실행할 비동기 함수
+            should_cache: 결과를 최근 결과로 보관할지 판단하는 함수 (None이면 항상 보관)
+
+        Returns:
+            Any: 작업 결과
+        """
+        while True:
+            recent = self.get_recent(key)
+            if recent is not None:
+                return recent
+
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 이 호출이 취소된 경우에만 전파하고, 실행하던 호출이 취소된 경우에는 다시 시도
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없을 때 "exception was never retrieved" 경고가 남지 않도록 조회 처리
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            if should_cache is None or should_cache(result):
+                self._recent.set(key, result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,67 @@
+import gzip
+from typing import Optional
+
+from fastapi import Request
+
+from app.config import config
+
+# 이 크기(바이트) 이상인 응답은 클라이언트가 Accept-Encoding: gzip을 보내면 압축
+GZIP_MINIMUM_SIZE = int((config.response or {}).get("gzip_minimum_size", 1000))
+
+# 압축 수준 (1-9). 큰 JSON 응답에서 9는 5보다 크기는 조금 작지만 수십 배 느림
+GZIP_COMPRESSLEVEL = int((config.response or {}).get("gzip_compresslevel", 5))
+
+
+def _parse_qvalue(params: str) -> float:
+    """Accept-Encoding 항목의 매개변수(;q=0.5 등)에서 q 값을 읽습니다. 없거나 잘못된 값이면 1입니다."""
+    for param in params.split(";"):
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value.strip())
+            except ValueError:
+                return 1.0
+    return 1.0
+
+
+def accepts_gzip(request: Request) -> bool:
+    """
+    요청의 Accept-Encoding이 gzip을 허용하면 True를 반환합니다.
+    항목별로 q 값을 읽어 gzip;q=0은 거부로 보고, gzip이 없으면 * 항목을 따릅니다.
+    """
+    qvalues = {}
+    for item in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding:
+            qvalues[coding] = _parse_qvalue(params)
+
+    qvalue = qvalues.get("gzip", qvalues.get("*", 0.0))
+    return qvalue > 0
+
+
+def gzip_body(body: bytes) -> bytes:
+    """
+    응답 본문을 gzip으로 압축합니다. 같은 본문은 항상 같은 바이트열로 압축합니다.
+
+    Args:
+        body: 응답 본문
+
+    Returns:
+        bytes: 압축한 본문
+    """
+    return gzip.compress(body, compresslevel=GZIP_COMPRESSLEVEL, mtime=0)
+
+
+class CachedBody:
+    """캐시에 보관하는 직렬화한 응답 본문. gzip 압축 본문은 처음 필요할 때 한 번만 만듭니다."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self._gzipped: Optional[bytes] = None
+
+    def gzipped(self) -> bytes:
+        """gzip으로 압축한 본문을 반환합니다."""
+        if self._gzipped is None:
+            self._gzipped = gzip_body(self.body)
+        return self._gzipped
@@ -1,9 +1,16 @@
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone
 from typing import Tuple, Optional
 
+from app.config import config
+
 # KST 오프셋 상수
 KST_OFFSET = timedelta(hours=9)  # UTC+9
 
+# 프로젝트 설정이 없을 때 사용하는 기본값
+DEFAULT_PROJECT_START_DATE = date(2025, 3, 10)
+DEFAULT_PROJECT_TOTAL_DAYS = 100
+DEFAULT_PROJECT_SEASON_NAME = "season10"
+
 def get_kst_datetime_range(target_date: date) -> Tuple[datetime, datetime]:
     """
     특정 날짜의 KST 기준 시작 시간과 종료 시간을 반환합니다.
@@ -17,4 +24,71 @@ def get_kst_datetime_range(target_date: date) -> Tuple[datetime, datetime]:
     start_datetime = datetime.combine(target_date, datetime.min.time()) - KST_OFFSET
     end_datetime = datetime.combine(target_date, datetime.max.time()) - KST_OFFSET
     
-    return start_datetime, end_datetime
\ No newline at end of file
+    return start_datetime, end_datetime
+
+
+def kst_today() -> date:
+    """KST 기준 오늘 날짜를 반환합니다."""
+    return (datetime.now(timezone.utc).replace(tzinfo=None) + KST_OFFSET).date()
+
+
+def to_kst_datetime(value: datetime) -> datetime:
+    """
+    시각을 KST 기준 시각(timezone 정보 없음)으로 변환합니다. timezone 정보가 없는 값은 UTC로 간주합니다.
+
+    Args:
+        value: 변환할 시각
+
+    Returns:
+        datetime: KST 시각
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value + KST_OFFSET
+
+
+def to_kst_date(value: datetime) -> date:
+    """
+    시각을 KST 기준 날짜로 변환합니다. timezone 정보가 없는 값은 UTC로 간주합니다.
+
+    Args:
+        value: 변환할 시각
+
+    Returns:
+        date: KST 날짜
+    """
+    return to_kst_datetime(value).date()
+
+
+def get_project_period() -> Tuple[date, date]:
+    """
+    설정 파일의 프로젝트(시즌) 시작일과 종료일을 반환합니다.
+    설정이 없거나 잘못된 경우 기본값을 사용합니다.
+
+    Returns:
+        Tuple[date, date]: (시작일, 종료일) 튜플
+    """
+    start_date = DEFAULT_PROJECT_START_DATE
+    total_days = DEFAULT_PROJECT_TOTAL_DAYS
+
+    project_config = config.project
+    if project_config:
+        try:
+            start_date = date.fromisoformat(project_config.start_date)
+            total_days = int(project_config.total_days)
+        except (ValueError, TypeError):
+            pass
+
+    return start_date, start_date + timedelta(days=total_days - 1)
+
+
+def get_project_season_name() -> str:
+    """
+    설정 파일의 프로젝트(현재 시즌) 이름을 반환합니다.
+    설정이 없으면 기본값을 사용합니다.
+
+    Returns:
+        str: 시즌 이름 (e.g. season10)
+    """
+    project_config = config.project
+    return (project_config.season_name if project_config else None) or DEFAULT_PROJECT_SEASON_NAME
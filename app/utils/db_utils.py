@@ -0,0 +1,91 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+# 한 번의 INSERT에 담을 최대 행 수 (PostgreSQL 바인드 파라미터 개수 제한 대비)
+UPSERT_CHUNK_SIZE = 1000
+
+
+def get_dialect_name(db: Session) -> str:
+    """세션이 연결된 데이터베이스 종류를 반환합니다. (e.g. postgresql, sqlite)"""
+    return db.get_bind().dialect.name
+
+
+def get_dialect_insert(db: Session):
+    """
+    ON CONFLICT를 지원하는 방언의 insert 함수를 반환합니다.
+    PostgreSQL과 SQLite 외의 데이터베이스는 None을 반환합니다.
+    """
+    dialect = get_dialect_name(db)
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    return None
+
+
+def upsert(
+        db: Session,
+        model,
+        rows: List[Dict[str, Any]],
+        index_elements: Sequence[str],
+        update_columns: Sequence[str],
+        constraint: Optional[str] = None,
+        touch_updated_at: bool = True
+) -> None:
+    """
+    여러 행을 한 번의 INSERT ... ON CONFLICT DO UPDATE 문으로 저장합니다.
+    값이 바뀌지 않은 기존 행은 갱신하지 않습니다. 커밋은 호출자가 합니다.
+
+    PostgreSQL과 SQLite는 각 방언의 ON CONFLICT 구문을 사용하고,
+    그 외 데이터베이스는 행 단위 조회/갱신으로 대체합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        model: SQLAlchemy 모델 클래스
+        rows: 저장할 행 목록
+        index_elements: 충돌 판단에 사용할 유니크 컬럼
+        update_columns: 충돌 시 갱신할 컬럼
+        constraint: PostgreSQL에서 사용할 유니크 제약조건 이름 (선택적)
+        touch_updated_at: 갱신 시 updated_at을 현재 시각으로 설정할지 여부
+    """
+    if not rows:
+        return
+
+    insert = get_dialect_insert(db)
+    if insert is None:
+        _upsert_fallback(db, model, rows, index_elements, update_columns)
+        return
+
+    for i in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = insert(model).values(rows[i:i + UPSERT_CHUNK_SIZE])
+        set_ = {column: stmt.excluded[column] for column in update_columns}
+        if touch_updated_at:
+            set_["updated_at"] = func.now()
+        changed = or_(*[
+            getattr(model, column).is_distinct_from(stmt.excluded[column]) for column in update_columns
+        ])
+
+        if get_dialect_name(db) == "postgresql" and constraint:
+            stmt = stmt.on_conflict_do_update(constraint=constraint, set_=set_, where=changed)
+        else:
+            stmt = stmt.on_conflict_do_update(index_elements=list(index_elements), set_=set_, where=changed)
+        db.execute(stmt)
+
+
+def _upsert_fallback(db: Session, model, rows: Iterable[Dict[str, Any]], index_elements, update_columns) -> None:
+    """ON CONFLICT를 지원하지 않는 데이터베이스용 행 단위 저장"""
+    for row in rows:
+        existing = db.query(model).filter(
+            and_(*[getattr(model, column) == row[column] for column in index_elements])
+        ).first()
+        if existing is None:
+            db.add(model(**row))
+        else:
+            for column in update_columns:
+                setattr(existing, column, row[column])
+    db.flush()
@@ -0,0 +1,36 @@
+import hashlib
+from typing import Any, Dict
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    응답을 구분하는 값들로 ETag를 만듭니다.
+
+    Args:
+        parts: 응답 내용을 결정하는 값 (데이터 버전, 파라미터 등)
+
+    Returns:
+        str: 따옴표로 감싼 ETag
+    """
+    return f'"{hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20]}"'
+
+
+def gzip_etag(etag: str) -> str:
+    """gzip으로 압축한 본문의 ETag를 만듭니다. 압축하지 않은 본문과 바이트가 다르므로 강한 ETag를 따로 씁니다."""
+    return f'{etag[:-1]}-gz"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """요청의 If-None-Match에 ETag가 있으면 True를 반환합니다. (약한 비교, * 포함)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+def not_modified_response(headers: Dict[str, str]) -> Response:
+    """304 Not Modified 응답을 만듭니다."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+import logging
+import os
+import socket
+from datetime import date
+
+from app.database import SessionLocal
+from app.services.shard_service import run_ingestion_worker
+from app.utils.date_utils import kst_today
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_args():
+    """명령행 인수를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="정원사들 시즌10 분산 출석 수집 워커")
+    parser.add_argument("--date", type=str, default=None, help="수집할 날짜 (YYYY-MM-DD, 기본값: 오늘(KST))")
+    parser.add_argument("--run-id", type=str, required=True,
+                        help="실행 식별자. 같은 실행에 참여하는 워커는 모두 같은 값을 사용합니다 (예: 2025-03-14T10)")
+    parser.add_argument("--worker-id", type=str, default=None, help="워커 ID (기본값: 호스트명-PID)")
+    parser.add_argument("--shards", type=int, default=None, help="전체 샤드 수 (기본값: 설정 파일의 ingestion.num_shards)")
+    parser.add_argument("--lease-seconds", type=int, default=None, help="샤드 리스 유지 시간 (초)")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+
+    check_date = date.fromisoformat(args.date) if args.date else kst_today()
+    worker_id = args.worker_id or f"{socket.gethostname()}-{os.getpid()}"
+
+    db = SessionLocal()
+    try:
+        result = await run_ingestion_worker(
+            db,
+            check_date,
+            worker_id,
+            run_id=args.run_id,
+            num_shards=args.shards,
+            lease_seconds=args.lease_seconds
+        )
+        if result["status"] != "success":
+            logger.error(f"수집 워커 실패: {result.get('message')}")
+            return
+
+        logger.info(
+            f"수집 워커 완료: {result['run_key']} worker={worker_id} "
+            f"완료 샤드={result['completed_shards']} 상실 샤드={result['lost_shards']} "
+            f"처리 사용자={len(result['results'])}명"
+        )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,36 +1,182 @@
+-- 참고용 스키마 (PostgreSQL). 실제 스키마 변경은 migrations/ (Alembic)로 관리합니다.
+
 CREATE TABLE users
 (
     id               SERIAL PRIMARY KEY,
     github_id        VARCHAR(255) UNIQUE NOT NULL,
     github_api_token TEXT,
+    is_active        BOOLEAN NOT NULL DEFAULT TRUE,
+    activated_at     TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    deactivated_at   TIMESTAMP WITH TIME ZONE,
     created_at       TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at       TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX ix_users_active_github_id ON users (github_id) WHERE is_active = true;
+CREATE INDEX ix_users_inactive_deactivated_at ON users (deactivated_at) WHERE is_active = false;
+
+-- 시즌 (github_commits, attendances는 시즌 기간별 파티션으로 나뉨)
+CREATE TABLE seasons
+(
+    id         SERIAL PRIMARY KEY,
+    name       VARCHAR(255) NOT NULL,
+    start_date DATE         NOT NULL,
+    end_date   DATE         NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    constraint uix_seasons_name
+        unique (name)
+);
+
+-- 파티션 테이블의 기본 키/유니크 제약조건에는 파티션 키(commit_date_kst)가 들어감
 CREATE TABLE github_commits
 (
-    id          SERIAL PRIMARY KEY,
+    id          SERIAL,
     github_id   VARCHAR(255)             NOT NULL,
     commit_id   VARCHAR(255)             NOT NULL,
     repository  VARCHAR(255)             NOT NULL,
     message     TEXT                     NOT NULL,
     commit_url  TEXT                     NOT NULL,
     commit_date TIMESTAMP WITH TIME ZONE NOT NULL,
+    commit_date_kst DATE                 NOT NULL,
+    commit_hour_kst SMALLINT             NOT NULL,
     is_private  BOOLEAN                  NOT NULL DEFAULT FALSE,
     created_at  TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at  TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    constraint unique_commit
+    PRIMARY KEY (id, commit_date_kst),
+    constraint uix_commit_repo
+        unique (commit_id, repository, commit_date_kst)
+) PARTITION BY RANGE (commit_date_kst);
+
+-- 시즌별 파티션 (POST /api/admin/seasons가 만듦) + 시즌 밖의 날짜
+CREATE TABLE github_commits_season_1 PARTITION OF github_commits FOR VALUES FROM ('2025-03-10') TO ('2025-06-18');
+CREATE TABLE github_commits_default PARTITION OF github_commits DEFAULT;
+
+CREATE INDEX ix_github_commits_github_id_commit_date_kst ON github_commits (github_id, commit_date_kst);
+CREATE INDEX ix_github_commits_github_id_commit_date ON github_commits (github_id, commit_date);
+CREATE INDEX ix_github_commits_commit_date_brin ON github_commits USING brin (commit_date);
+
+-- 저장한 커밋의 (commit_id, repository) 키 (파티션을 나누지 않은 테이블로 같은 커밋의 중복 저장을 막음)
+CREATE TABLE github_commit_keys
+(
+    id         SERIAL PRIMARY KEY,
+    commit_id  VARCHAR(255) NOT NULL,
+    repository VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    constraint uix_github_commit_keys
         unique (commit_id, repository)
 );
 
-CREATE TABLE attendance
+-- (KST 날짜, KST 시, github_id)별 커밋 수 (커밋 수집 시 함께 갱신, 시간대별 커밋 분포 조회)
+CREATE TABLE commit_hourly_rollups
 (
     id              SERIAL PRIMARY KEY,
+    commit_date_kst DATE         NOT NULL,
+    commit_hour_kst SMALLINT     NOT NULL,
+    github_id       VARCHAR(255) NOT NULL,
+    commit_count    INTEGER      NOT NULL DEFAULT 0,
+    created_at      TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at      TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    constraint uix_commit_hourly_rollups_cell
+        unique (commit_date_kst, commit_hour_kst, github_id)
+);
+
+CREATE INDEX ix_commit_hourly_rollups_github_id_commit_date_kst ON commit_hourly_rollups (github_id, commit_date_kst);
+
+CREATE TABLE attendances
+(
+    id              SERIAL,
     github_id       VARCHAR(255) NOT NULL,
     attendance_date DATE         NOT NULL,
     commit_count    INTEGER      DEFAULT 0,
     is_attended     BOOLEAN                  DEFAULT FALSE,
     created_at      TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at      TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    UNIQUE (github_id, attendance_date)
-);
\ No newline at end of file
+    PRIMARY KEY (id, attendance_date),
+    constraint uix_github_id_attendance_date
+        unique (github_id, attendance_date)
+) PARTITION BY RANGE (attendance_date);
+
+CREATE TABLE attendances_season_1 PARTITION OF attendances FOR VALUES FROM ('2025-03-10') TO ('2025-06-18');
+CREATE TABLE attendances_default PARTITION OF attendances DEFAULT;
+
+CREATE INDEX ix_attendances_attendance_date_is_attended ON attendances (attendance_date, is_attended) INCLUDE (github_id, commit_count);
+
+CREATE TABLE ingestion_shard_leases
+(
+    id               SERIAL PRIMARY KEY,
+    run_key          VARCHAR(255) NOT NULL,
+    shard_id         INTEGER      NOT NULL,
+    owner            VARCHAR(255),
+    lease_expires_at TIMESTAMP WITH TIME ZONE,
+    heartbeat_at     TIMESTAMP WITH TIME ZONE,
+    completed_at     TIMESTAMP WITH TIME ZONE,
+    created_at       TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at       TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    constraint uix_run_key_shard_id
+        unique (run_key, shard_id)
+);
+
+-- 출석 통계 읽기 모델: 사용자별 시즌 출석 문자열 ('1' 출석 / '0' 미출석)
+CREATE TABLE attendance_matrix
+(
+    id             SERIAL PRIMARY KEY,
+    github_id      VARCHAR(255) NOT NULL,
+    start_date     DATE         NOT NULL,
+    days           TEXT         NOT NULL DEFAULT '',
+    attended_count INTEGER      NOT NULL DEFAULT 0,
+    created_at     TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at     TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    constraint uix_attendance_matrix_github_id
+        unique (github_id)
+);
+
+-- 출석 통계 읽기 모델: 날짜별 출석 인원
+CREATE TABLE daily_attendance_counts
+(
+    id              SERIAL PRIMARY KEY,
+    attendance_date DATE    NOT NULL,
+    attended_count  INTEGER NOT NULL DEFAULT 0,
+    created_at      TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at      TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    constraint uix_daily_attendance_counts_date
+        unique (attendance_date)
+);
+
+-- 출석 읽기 모델: 사용자별 연속 출석 상태
+CREATE TABLE user_streaks
+(
+    id                 SERIAL PRIMARY KEY,
+    github_id          VARCHAR(255) NOT NULL,
+    current_streak     INTEGER      NOT NULL DEFAULT 0,
+    longest_streak     INTEGER      NOT NULL DEFAULT 0,
+    last_attended_date DATE,
+    created_at         TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at         TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    constraint uix_user_streaks_github_id
+        unique (github_id)
+);
+
+-- 마감된 날짜 (KST 자정 + 유예 시간 뒤 마지막 수집을 마친 날짜)
+CREATE TABLE finalized_days
+(
+    id           SERIAL PRIMARY KEY,
+    day          DATE                     NOT NULL,
+    finalized_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    created_at   TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at   TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    constraint uix_finalized_days_day
+        unique (day)
+);
+
+-- 데이터 버전 카운터 (출석 기록/사용자가 바뀔 때마다 증가, 조회 API 응답 캐시 키)
+CREATE TABLE data_versions
+(
+    id         SERIAL PRIMARY KEY,
+    name       VARCHAR(255) NOT NULL,
+    version    BIGINT       NOT NULL DEFAULT 0,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    constraint uix_data_versions_name
+        unique (name)
+);
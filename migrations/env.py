@@ -0,0 +1,78 @@
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from app.config import config as app_config
+from app.database import Base
+
+# autogenerate가 모든 테이블을 비교할 수 있도록 모델 모듈을 불러옴
+import app.models.attendance  # noqa: F401
+import app.models.attendance_matrix  # noqa: F401
+import app.models.commit_hourly_rollup  # noqa: F401
+import app.models.data_version  # noqa: F401
+import app.models.finalized_day  # noqa: F401
+import app.models.github_commit  # noqa: F401
+import app.models.github_commit_key  # noqa: F401
+import app.models.ingestion_shard_lease  # noqa: F401
+import app.models.season  # noqa: F401
+import app.models.user  # noqa: F401
+import app.models.user_streak  # noqa: F401
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def get_url() -> str:
+    """alembic.ini나 -x 옵션에 URL이 없으면 config.yaml의 database.url을 사용합니다."""
+    return config.get_main_option("sqlalchemy.url") or app_config.database["url"]
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL 스크립트를 출력합니다. (alembic upgrade head --sql)"""
+    context.configure(
+        url=get_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """DB에 연결해 마이그레이션을 실행합니다. 테스트는 config.attributes["connection"]으로 연결을 넘길 수 있습니다."""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+
+    connectable = engine_from_config(
+        {"sqlalchemy.url": get_url()},
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+    with connectable.connect() as connection:
+        _run(connection)
+
+
+def _run(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
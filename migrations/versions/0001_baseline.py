@@ -0,0 +1,71 @@
+"""baseline: users, github_commits, attendances
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-03-20 00:00:00
+
+기존 운영 DB(docs/schema.sql로 만든 세 테이블)는 이 리비전으로 stamp 합니다.
+    alembic stamp 0001
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("github_id", sa.String(), nullable=False),
+        sa.Column("github_api_token", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_github_id", "users", ["github_id"], unique=True)
+
+    op.create_table(
+        "github_commits",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("github_id", sa.String(), nullable=False),
+        sa.Column("commit_id", sa.String(), nullable=False),
+        sa.Column("repository", sa.String(), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("commit_url", sa.String(), nullable=False),
+        sa.Column("commit_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("is_private", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("commit_id", "repository", name="uix_commit_repo"),
+    )
+    op.create_index("ix_github_commits_id", "github_commits", ["id"])
+    op.create_index("ix_github_commits_github_id", "github_commits", ["github_id"])
+    op.create_index("ix_github_commits_commit_id", "github_commits", ["commit_id"])
+
+    op.create_table(
+        "attendances",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("github_id", sa.String(), nullable=False),
+        sa.Column("attendance_date", sa.Date(), nullable=False),
+        sa.Column("commit_count", sa.Integer()),
+        sa.Column("is_attended", sa.Boolean()),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("github_id", "attendance_date", name="uix_github_id_attendance_date"),
+    )
+    op.create_index("ix_attendances_id", "attendances", ["id"])
+    op.create_index("ix_attendances_github_id", "attendances", ["github_id"])
+    op.create_index("ix_attendances_attendance_date", "attendances", ["attendance_date"])
+
+
+def downgrade() -> None:
+    op.drop_table("attendances")
+    op.drop_table("github_commits")
+    op.drop_table("users")
@@ -0,0 +1,99 @@
+"""shard leases, attendance read models, KST columns on github_commits
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-03-24 00:00:00
+
+docs/migrations/001_github_commits_kst_columns.sql을 대체합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ingestion_shard_leases",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("run_key", sa.String(), nullable=False),
+        sa.Column("shard_id", sa.Integer(), nullable=False),
+        sa.Column("owner", sa.String(), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("run_key", "shard_id", name="uix_run_key_shard_id"),
+    )
+    op.create_index("ix_ingestion_shard_leases_id", "ingestion_shard_leases", ["id"])
+    op.create_index("ix_ingestion_shard_leases_run_key", "ingestion_shard_leases", ["run_key"])
+
+    op.create_table(
+        "attendance_matrix",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("github_id", sa.String(), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("days", sa.Text(), nullable=False),
+        sa.Column("attended_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("github_id", name="uix_attendance_matrix_github_id"),
+    )
+    op.create_index("ix_attendance_matrix_id", "attendance_matrix", ["id"])
+
+    op.create_table(
+        "daily_attendance_counts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("attendance_date", sa.Date(), nullable=False),
+        sa.Column("attended_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("attendance_date", name="uix_daily_attendance_counts_date"),
+    )
+    op.create_index("ix_daily_attendance_counts_id", "daily_attendance_counts", ["id"])
+
+    # KST 날짜/시 컬럼 추가 후 기존 행 채우기
+    op.add_column("github_commits", sa.Column("commit_date_kst", sa.Date(), nullable=True))
+    op.add_column("github_commits", sa.Column("commit_hour_kst", sa.SmallInteger(), nullable=True))
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "UPDATE github_commits "
+            "SET commit_date_kst = (commit_date AT TIME ZONE 'Asia/Seoul')::date, "
+            "commit_hour_kst = EXTRACT(HOUR FROM commit_date AT TIME ZONE 'Asia/Seoul')::smallint "
+            "WHERE commit_date_kst IS NULL"
+        )
+    else:
+        # SQLite는 commit_date를 UTC 문자열로 저장
+        op.execute(
+            "UPDATE github_commits "
+            "SET commit_date_kst = date(commit_date, '+9 hours'), "
+            "commit_hour_kst = CAST(strftime('%H', commit_date, '+9 hours') AS INTEGER) "
+            "WHERE commit_date_kst IS NULL"
+        )
+
+    with op.batch_alter_table("github_commits") as batch_op:
+        batch_op.alter_column("commit_date_kst", existing_type=sa.Date(), nullable=False)
+        batch_op.alter_column("commit_hour_kst", existing_type=sa.SmallInteger(), nullable=False)
+
+    op.create_index(
+        "ix_github_commits_github_id_commit_date_kst", "github_commits", ["github_id", "commit_date_kst"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_github_commits_github_id_commit_date_kst", table_name="github_commits")
+    with op.batch_alter_table("github_commits") as batch_op:
+        batch_op.drop_column("commit_hour_kst")
+        batch_op.drop_column("commit_date_kst")
+
+    op.drop_table("daily_attendance_counts")
+    op.drop_table("attendance_matrix")
+    op.drop_table("ingestion_shard_leases")
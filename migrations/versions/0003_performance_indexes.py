@@ -0,0 +1,48 @@
+"""composite, covering and BRIN indexes for hot queries
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-03-25 00:00:00
+
+- github_commits (github_id, commit_date): 사용자별 기간 커밋 수/목록
+- github_commits commit_date BRIN (PostgreSQL): 추가만 되는 테이블의 기간 스캔
+- attendances (attendance_date, is_attended) INCLUDE (github_id, commit_count): 날짜별 출석 조회/집계
+앞의 인덱스로 대체되는 단일 컬럼 인덱스는 쓰기 비용을 줄이기 위해 삭제합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_github_commits_github_id_commit_date", "github_commits", ["github_id", "commit_date"]
+    )
+    op.create_index(
+        "ix_github_commits_commit_date_brin", "github_commits", ["commit_date"], postgresql_using="brin"
+    )
+    op.create_index(
+        "ix_attendances_attendance_date_is_attended",
+        "attendances",
+        ["attendance_date", "is_attended"],
+        postgresql_include=["github_id", "commit_count"],
+    )
+
+    # (github_id, ...) 복합 인덱스와 (attendance_date, ...) 복합 인덱스가 대체
+    op.drop_index("ix_github_commits_github_id", table_name="github_commits")
+    op.drop_index("ix_attendances_attendance_date", table_name="attendances")
+
+
+def downgrade() -> None:
+    op.create_index("ix_attendances_attendance_date", "attendances", ["attendance_date"])
+    op.create_index("ix_github_commits_github_id", "github_commits", ["github_id"])
+
+    op.drop_index("ix_attendances_attendance_date_is_attended", table_name="attendances")
+    op.drop_index("ix_github_commits_commit_date_brin", table_name="github_commits")
+    op.drop_index("ix_github_commits_github_id_commit_date", table_name="github_commits")
@@ -0,0 +1,37 @@
+"""user_streaks: per-user streak read model
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-03-27 00:00:00
+
+테이블을 만든 뒤 POST /api/admin/rebuild-attendance-matrix로 기존 출석 기록에서 채웁니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_streaks",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("github_id", sa.String(), nullable=False),
+        sa.Column("current_streak", sa.Integer(), nullable=False),
+        sa.Column("longest_streak", sa.Integer(), nullable=False),
+        sa.Column("last_attended_date", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("github_id", name="uix_user_streaks_github_id"),
+    )
+    op.create_index("ix_user_streaks_id", "user_streaks", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("user_streaks")
@@ -0,0 +1,33 @@
+"""finalized_days: days closed after the KST day-close reconciliation
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-03-28 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "finalized_days",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("finalized_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("day", name="uix_finalized_days_day"),
+    )
+    op.create_index("ix_finalized_days_id", "finalized_days", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("finalized_days")
@@ -0,0 +1,48 @@
+"""users: participant lifecycle (is_active, activated_at, deactivated_at) with partial indexes
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-03-29 00:00:00
+
+기존 사용자는 참여 중으로 두고, activated_at은 created_at으로 채웁니다.
+- ix_users_active_github_id (is_active): 수집/통계 대상 사용자 조회
+- ix_users_inactive_deactivated_at (NOT is_active): 통계 기간에 걸친 비활성 사용자 조회
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.true()))
+        batch_op.add_column(sa.Column("activated_at", sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()))
+        batch_op.add_column(sa.Column("deactivated_at", sa.DateTime(timezone=True), nullable=True))
+
+    op.execute("UPDATE users SET activated_at = created_at")
+
+    op.create_index(
+        "ix_users_active_github_id", "users", ["github_id"],
+        postgresql_where=sa.text("is_active = true"), sqlite_where=sa.text("is_active = 1")
+    )
+    op.create_index(
+        "ix_users_inactive_deactivated_at", "users", ["deactivated_at"],
+        postgresql_where=sa.text("is_active = false"), sqlite_where=sa.text("is_active = 0")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_inactive_deactivated_at", table_name="users")
+    op.drop_index("ix_users_active_github_id", table_name="users")
+
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("deactivated_at")
+        batch_op.drop_column("activated_at")
+        batch_op.drop_column("is_active")
@@ -0,0 +1,33 @@
+"""data_versions: change counters for versioned response caching
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-03-30 00:00:00
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "data_versions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("name", name="uix_data_versions_name"),
+    )
+    op.create_index("ix_data_versions_id", "data_versions", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_table("data_versions")
@@ -0,0 +1,53 @@
+"""commit_hourly_rollups: per (KST date, KST hour, github_id) commit counts
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-03-31 00:00:00
+
+테이블을 만든 뒤 github_commits에서 한 번에 채웁니다. 이후에는 커밋 수집 시 함께 갱신됩니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "commit_hourly_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("commit_date_kst", sa.Date(), nullable=False),
+        sa.Column("commit_hour_kst", sa.SmallInteger(), nullable=False),
+        sa.Column("github_id", sa.String(), nullable=False),
+        sa.Column("commit_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint(
+            "commit_date_kst", "commit_hour_kst", "github_id", name="uix_commit_hourly_rollups_cell"
+        ),
+    )
+    op.create_index("ix_commit_hourly_rollups_id", "commit_hourly_rollups", ["id"])
+    op.create_index(
+        "ix_commit_hourly_rollups_github_id_commit_date_kst",
+        "commit_hourly_rollups",
+        ["github_id", "commit_date_kst"]
+    )
+
+    op.execute(
+        """
+        INSERT INTO commit_hourly_rollups (commit_date_kst, commit_hour_kst, github_id, commit_count)
+        SELECT commit_date_kst, commit_hour_kst, github_id, COUNT(*)
+        FROM github_commits
+        GROUP BY commit_date_kst, commit_hour_kst, github_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("commit_hourly_rollups")
@@ -0,0 +1,125 @@
+"""seasons table; range-partition github_commits and attendances by season on PostgreSQL
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-04-01 00:00:00
+
+seasons 테이블을 만들고 설정 파일의 현재 시즌(project.season_name, start_date, total_days)을 추가합니다.
+
+PostgreSQL에서는 github_commits(commit_date_kst), attendances(attendance_date)를 KST 날짜 범위로 파티션을 나눕니다.
+- 시즌마다 {테이블}_season_{시즌 ID} 파티션 하나, 시즌 밖의 날짜는 {테이블}_default 파티션
+- 기간 조건이 있는 조회는 다른 시즌의 파티션을 건너뜀 (partition pruning)
+- 이후 시즌은 POST /api/admin/seasons가 파티션을 함께 만듦
+파티션 테이블의 기본 키와 유니크 제약조건에는 파티션 키가 들어가야 하므로
+github_commits의 uix_commit_repo는 (commit_id, repository, commit_date_kst)가 됩니다.
+같은 커밋의 중복 저장은 save_github_commits가 (commit_id, repository)로 먼저 조회해 막습니다.
+테이블을 새로 만들어 행을 복사하므로 데이터가 많으면 점검 시간에 실행합니다.
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.date_utils import get_project_period, get_project_season_name
+
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 테이블별 (파티션 키, 인덱스 목록, 유니크 제약조건 컬럼)
+PARTITIONED_TABLES = {
+    "github_commits": (
+        "commit_date_kst",
+        [
+            ("ix_github_commits_id", ["id"], {}),
+            ("ix_github_commits_commit_id", ["commit_id"], {}),
+            ("ix_github_commits_github_id_commit_date_kst", ["github_id", "commit_date_kst"], {}),
+            ("ix_github_commits_github_id_commit_date", ["github_id", "commit_date"], {}),
+            ("ix_github_commits_commit_date_brin", ["commit_date"], {"postgresql_using": "brin"}),
+        ],
+        ("uix_commit_repo", ["commit_id", "repository"]),
+    ),
+    "attendances": (
+        "attendance_date",
+        [
+            ("ix_attendances_id", ["id"], {}),
+            ("ix_attendances_github_id", ["github_id"], {}),
+            (
+                "ix_attendances_attendance_date_is_attended", ["attendance_date", "is_attended"],
+                {"postgresql_include": ["github_id", "commit_count"]}
+            ),
+        ],
+        ("uix_github_id_attendance_date", ["github_id", "attendance_date"]),
+    ),
+}
+
+
+def _copy_table(table: str, partition_key: Union[str, None]) -> None:
+    """
+    테이블을 같은 컬럼의 새 테이블(partition_key가 있으면 범위 파티션 테이블)로 바꾸고 행을 옮깁니다.
+    id 시퀀스는 새 테이블로 넘기며, 기본 키/인덱스/제약조건은 호출자가 만듭니다.
+    """
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+    partition_clause = f" PARTITION BY RANGE ({partition_key})" if partition_key else ""
+    op.execute(f"CREATE TABLE {table} (LIKE {table}_old INCLUDING DEFAULTS){partition_clause}")
+    if partition_key:
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+        for season_id, start, end in op.get_bind().execute(
+            sa.text("SELECT id, start_date, end_date FROM seasons ORDER BY start_date")
+        ):
+            op.execute(
+                f"CREATE TABLE {table}_season_{season_id} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{(end + timedelta(days=1)).isoformat()}')"
+            )
+    op.execute(f"INSERT INTO {table} SELECT * FROM {table}_old")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    op.execute(f"DROP TABLE {table}_old")
+
+
+def _create_keys(table: str, partition_key: Union[str, None]) -> None:
+    """기본 키, 인덱스, 유니크 제약조건을 만듭니다. 파티션 테이블이면 키에 파티션 키를 더합니다."""
+    _, indexes, (unique_name, unique_columns) = PARTITIONED_TABLES[table]
+    extra = [partition_key] if partition_key and partition_key not in unique_columns else []
+    op.create_primary_key(f"{table}_pkey", table, ["id"] + ([partition_key] if partition_key else []))
+    op.create_unique_constraint(unique_name, table, unique_columns + extra)
+    for name, columns, kwargs in indexes:
+        op.create_index(name, table, columns, **kwargs)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "seasons",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("name", name="uix_seasons_name"),
+    )
+    op.create_index("ix_seasons_id", "seasons", ["id"])
+
+    season_start, season_end = get_project_period()
+    op.get_bind().execute(
+        sa.text("INSERT INTO seasons (name, start_date, end_date) VALUES (:name, :start_date, :end_date)"),
+        {"name": get_project_season_name(), "start_date": season_start, "end_date": season_end}
+    )
+
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, (partition_key, _, _) in PARTITIONED_TABLES.items():
+        _copy_table(table, partition_key)
+        _create_keys(table, partition_key)
+
+
+def downgrade() -> None:
+    # 파티션은 _copy_table에서 부모 테이블과 함께 삭제됨
+    if op.get_bind().dialect.name == "postgresql":
+        for table in PARTITIONED_TABLES:
+            _copy_table(table, None)
+            _create_keys(table, None)
+
+    op.drop_table("seasons")
@@ -0,0 +1,56 @@
+"""github_commit_keys: (commit_id, repository) dedup keys outside the partitioned github_commits
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2025-04-02 00:00:00
+
+0009에서 github_commits의 uix_commit_repo에 파티션 키(commit_date_kst)가 들어가 DB가 같은 커밋의 중복 저장을 막지 못하게 되었으므로,
+파티션을 나누지 않은 github_commit_keys 테이블의 (commit_id, repository) 유니크 제약조건으로 막습니다.
+기존 커밋의 키를 채우고, PostgreSQL이 아닌 DB도 uix_commit_repo를 모델과 같은 (commit_id, repository, commit_date_kst)로 맞춥니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _set_commit_repo_columns(columns) -> None:
+    """PostgreSQL이 아닌 DB에서 uix_commit_repo의 컬럼을 바꿉니다. (PostgreSQL은 0009에서 바꿈)"""
+    if op.get_bind().dialect.name == "postgresql":
+        return
+    with op.batch_alter_table("github_commits") as batch_op:
+        batch_op.drop_constraint("uix_commit_repo", type_="unique")
+        batch_op.create_unique_constraint("uix_commit_repo", columns)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "github_commit_keys",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("commit_id", sa.String(), nullable=False),
+        sa.Column("repository", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("commit_id", "repository", name="uix_github_commit_keys"),
+    )
+    op.create_index("ix_github_commit_keys_id", "github_commit_keys", ["id"])
+
+    op.execute(
+        """
+        INSERT INTO github_commit_keys (commit_id, repository)
+        SELECT DISTINCT commit_id, repository
+        FROM github_commits
+        """
+    )
+
+    _set_commit_repo_columns(["commit_id", "repository", "commit_date_kst"])
+
+
+def downgrade() -> None:
+    _set_commit_repo_columns(["commit_id", "repository"])
+    op.drop_table("github_commit_keys")
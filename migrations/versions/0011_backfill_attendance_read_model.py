@@ -0,0 +1,84 @@
+"""backfill attendance_matrix and daily_attendance_counts from attendances
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2025-04-03 00:00:00
+
+0002는 출석 매트릭스와 날짜별 출석 인원 테이블을 비워 둔 채 만들었고, 이후 쓰기 경로는 바뀐 칸만 갱신하므로
+관리자 재생성(POST /api/admin/rebuild-attendance-matrix)을 실행하기 전에는 일부 사용자만 행이 있는
+매트릭스가 통계에 그대로 쓰였습니다. 설정 파일의 현재 시즌 기준으로 두 테이블을 attendances에서 다시 채웁니다.
+(rebuild_attendance_matrix와 같은 결과)
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.date_utils import get_project_period
+
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+users = sa.table("users", sa.column("github_id", sa.String))
+attendances = sa.table(
+    "attendances",
+    sa.column("github_id", sa.String),
+    sa.column("attendance_date", sa.Date),
+    sa.column("is_attended", sa.Boolean),
+)
+attendance_matrix = sa.table(
+    "attendance_matrix",
+    sa.column("github_id", sa.String),
+    sa.column("start_date", sa.Date),
+    sa.column("days", sa.Text),
+    sa.column("attended_count", sa.Integer),
+)
+daily_attendance_counts = sa.table(
+    "daily_attendance_counts",
+    sa.column("attendance_date", sa.Date),
+    sa.column("attended_count", sa.Integer),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    season_start, season_end = get_project_period()
+    total_days = (season_end - season_start).days + 1
+
+    attended = bind.execute(
+        sa.select(attendances.c.github_id, attendances.c.attendance_date)
+        .join(users, users.c.github_id == attendances.c.github_id)
+        .where(
+            attendances.c.is_attended == sa.true(),
+            attendances.c.attendance_date >= season_start,
+            attendances.c.attendance_date <= season_end,
+        )
+    ).all()
+
+    # 사용자별 시즌 출석 문자열 (i번째 글자 = 시즌 시작일 + i일)
+    days_by_user = {github_id: ["0"] * total_days for (github_id,) in bind.execute(sa.select(users.c.github_id))}
+    daily_counts = {}
+    for github_id, attendance_date in attended:
+        days_by_user[github_id][(attendance_date - season_start).days] = "1"
+        daily_counts[attendance_date] = daily_counts.get(attendance_date, 0) + 1
+
+    op.execute(attendance_matrix.delete())
+    op.execute(daily_attendance_counts.delete())
+    if days_by_user:
+        op.bulk_insert(attendance_matrix, [
+            {"github_id": github_id, "start_date": season_start, "days": "".join(days), "attended_count": days.count("1")}
+            for github_id, days in days_by_user.items()
+        ])
+    op.bulk_insert(daily_attendance_counts, [
+        {"attendance_date": d, "attended_count": daily_counts.get(d, 0)}
+        for d in (season_start + timedelta(days=i) for i in range(total_days))
+    ])
+
+
+def downgrade() -> None:
+    # 데이터만 채우므로 되돌릴 스키마 변경이 없음
+    pass
@@ -0,0 +1,29 @@
+"""finalized_days.reopened_at: days an admin reopened and changed after finalization
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2025-04-04 00:00:00
+
+마감된 날짜의 출석 기록은 관리자의 다시 열기(reopen) 경로로만 바뀝니다.
+다시 연 날짜는 reopened_at을 남겨 GET /api/attendance/{date}가 immutable 대신 no-cache로 응답합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("finalized_days") as batch_op:
+        batch_op.add_column(sa.Column("reopened_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("finalized_days") as batch_op:
+        batch_op.drop_column("reopened_at")
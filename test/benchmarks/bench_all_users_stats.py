@@ -0,0 +1,89 @@
+"""
+전체 사용자 출석 통계(get_all_users_attendance_stats) 벤치마크.
+
+사용자마다 출석 기록을 조회하던 이전 방식과
+범위 쿼리 1회 + groupby 한 번 순회로 처리하는 현재 방식을 비교합니다.
+
+실행: python -m test.benchmarks.bench_all_users_stats --users 1000 --days 100
+"""
+import argparse
+import asyncio
+from datetime import date, timedelta
+
+from app.models.attendance import Attendance
+from app.models.user import User
+from app.services.attendance_service import recompute_attendance_range
+from app.services.github_service import get_all_users_attendance_stats
+from test.benchmarks.bench_utils import make_session, measure, seed_users, seed_commits
+
+START_DATE = date(2025, 3, 10)
+
+
+def per_user_loop(db, start_date, end_date):
+    """이전 구현: 사용자마다 출석 기록 쿼리 1회"""
+    total_days = (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days + 1
+    results = []
+    for user in db.query(User).order_by(User.github_id).all():
+        attendances = db.query(Attendance).filter(
+            Attendance.github_id == user.github_id,
+            Attendance.attendance_date >= start_date,
+            Attendance.attendance_date <= end_date
+        ).order_by(Attendance.attendance_date).all()
+        if not attendances:
+            results.append({
+                "github_id": user.github_id, "total_days": total_days, "attended_days": 0,
+                "attendance_rate": 0, "total_commits": 0, "attendance_by_date": {}
+            })
+            continue
+        attended_days = sum(1 for a in attendances if a.is_attended)
+        results.append({
+            "github_id": user.github_id,
+            "total_days": total_days,
+            "attended_days": attended_days,
+            "attendance_rate": round(attended_days / total_days * 100, 1),
+            "total_commits": sum(a.commit_count for a in attendances),
+            "attendance_by_date": {
+                a.attendance_date.isoformat(): {"commit_count": a.commit_count, "is_attended": a.is_attended}
+                for a in attendances
+            }
+        })
+    return results
+
+
+async def run(num_users, days):
+    db = make_session()
+    github_ids = seed_users(db, num_users)
+    seed_commits(db, github_ids, START_DATE, days=days)
+    recompute_attendance_range(db, START_DATE, START_DATE + timedelta(days=days - 1))
+    db.commit()
+
+    start_date = START_DATE.isoformat()
+    end_date = (START_DATE + timedelta(days=days - 1)).isoformat()
+
+    with measure(db) as loop_stats:
+        loop_results = per_user_loop(db, start_date, end_date)
+    with measure(db) as single_stats:
+        single_results = await get_all_users_attendance_stats(db, start_date, end_date)
+
+    assert loop_results == single_results
+
+    print(
+        f"users={num_users:5d} days={days} "
+        f"per-user: {loop_stats['queries']:5d} queries {loop_stats['seconds'] * 1000:8.1f}ms | "
+        f"single query: {single_stats['queries']:2d} queries {single_stats['seconds'] * 1000:8.1f}ms | "
+        f"speedup={loop_stats['seconds'] / single_stats['seconds']:.1f}x"
+    )
+    db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--days", type=int, default=100)
+    args = parser.parse_args()
+    for num_users in args.users:
+        asyncio.run(run(num_users, args.days))
+
+
+if __name__ == "__main__":
+    main()
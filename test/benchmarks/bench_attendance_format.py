@@ -0,0 +1,71 @@
+"""
+출석 통계 응답의 출석 여부 목록 형식(format=list, bitset, ranges) 벤치마크.
+
+사용자별 출석 여부를 담는 데 걸리는 시간, FastAPI 기본 방식(jsonable_encoder + json.dumps)의
+직렬화 시간과 응답 크기를 형식별로 비교합니다.
+출석일이 무작위(60%)라 구간이 잘게 나뉘므로 ranges에는 불리한 데이터입니다.
+
+실행: python -m test.benchmarks.bench_attendance_format --users 1000 10000 --days 365
+"""
+import argparse
+import gc
+import json
+import time
+from datetime import timedelta
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+
+from app.services.stats_service import _calculate_user_stats, _get_active_mask
+from app.utils.bitset_utils import ATTENDANCE_FORMATS, decode_bitset, decode_ranges
+from test.benchmarks.bench_stats_matrix import START_DATE, make_users
+
+
+def run(num_users, num_days):
+    users = make_users(num_users, num_days)
+    active = _get_active_mask(users, START_DATE, num_days)
+    attended = (np.random.default_rng(42).random((num_users, num_days)) < 0.6) & active
+    dates = [(START_DATE + timedelta(days=i)).isoformat() for i in range(num_days)]
+
+    expected = None
+    for attendance_format in ATTENDANCE_FORMATS:
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            user_stats = _calculate_user_stats(users, attended, active, attendance_format)
+            build_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            body = json.dumps(jsonable_encoder({"dates": dates, "users": user_stats})).encode("utf-8")
+            serialize_seconds = time.perf_counter() - start
+        finally:
+            gc.enable()
+
+        # 모든 형식이 같은 출석 여부로 복원되는지 확인
+        first = user_stats[0]["attendance"]
+        decoded = {
+            "bitset": lambda: decode_bitset(first, num_days),
+            "ranges": lambda: decode_ranges(first, num_days),
+        }.get(attendance_format, lambda: first)()
+        expected = expected or decoded
+        assert decoded == expected
+
+        print(
+            f"users={num_users:6d} days={num_days} format={attendance_format:6s} "
+            f"build: {build_seconds * 1000:7.1f}ms | serialize: {serialize_seconds * 1000:8.1f}ms | "
+            f"payload: {len(body) / 1024:9.1f}KB"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+    for num_users in args.users:
+        run(num_users, args.days)
+
+
+if __name__ == "__main__":
+    main()
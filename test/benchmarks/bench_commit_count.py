@@ -0,0 +1,71 @@
+"""
+사용자 커밋 수 집계 벤치마크.
+
+커밋이 수천 개인 사용자에 대해 전체 행을 읽고 len()을 구하던 방식과
+COUNT 집계(count_user_commits)를 비교합니다.
+(github_id, commit_date) 복합 인덱스가 있을 때와 없을 때를 모두 측정합니다.
+
+실행: python -m test.benchmarks.bench_commit_count --commits-per-user 5000
+"""
+import argparse
+import time
+from datetime import date
+
+from sqlalchemy import Index
+
+from app.models.github_commit import GitHubCommit
+from app.services.github_service import apply_date_filters, count_user_commits
+from test.benchmarks.bench_utils import make_session, seed_users, seed_commits
+
+START_DATE = date(2025, 3, 10)
+
+
+def before(db, github_id, from_date, to_date):
+    query = db.query(GitHubCommit).filter(GitHubCommit.github_id == github_id)
+    query = apply_date_filters(query, from_date, to_date)
+    return len(query.all())
+
+
+def after(db, github_id, from_date, to_date):
+    return count_user_commits(db, github_id, from_date, to_date)
+
+
+def timeit(func, *args, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(*args)
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--commits-per-user", type=int, default=5000)
+    args = parser.parse_args()
+
+    days = 100
+    per_day = max(1, args.commits_per_user // days)
+    db = make_session()
+    github_ids = seed_users(db, args.users)
+    total = seed_commits(db, github_ids, START_DATE, days=days, commits_per_day=(per_day, per_day))
+    print(f"users={args.users} commits={total} (~{per_day * days} per user)")
+
+    github_id = github_ids[0]
+    ranges = {"1 day": (START_DATE, START_DATE), "whole season": (START_DATE, date(2025, 6, 17))}
+
+    for index_label in ("single-column indexes", "with (github_id, commit_date) index"):
+        if index_label.startswith("with"):
+            Index("ix_bench_github_id_commit_date", GitHubCommit.github_id, GitHubCommit.commit_date).create(db.get_bind())
+        db.expire_all()
+        print(f"[{index_label}]")
+        for label, (from_date, to_date) in ranges.items():
+            count_before, ms_before = timeit(before, db, github_id, from_date, to_date)
+            count_after, ms_after = timeit(after, db, github_id, from_date, to_date)
+            assert count_before == count_after
+            print(f"  {label:13s} count={count_after:5d} before(len(all()))={ms_before:8.2f}ms "
+                  f"after(COUNT)={ms_after:7.2f}ms speedup={ms_before / ms_after:6.1f}x")
+            db.expire_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+여러 사용자의 일별 커밋 수(커뮤니티 히트맵) 벤치마크.
+
+사용자마다 GET /api/github-commits/{github_id}/daily-counts를 호출하던 방식(커밋 집계 + 날짜별 0 채우기)과
+GET /api/github-commits/daily-counts 한 번으로 attendances.commit_count를 읽어 NumPy 배열로 채우는 방식을 비교합니다.
+
+실행: python -m test.benchmarks.bench_daily_counts --users 100 1000 --days 100
+"""
+import argparse
+import asyncio
+import json
+from datetime import date, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.sql import func
+
+from app.models.attendance import Attendance
+from app.models.github_commit import GitHubCommit
+from app.routers.github_commits import read_user_daily_commits, read_users_daily_commits
+from test.benchmarks.bench_utils import make_session, measure, seed_commits, seed_users
+
+START_DATE = date(2025, 3, 10)
+
+
+def seed_attendances_from_commits(db):
+    """커밋에서 (사용자, 날짜)별 출석 기록을 만듭니다."""
+    db.execute(insert(Attendance).from_select(
+        ["github_id", "attendance_date", "commit_count", "is_attended"],
+        select(
+            GitHubCommit.github_id, GitHubCommit.commit_date_kst, func.count(GitHubCommit.id), True
+        ).group_by(GitHubCommit.github_id, GitHubCommit.commit_date_kst)
+    ))
+    db.commit()
+
+
+def run(num_users, days):
+    db = make_session()
+    github_ids = seed_users(db, num_users)
+    seed_commits(db, github_ids, START_DATE, days)
+    seed_attendances_from_commits(db)
+    from_date, to_date = START_DATE.isoformat(), (START_DATE + timedelta(days=days - 1)).isoformat()
+
+    async def per_user():
+        return [await read_user_daily_commits(github_id, from_date, to_date, db) for github_id in github_ids]
+
+    with measure(db) as per_user_stats:
+        responses = asyncio.run(per_user())
+    with measure(db) as batch_stats:
+        batch = json.loads(asyncio.run(read_users_daily_commits(None, from_date, to_date, db)).body)
+
+    for response in responses:
+        assert list(response["daily_commits"].values()) == batch["daily_counts"][response["github_id"]]
+    print(
+        f"users={num_users:5d} days={days} "
+        f"per-user: {per_user_stats['queries']:5d} queries {per_user_stats['seconds'] * 1000:8.1f}ms | "
+        f"batch: {batch_stats['queries']:3d} queries {batch_stats['seconds'] * 1000:8.1f}ms | "
+        f"speedup={per_user_stats['seconds'] / batch_stats['seconds']:.1f}x"
+    )
+    db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--days", type=int, default=100)
+    args = parser.parse_args()
+    for num_users in args.users:
+        run(num_users, args.days)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+시간대별 커밋 분포(GET /api/attendance/hourly-commits) 벤치마크.
+
+기간 안의 커밋을 모두 스캔해 시간대별로 세던 이전 방식과
+수집 시 갱신되는 (KST 날짜, KST 시, github_id)별 집계를 합산하는 현재 방식을 비교합니다.
+
+실행: python -m test.benchmarks.bench_hourly_commits --users 100 500 --days 100
+"""
+import argparse
+from datetime import date, timedelta
+
+from sqlalchemy.sql import func
+
+from app.models.github_commit import GitHubCommit
+from app.services.commit_rollup_service import get_hourly_commit_counts, rebuild_commit_hourly_rollups
+from test.benchmarks.bench_utils import make_session, measure, seed_commits, seed_users
+
+START_DATE = date(2025, 3, 10)
+
+
+def hourly_from_commits(db, start, end):
+    """이전 구현: 기간 안의 커밋을 시간대별로 집계합니다."""
+    rows = db.query(
+        GitHubCommit.commit_hour_kst.label('hour'),
+        func.count().label('count')
+    ).filter(
+        GitHubCommit.commit_date_kst >= start,
+        GitHubCommit.commit_date_kst <= end
+    ).group_by(GitHubCommit.commit_hour_kst).order_by(GitHubCommit.commit_hour_kst).all()
+
+    hourly_data = {hour: 0 for hour in range(24)}
+    for hour, count in rows:
+        hourly_data[hour] = count
+    return [{"hour": hour, "count": count} for hour, count in hourly_data.items()]
+
+
+def run(num_users, days):
+    db = make_session()
+    num_commits = seed_commits(db, seed_users(db, num_users), START_DATE, days, commits_per_day=(0, 6))
+    rebuild_commit_hourly_rollups(db)
+    db.commit()
+    end_date = START_DATE + timedelta(days=days - 1)
+
+    with measure(db) as scan_stats:
+        expected = hourly_from_commits(db, START_DATE, end_date)
+    with measure(db) as rollup_stats:
+        hourly = get_hourly_commit_counts(db, START_DATE, end_date)
+
+    assert hourly == expected
+    print(
+        f"users={num_users:4d} days={days} commits={num_commits:7d} "
+        f"commit scan: {scan_stats['seconds'] * 1000:8.1f}ms | "
+        f"rollup: {rollup_stats['seconds'] * 1000:8.1f}ms | "
+        f"speedup={scan_stats['seconds'] / rollup_stats['seconds']:.1f}x"
+    )
+    db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--days", type=int, default=100)
+    args = parser.parse_args()
+    for num_users in args.users:
+        run(num_users, args.days)
+
+
+if __name__ == "__main__":
+    main()
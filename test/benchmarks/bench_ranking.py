@@ -0,0 +1,63 @@
+"""
+출석률 순위(GET /api/attendance/ranking) 벤치마크.
+
+출석 통계 전체(사용자 × 날짜 출석 배열)를 만든 뒤 순위를 잘라내던 이전 방식과
+SQL 집계 + RANK() 윈도 함수로 상위 N명만 가져오는 현재 방식을 비교합니다.
+
+실행: python -m test.benchmarks.bench_ranking --users 1000 5000 --days 100
+"""
+import argparse
+import random
+from datetime import date, timedelta
+
+from app.models.attendance import Attendance
+from app.services.ranking_service import get_ranking
+from app.services.stats_service import build_attendance_stats
+from test.benchmarks.bench_utils import make_session, measure, seed_users
+
+START_DATE = date(2025, 3, 10)
+TOP_N = 10
+
+
+def seed_attendances(db, github_ids, days, seed=42):
+    """사용자별로 날짜마다 60% 확률로 출석 기록을 만듭니다."""
+    rng = random.Random(seed)
+    db.bulk_insert_mappings(Attendance, [
+        {"github_id": github_id, "attendance_date": START_DATE + timedelta(days=day), "commit_count": 1, "is_attended": True}
+        for github_id in github_ids for day in range(days) if rng.random() < 0.6
+    ])
+    db.commit()
+
+
+def run(num_users, days):
+    db = make_session()
+    seed_attendances(db, seed_users(db, num_users), days)
+    end_date = START_DATE + timedelta(days=days - 1)
+
+    with measure(db) as stats_stats:
+        stats = build_attendance_stats(db, START_DATE, end_date)
+        top_from_stats = stats["users"][:TOP_N]
+    with measure(db) as sql_stats:
+        top = get_ranking(db, START_DATE, end_date, limit=TOP_N)
+
+    assert [u["attendance_rate"] for u in top] == [u["attendance_rate"] for u in top_from_stats]
+    print(
+        f"users={num_users:5d} days={days} top {TOP_N} "
+        f"full stats: {stats_stats['queries']:3d} queries {stats_stats['seconds'] * 1000:8.1f}ms | "
+        f"SQL rank: {sql_stats['queries']:3d} queries {sql_stats['seconds'] * 1000:8.1f}ms | "
+        f"speedup={stats_stats['seconds'] / sql_stats['seconds']:.1f}x"
+    )
+    db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--days", type=int, default=100)
+    args = parser.parse_args()
+    for num_users in args.users:
+        run(num_users, args.days)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+특정 날짜 출석 일괄 계산 벤치마크.
+
+사용자별 루프(create_attendance_from_db_commits)와
+GROUP BY 1회 + upsert 1회로 처리하는 create_attendance_from_commits를 비교합니다.
+
+실행: python -m test.benchmarks.bench_recompute_attendance --users 100 1000
+"""
+import argparse
+import asyncio
+from datetime import date
+
+from app.models.user import User
+from app.services.attendance_service import create_attendance_from_db_commits, create_attendance_from_commits
+from test.benchmarks.bench_utils import make_session, measure, seed_users, seed_commits
+
+CHECK_DATE = date(2025, 3, 14)
+
+
+async def per_user_loop(db, check_date):
+    results = []
+    for user in db.query(User).all():
+        results.append(await create_attendance_from_db_commits(user.github_id, check_date, db))
+    return results
+
+
+async def run(num_users):
+    db = make_session()
+    github_ids = seed_users(db, num_users)
+    seed_commits(db, github_ids, CHECK_DATE, days=1)
+
+    with measure(db) as loop_stats:
+        loop_results = await per_user_loop(db, CHECK_DATE)
+    with measure(db) as set_stats:
+        set_results = (await create_attendance_from_commits(db, CHECK_DATE))["results"]
+
+    # 일괄 계산은 커밋이 있는 사용자만 돌려주고, 나머지는 사용자별 루프에서도 커밋 0건
+    key = lambda r: r["github_id"]
+    set_ids = {key(r) for r in set_results}
+    assert sorted((r for r in loop_results if key(r) in set_ids), key=key) == sorted(set_results, key=key)
+    assert all(r["commit_count"] == 0 for r in loop_results if key(r) not in set_ids)
+
+    print(
+        f"users={num_users:5d} "
+        f"loop: {loop_stats['queries']:6d} queries {loop_stats['seconds'] * 1000:9.1f}ms | "
+        f"set-based: {set_stats['queries']:3d} queries {set_stats['seconds'] * 1000:8.1f}ms | "
+        f"speedup={loop_stats['seconds'] / set_stats['seconds']:.1f}x"
+    )
+    db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 1000])
+    args = parser.parse_args()
+    for num_users in args.users:
+        asyncio.run(run(num_users))
+
+
+if __name__ == "__main__":
+    main()
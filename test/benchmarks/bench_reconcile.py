@@ -0,0 +1,75 @@
+"""
+출석 기록 대사 벤치마크.
+
+출석 행을 파이썬에서 만들어 비교하는 방식(derive_attendance_rows + diff_attendance_rows)과
+SQL anti-join 한 번으로 차이만 가져오는 find_attendance_mismatches를 시즌 전체 기간으로 비교합니다.
+
+실행: python -m test.benchmarks.bench_reconcile --users 100 1000
+"""
+import argparse
+import random
+from datetime import date, timedelta
+
+from app.models.attendance import Attendance
+from app.services.attendance_service import (
+    derive_attendance_rows,
+    diff_attendance_rows,
+    find_attendance_mismatches,
+    recompute_attendance_range,
+)
+from test.benchmarks.bench_utils import make_session, measure, seed_users, seed_commits
+
+START_DATE = date(2025, 3, 10)
+DAYS = 100
+DRIFTED_ROWS = 50
+
+
+def add_drift(db, seed=7):
+    """출석 기록 일부를 커밋 수와 어긋나게 바꾸거나 지웁니다."""
+    rng = random.Random(seed)
+    ids = [attendance_id for (attendance_id,) in db.query(Attendance.id).all()]
+    for attendance_id in rng.sample(ids, DRIFTED_ROWS):
+        query = db.query(Attendance).filter(Attendance.id == attendance_id)
+        if rng.random() < 0.5:
+            query.delete(synchronize_session=False)
+        else:
+            query.update({Attendance.commit_count: Attendance.commit_count + 1}, synchronize_session=False)
+    db.commit()
+
+
+def run(num_users):
+    db = make_session()
+    github_ids = seed_users(db, num_users)
+    seed_commits(db, github_ids, START_DATE, DAYS)
+    end_date = START_DATE + timedelta(days=DAYS - 1)
+    recompute_attendance_range(db, START_DATE, end_date)
+    db.commit()
+    add_drift(db)
+
+    with measure(db) as diff_stats:
+        diffs = diff_attendance_rows(db, derive_attendance_rows(db, START_DATE, end_date), START_DATE, end_date)
+    with measure(db) as sql_stats:
+        mismatches = find_attendance_mismatches(db, START_DATE, end_date)
+
+    # 두 방식은 같은 칸(커밋이 있는 칸, 0으로 되돌릴 칸)을 비교하므로 결과가 같아야 함
+    assert diffs == mismatches
+
+    print(
+        f"users={num_users:5d} days={DAYS} "
+        f"derive+diff: {diff_stats['queries']:3d} queries {diff_stats['seconds'] * 1000:8.1f}ms | "
+        f"anti-join: {sql_stats['queries']:3d} queries {sql_stats['seconds'] * 1000:8.1f}ms "
+        f"({len(mismatches)} mismatches) | speedup={diff_stats['seconds'] / sql_stats['seconds']:.1f}x"
+    )
+    db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 1000])
+    args = parser.parse_args()
+    for num_users in args.users:
+        run(num_users)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+출석 통계 응답(GET /api/attendance/stats) 직렬화와 압축 벤치마크.
+
+- json: 이전 기본 응답(JSONResponse) - jsonable_encoder + 표준 json
+- orjson: 현재 기본 응답(ORJSONResponse) - jsonable_encoder + orjson
+- orjson direct: 버전 캐시 응답 - jsonable_encoder 없이 orjson으로 바로 직렬화 (캐시 적중 시에는 이 비용도 없음)
+응답 크기는 압축 전과 gzip 압축 후(response.gzip_compresslevel, GZipMiddleware 기본값 9)를 비교합니다.
+
+실행: python -m test.benchmarks.bench_response_encoding --users 1000 10000 --days 365
+"""
+import argparse
+import gc
+import gzip
+import time
+from datetime import timedelta
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.services.stats_service import (
+    _calculate_attendance_summary,
+    _calculate_daily_rates,
+    _calculate_user_stats,
+    _get_active_mask,
+)
+from app.utils.compression_utils import GZIP_COMPRESSLEVEL
+from test.benchmarks.bench_stats_matrix import START_DATE, make_users
+
+ENCODERS = {
+    "json": lambda content: JSONResponse(jsonable_encoder(content)).body,
+    "orjson": lambda content: ORJSONResponse(jsonable_encoder(content)).body,
+    "orjson direct": lambda content: ORJSONResponse(content).body,
+}
+
+
+def build_stats(num_users, num_days, attendance_format):
+    """출석 통계 응답과 같은 구조의 내용을 만듭니다."""
+    users = make_users(num_users, num_days)
+    date_list = [(START_DATE + timedelta(days=i)).isoformat() for i in range(num_days)]
+    active = _get_active_mask(users, START_DATE, num_days)
+    attended = (np.random.default_rng(42).random((num_users, num_days)) < 0.6) & active
+    return {
+        "start_date": date_list[0],
+        "end_date": date_list[-1],
+        "dates": date_list,
+        "users": _calculate_user_stats(users, attended, active, attendance_format),
+        "daily_rates": _calculate_daily_rates(date_list, attended, active),
+        **_calculate_attendance_summary(attended, active)
+    }
+
+
+def run(num_users, num_days, attendance_format):
+    content = build_stats(num_users, num_days, attendance_format)
+    for name, encode in ENCODERS.items():
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            body = encode(content)
+            encode_seconds = time.perf_counter() - start
+        finally:
+            gc.enable()
+
+        sizes = []
+        for compresslevel in (GZIP_COMPRESSLEVEL, 9):
+            start = time.perf_counter()
+            compressed = gzip.compress(body, compresslevel=compresslevel)
+            sizes.append(f"gzip-{compresslevel}: {len(compressed) / 1024:7.1f}KB ({(time.perf_counter() - start) * 1000:6.1f}ms)")
+
+        print(
+            f"users={num_users:6d} days={num_days} format={attendance_format:6s} {name:13s} "
+            f"serialize: {encode_seconds * 1000:8.1f}ms | raw: {len(body) / 1024:8.1f}KB | " + " | ".join(sizes)
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--formats", nargs="+", default=["list", "bitset"])
+    args = parser.parse_args()
+    for num_users in args.users:
+        for attendance_format in args.formats:
+            run(num_users, args.days, attendance_format)
+
+
+if __name__ == "__main__":
+    main()
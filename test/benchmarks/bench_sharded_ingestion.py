@@ -0,0 +1,95 @@
+"""
+분산 수집 워커 벤치마크.
+
+여러 로컬 프로세스가 하나의 SQLite 파일(또는 --db-url로 지정한 PostgreSQL)을 공유하며
+샤드 리스를 나눠 갖는지, 워커 수에 비례해 전체 수행 시간이 줄어드는지 확인합니다.
+GitHub API 호출은 고정 지연(--latency)으로 대체합니다.
+
+실행: python -m test.benchmarks.bench_sharded_ingestion --users 200 --workers 1 2 4
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+from datetime import date
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.github_commit import GitHubCommit
+from app.models.ingestion_shard_lease import IngestionShardLease
+from app.models.user import User
+
+CHECK_DATE = date(2025, 3, 14)
+
+
+def _make_session(db_url):
+    connect_args = {"timeout": 30} if db_url.startswith("sqlite") else {}
+    engine = create_engine(db_url, connect_args=connect_args)
+    return sessionmaker(bind=engine)()
+
+
+def _worker_process(db_url, run_id, worker_id, num_shards, latency):
+    from app.services.shard_service import run_ingestion_worker
+
+    async def fake_fetch(db, github_id, check_date, api_token=None, **kwargs):
+        await asyncio.sleep(latency)
+        return {"github_id": github_id, "status": "no_commits"}
+
+    db = _make_session(db_url)
+    try:
+        with patch("app.services.attendance_service.fetch_and_save_commits", side_effect=fake_fetch):
+            asyncio.run(run_ingestion_worker(db, CHECK_DATE, worker_id, run_id=run_id, num_shards=num_shards))
+    finally:
+        db.close()
+
+
+def run(db_url, num_workers, num_shards, latency):
+    run_id = f"bench-{num_workers}-{time.time_ns()}"
+    processes = [
+        multiprocessing.Process(target=_worker_process, args=(db_url, run_id, f"w{i}", num_shards, latency))
+        for i in range(num_workers)
+    ]
+
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db-url", type=str, default=None)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.1, help="사용자별 GitHub 호출 지연 (초)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    db_url = args.db_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    engine = create_engine(db_url)
+    Base.metadata.create_all(engine, tables=[
+        User.__table__, GitHubCommit.__table__, Attendance.__table__, IngestionShardLease.__table__
+    ])
+    db = sessionmaker(bind=engine)()
+    if db.query(User).count() == 0:
+        db.add_all([User(github_id=f"bench-user-{i}") for i in range(args.users)])
+        db.commit()
+    db.close()
+
+    baseline = None
+    for num_workers in args.workers:
+        elapsed = run(db_url, num_workers, args.shards, args.latency)
+        baseline = baseline or elapsed
+        print(f"workers={num_workers:2d} users={args.users} elapsed={elapsed:6.2f}s speedup={baseline / elapsed:4.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+출석 통계 계산(GET /api/attendance/stats) 벤치마크.
+
+사용자 × 날짜를 파이썬 리스트로 순회하던 이전 방식과
+(사용자 수, 일수) NumPy 불리언 배열의 벡터 연산으로 계산하는 현재 방식을 비교합니다.
+DB 조회는 제외하고 계산만 측정하며, 두 방식의 결과가 같은지 확인합니다.
+
+실행: python -m test.benchmarks.bench_stats_matrix --users 10000 --days 365
+"""
+import argparse
+import gc
+import random
+import time
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.services.stats_service import (
+    _calculate_attendance_summary,
+    _calculate_daily_rates,
+    _calculate_user_stats,
+    _get_active_mask,
+)
+from app.services.participant_service import get_active_window, in_window
+
+START_DATE = date(2025, 3, 10)
+INACTIVE_RATIO = 0.05
+
+
+def make_users(num_users, num_days, seed=42):
+    """사용자를 만듭니다. 일부는 시즌 중간에 참여를 그만둔 사용자입니다."""
+    rng = random.Random(seed)
+    users = []
+    for i in range(num_users):
+        user = SimpleNamespace(github_id=f"user{i}", is_active=True, activated_at=None, deactivated_at=None)
+        if rng.random() < INACTIVE_RATIO:
+            user.is_active = False
+            user.activated_at = datetime.combine(START_DATE, datetime.min.time())
+            user.deactivated_at = user.activated_at + timedelta(days=rng.randrange(num_days))
+        users.append(user)
+    return users
+
+
+def python_lists(users, date_list, attendance_lists):
+    """이전 구현: 사용자 × 날짜 리스트 순회"""
+    dates = [date.fromisoformat(d) for d in date_list]
+    active_days = {}
+    for user in users:
+        window = get_active_window(user.is_active, user.activated_at, user.deactivated_at)
+        if window != (None, None):
+            active_days[user.github_id] = [in_window(d, window) for d in dates]
+
+    user_stats = []
+    for user in users:
+        attendance_list = attendance_lists.get(user.github_id) or [False] * len(date_list)
+        total_days = len(date_list)
+        user_active_days = active_days.get(user.github_id)
+        if user_active_days is not None:
+            attendance_list = [a and active for a, active in zip(attendance_list, user_active_days)]
+            total_days = sum(user_active_days)
+        attended_count = sum(1 for a in attendance_list if a)
+        user_stats.append({
+            "github_id": user.github_id,
+            "attendance_rate": round(attended_count / total_days * 100) if total_days else 0,
+            "attended_count": attended_count,
+            "total_days": total_days,
+            "attendance": attendance_list
+        })
+    user_stats.sort(key=lambda x: x["attendance_rate"], reverse=True)
+    for i, user in enumerate(user_stats):
+        user["rank"] = i + 1
+
+    daily_rates = []
+    for i, d in enumerate(date_list):
+        attended_count = sum(1 for user in user_stats if user["attendance"][i])
+        num_users = len(users) - sum(1 for days in active_days.values() if not days[i])
+        daily_rates.append({"date": d, "rate": round(attended_count / num_users * 100) if num_users else 0})
+
+    total_present = sum(user["attended_count"] for user in user_stats)
+    total_possible = sum(user["total_days"] for user in user_stats)
+    return user_stats, daily_rates, (total_present, total_possible - total_present)
+
+
+def numpy_matrix(users, date_list, attended):
+    """현재 구현: NumPy 불리언 배열"""
+    active = _get_active_mask(users, START_DATE, len(date_list))
+    attended = attended & active
+    user_stats = _calculate_user_stats(users, attended, active)
+    daily_rates = _calculate_daily_rates(date_list, attended, active)
+    summary = _calculate_attendance_summary(attended, active)
+    return user_stats, daily_rates, (summary["total_present"], summary["total_absent"])
+
+
+def run(num_users, num_days):
+    users = make_users(num_users, num_days)
+    date_list = [(START_DATE + timedelta(days=i)).isoformat() for i in range(num_days)]
+    attended = np.random.default_rng(42).random((num_users, num_days)) < 0.6
+    attendance_lists = {user.github_id: row for user, row in zip(users, attended.tolist())}
+
+    # 앞서 만든 객체들의 가비지 컬렉션이 측정에 끼어들지 않도록 GC를 끄고 측정
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        expected = python_lists(users, date_list, attendance_lists)
+        python_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = numpy_matrix(users, date_list, attended)
+        numpy_seconds = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    assert actual == expected
+    print(
+        f"users={num_users:6d} days={num_days} "
+        f"python lists: {python_seconds * 1000:8.1f}ms | numpy: {numpy_seconds * 1000:8.1f}ms | "
+        f"speedup={python_seconds / numpy_seconds:.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+    # NumPy 첫 호출의 초기화 비용은 측정에서 제외
+    run(10, 10)
+    for num_users in args.users:
+        run(num_users, args.days)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""벤치마크 공용 도구"""
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.github_commit import GitHubCommit
+from app.models.user import User
+
+
+def make_session(db_url="sqlite:///:memory:"):
+    """벤치마크용 세션을 만들고 모든 테이블을 생성합니다."""
+    engine = create_engine(db_url)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+@contextmanager
+def measure(db):
+    """블록 안에서 실행된 SQL 문 수와 경과 시간을 측정합니다."""
+    stats = {"queries": 0, "seconds": 0.0}
+
+    def count(*args, **kwargs):
+        stats["queries"] += 1
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats["seconds"] = time.perf_counter() - start
+        event.remove(engine, "before_cursor_execute", count)
+
+
+def seed_users(db, num_users, prefix="user"):
+    """사용자를 생성하고 GitHub ID 목록을 반환합니다."""
+    github_ids = [f"{prefix}{i}" for i in range(num_users)]
+    db.bulk_insert_mappings(User, [{"github_id": github_id} for github_id in github_ids])
+    db.commit()
+    return github_ids
+
+
+def seed_commits(db, github_ids, start_date, days, commits_per_day=(0, 3), seed=42):
+    """사용자별로 날짜마다 임의 개수의 커밋을 생성합니다. (commit_date는 UTC 기준)"""
+    rng = random.Random(seed)
+    rows = []
+    for github_id in github_ids:
+        for day in range(days):
+            base = datetime.combine(start_date + timedelta(days=day), datetime.min.time()) - timedelta(hours=9)
+            for n in range(rng.randint(*commits_per_day)):
+                rows.append({
+                    "github_id": github_id,
+                    "commit_id": f"{github_id}-{day}-{n}",
+                    "repository": f"{github_id}/repo",
+                    "message": "bench commit " + "x" * 200,
+                    "commit_url": f"https://github.com/{github_id}/repo/commit/{day}-{n}",
+                    "commit_date": base + timedelta(minutes=rng.randint(0, 24 * 60 - 1)),
+                    "is_private": False,
+                })
+    db.bulk_insert_mappings(GitHubCommit, rows)
+    db.commit()
+    return len(rows)
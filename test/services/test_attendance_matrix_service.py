@@ -0,0 +1,166 @@
+import json
+from datetime import datetime, timedelta
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from fastapi import HTTPException
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.attendance_matrix import AttendanceMatrix
+from app.models.user import User
+from app.routers.github_commits import read_users_daily_commits
+from app.services.participant_service import set_user_active
+from app.services.stats_service import build_attendance_stats, resolve_date_range
+from app.services.attendance_matrix_service import (
+    refresh_attendance_matrix,
+    rebuild_attendance_matrix,
+    load_attendance_array,
+    load_daily_attended_counts,
+    load_commit_count_array,
+)
+from app.utils.date_utils import get_project_period
+
+SEASON_START, SEASON_END = get_project_period()
+
+
+def day(n):
+    return SEASON_START + timedelta(days=n)
+
+
+class TestAttendanceMatrix(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+
+        self.db.add_all([User(github_id="alice"), User(github_id="bob"), User(github_id="carol")])
+        self.db.add_all([
+            Attendance(github_id="alice", attendance_date=day(0), commit_count=1, is_attended=True),
+            Attendance(github_id="alice", attendance_date=day(2), commit_count=3, is_attended=True),
+            Attendance(github_id="bob", attendance_date=day(2), commit_count=1, is_attended=True),
+            Attendance(github_id="bob", attendance_date=day(3), commit_count=0, is_attended=False),
+        ])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    def set_attendance(self, github_id, d, is_attended):
+        attendance = self.db.query(Attendance).filter(
+            Attendance.github_id == github_id, Attendance.attendance_date == d
+        ).first()
+        if attendance is None:
+            self.db.add(Attendance(github_id=github_id, attendance_date=d, commit_count=1, is_attended=is_attended))
+        else:
+            attendance.is_attended = is_attended
+        self.db.flush()
+        refresh_attendance_matrix(self.db, [(github_id, d)])
+        self.db.commit()
+
+    def test_matrix_is_missing_until_built(self):
+        self.assertIsNone(load_attendance_array(self.db, SEASON_START, 5, ["alice"]))
+
+    def test_refresh_builds_missing_rows_from_whole_season(self):
+        """매트릭스 행이 없는 사용자는 처음 변경될 때 시즌 전체가 채워진다"""
+        self.set_attendance("alice", day(4), True)
+
+        attended = load_attendance_array(self.db, SEASON_START, 5, ["alice"])
+        self.assertEqual(attended.tolist(), [[True, False, True, False, True]])
+        self.assertEqual(load_daily_attended_counts(self.db, day(0), day(4)), {day(0): 1, day(2): 2, day(4): 1})
+
+    def test_refresh_updates_only_touched_cells(self):
+        rebuild_attendance_matrix(self.db)
+        self.db.commit()
+
+        self.set_attendance("bob", day(3), True)
+        self.set_attendance("alice", day(0), False)
+
+        # 행 순서는 요청한 사용자 순서, 매트릭스 행이 없는 사용자는 모두 미출석
+        attended = load_attendance_array(self.db, day(0), 4, ["bob", "alice", "carol", "dave"])
+        self.assertEqual(attended.tolist(), [
+            [False, False, True, True],
+            [False, False, True, False],
+            [False, False, False, False],
+            [False, False, False, False],
+        ])
+
+        counts = load_daily_attended_counts(self.db, day(0), day(3))
+        self.assertEqual(counts[day(0)], 0)
+        self.assertEqual(counts[day(3)], 1)
+
+        alice = self.db.query(AttendanceMatrix).filter(AttendanceMatrix.github_id == "alice").one()
+        self.assertEqual(alice.attended_count, 1)
+
+    def test_daily_counts_exclude_attendance_outside_participation(self):
+        """참여를 그만둔 뒤의 출석은 날짜별 출석 인원에서 빠져 출석률 분모와 기준이 같다"""
+        bob = self.db.query(User).filter(User.github_id == "bob").one()
+        bob.activated_at = None
+        # day(2) KST 10:00에 참여 종료, 그 뒤 day(3)에 들어온 출석
+        set_user_active(self.db, bob, False, now=datetime.combine(day(2), datetime.min.time()) + timedelta(hours=1))
+        self.set_attendance("bob", day(3), True)
+        rebuild_attendance_matrix(self.db)
+        self.db.commit()
+
+        counts = load_daily_attended_counts(self.db, day(0), day(3))
+        self.assertEqual((counts[day(2)], counts[day(3)]), (2, 0))
+        stats = build_attendance_stats(self.db, day(0), day(3))
+        self.assertEqual([r["rate"] for r in stats["daily_rates"]], [33, 0, 67, 0])
+
+    def test_range_outside_season_is_not_served(self):
+        rebuild_attendance_matrix(self.db)
+        self.db.commit()
+        self.assertIsNone(load_attendance_array(self.db, SEASON_START - timedelta(days=1), 3, ["alice"]))
+        self.assertIsNone(load_attendance_array(self.db, SEASON_END, 2, ["alice"]))
+
+    def test_stats_from_matrix_match_direct_query(self):
+        """읽기 모델로 만든 통계와 attendances 직접 조회로 만든 통계가 같다"""
+        start, end = resolve_date_range(None, None)
+        expected = build_attendance_stats(self.db, start, end)
+
+        rebuild_attendance_matrix(self.db)
+        self.db.commit()
+        actual = build_attendance_stats(self.db, start, end)
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual["users"][0]["github_id"], "alice")
+
+    def test_commit_count_array_is_zero_filled(self):
+        counts = load_commit_count_array(self.db, day(0), 4, ["bob", "alice", "dave"])
+        self.assertEqual(counts.tolist(), [[0, 0, 1, 0], [1, 0, 3, 0], [0, 0, 0, 0]])
+        self.assertEqual(
+            load_commit_count_array(self.db, day(1), 2, ["alice", "bob", "carol"], all_users=True).tolist(),
+            [[0, 3], [0, 1], [0, 0]]
+        )
+
+    async def test_batch_daily_counts(self):
+        response = await read_users_daily_commits(None, day(0).isoformat(), day(2).isoformat(), self.db)
+        self.assertEqual(json.loads(response.body), {
+            "from_date": day(0).isoformat(),
+            "to_date": day(2).isoformat(),
+            "daily_counts": {"alice": [1, 0, 3], "bob": [0, 0, 1], "carol": [0, 0, 0]}
+        })
+
+        response = await read_users_daily_commits(["bob", "bob"], day(2).isoformat(), day(2).isoformat(), self.db)
+        self.assertEqual(json.loads(response.body)["daily_counts"], {"bob": [1]})
+
+        with self.assertRaises(HTTPException):
+            await read_users_daily_commits(None, day(2).isoformat(), day(0).isoformat(), self.db)
+
+    async def test_batch_daily_counts_are_bounded(self):
+        # 기간은 시즌 기간으로 잘림
+        response = await read_users_daily_commits(["alice"], "1900-01-01", day(1).isoformat(), self.db)
+        body = json.loads(response.body)
+        self.assertEqual((body["from_date"], body["daily_counts"]), (SEASON_START.isoformat(), {"alice": [1, 0]}))
+
+        # 등록되지 않은 사용자는 빈 행 대신 따로 알려 줌
+        response = await read_users_daily_commits(["alice", "nobody"], day(0).isoformat(), day(0).isoformat(), self.db)
+        body = json.loads(response.body)
+        self.assertEqual((body["daily_counts"], body["unknown_github_ids"]), ({"alice": [1]}, ["nobody"]))
+
+        with patch("app.routers.github_commits.DAILY_COUNTS_MAX_USERS", 2), self.assertRaises(HTTPException) as context:
+            await read_users_daily_commits(["alice", "bob", "carol"], None, None, self.db)
+        self.assertEqual(context.exception.status_code, 400)
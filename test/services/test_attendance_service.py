@@ -1,9 +1,30 @@
 import os
 import unittest
-from datetime import date
+from datetime import date, datetime
+from unittest.mock import patch
 
-from app.database import get_db
-from app.services.attendance_service import check_user_commit_and_save
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_db, Base
+from app.models.attendance import Attendance
+from app.models.github_commit import GitHubCommit
+from app.models.github_commit_key import GitHubCommitKey
+from app.models.user import User
+from app.services.github_service import commit_fetch_cache
+from app.services.attendance_service import (
+    check_user_commit_and_save,
+    create_attendance_from_db_commits,
+    create_attendance_from_commits,
+    daily_stats_cache,
+    derive_attendance_rows,
+    diff_attendance_rows,
+    find_attendance_mismatches,
+    get_daily_attendance_stats,
+    on_attendance_changed,
+    recompute_attendance_range,
+    repair_attendance_mismatches,
+)
 
 
 class TestAttendanceService(unittest.IsolatedAsyncioTestCase):
@@ -20,5 +41,321 @@ class TestAttendanceService(unittest.IsolatedAsyncioTestCase):
         print(result)
 
 
+def make_commit(github_id, commit_id, commit_date):
+    return GitHubCommit(
+        github_id=github_id,
+        commit_id=commit_id,
+        repository=f"{github_id}/repo",
+        message=f"commit {commit_id}",
+        commit_url=f"https://github.com/{github_id}/repo/commit/{commit_id}",
+        commit_date=commit_date,
+        is_private=False
+    )
+
+
+class TestCreateAttendanceFromCommits(unittest.IsolatedAsyncioTestCase):
+    """커밋 기반 출석 일괄 계산 테스트 (SQLite 메모리 DB)"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.check_date = date(2025, 3, 14)
+
+        self.db.add_all([User(github_id="alice"), User(github_id="bob"), User(github_id="carol")])
+        self.db.add_all([
+            # KST 2025-03-14 00:30 (UTC 03-13 15:30)
+            make_commit("alice", "a1", datetime(2025, 3, 13, 15, 30)),
+            make_commit("alice", "a2", datetime(2025, 3, 14, 10, 0)),
+            make_commit("bob", "b1", datetime(2025, 3, 14, 14, 59)),
+            # KST 2025-03-15 00:00 (다음 날)
+            make_commit("bob", "b2", datetime(2025, 3, 14, 15, 0)),
+        ])
+        # 커밋과 어긋난 기존 출석 기록
+        self.db.add(Attendance(github_id="carol", attendance_date=self.check_date, commit_count=5, is_attended=True))
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    async def test_set_based_recompute_matches_per_user_loop(self):
+        result = await create_attendance_from_commits(self.db, self.check_date)
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(
+            [(r["github_id"], r["commit_count"], r["is_attended"]) for r in result["results"]],
+            [("alice", 2, True), ("bob", 1, True), ("carol", 0, False)]
+        )
+
+        for github_id in ("alice", "bob", "carol"):
+            expected = await create_attendance_from_db_commits(github_id, self.check_date, self.db)
+            actual = next(r for r in result["results"] if r["github_id"] == github_id)
+            self.assertEqual(actual, expected)
+
+        self.assertEqual(self.db.query(Attendance).count(), 3)
+
+    async def test_recompute_is_idempotent(self):
+        await create_attendance_from_commits(self.db, self.check_date)
+        await create_attendance_from_commits(self.db, self.check_date)
+
+        rows = self.db.query(Attendance).order_by(Attendance.github_id).all()
+        self.assertEqual([(r.github_id, r.commit_count) for r in rows], [("alice", 2), ("bob", 1), ("carol", 0)])
+
+    def test_range_recompute_assigns_kst_dates(self):
+        start, end = date(2025, 3, 13), date(2025, 3, 15)
+        rows = derive_attendance_rows(self.db, start, end)
+
+        # 커밋이 있는 칸과 0으로 되돌릴 칸만 만든다
+        self.assertEqual(
+            [(r["attendance_date"], r["github_id"], r["commit_count"]) for r in rows],
+            [
+                (date(2025, 3, 14), "alice", 2),
+                (date(2025, 3, 14), "bob", 1),
+                (date(2025, 3, 14), "carol", 0),
+                (date(2025, 3, 15), "bob", 1),
+            ]
+        )
+
+    def test_dry_run_diff_then_recompute(self):
+        start, end = date(2025, 3, 14), date(2025, 3, 15)
+        diffs = diff_attendance_rows(self.db, derive_attendance_rows(self.db, start, end), start, end)
+        self.assertIn(("carol", date(2025, 3, 14), 5, 0), [
+            (d["github_id"], d["attendance_date"], d["stored_commit_count"], d["commit_count"]) for d in diffs
+        ])
+        # dry run은 아무것도 저장하지 않음
+        self.assertEqual(self.db.query(Attendance).count(), 1)
+
+        # dry run과 대사가 같은 칸을 차이로 본다
+        self.assertEqual(diffs, find_attendance_mismatches(self.db, start, end))
+
+        changed = recompute_attendance_range(self.db, start, end)
+        self.db.commit()
+
+        self.assertEqual(changed, diffs)
+        self.assertEqual(self.db.query(Attendance).count(), 4)
+        self.assertEqual(diff_attendance_rows(self.db, derive_attendance_rows(self.db, start, end), start, end), [])
+
+    def test_recompute_refreshes_only_changed_cells(self):
+        start, end = date(2025, 3, 14), date(2025, 3, 15)
+        recompute_attendance_range(self.db, start, end)
+        self.db.commit()
+        self.db.add(make_commit("alice", "a3", datetime(2025, 3, 15, 1, 0)))
+        self.db.commit()
+
+        with patch("app.services.attendance_service.on_attendance_changed") as changed:
+            self.assertEqual(
+                [(r["github_id"], r["attendance_date"]) for r in recompute_attendance_range(self.db, start, end)],
+                [("alice", date(2025, 3, 15))]
+            )
+        changed.assert_called_once_with(self.db, [("alice", date(2025, 3, 15))])
+
+        self.db.commit()
+        with patch("app.services.attendance_service.on_attendance_changed") as changed:
+            self.assertEqual(recompute_attendance_range(self.db, start, end), [])
+        changed.assert_called_once_with(self.db, [])
+
+    def test_recompute_skips_users_outside_participation(self):
+        carol = self.db.query(User).filter(User.github_id == "carol").one()
+        carol.is_active = False
+        carol.deactivated_at = datetime(2025, 3, 1)
+        self.db.commit()
+        start, end = date(2025, 3, 14), date(2025, 3, 15)
+
+        self.assertNotIn("carol", [r["github_id"] for r in derive_attendance_rows(self.db, start, end)])
+        self.assertNotIn("carol", [r["github_id"] for r in find_attendance_mismatches(self.db, start, end)])
+
+
+    def test_reconciliation_finds_and_repairs_drift_in_one_query(self):
+        self.db.add_all([
+            Attendance(github_id="alice", attendance_date=date(2025, 3, 14), commit_count=1, is_attended=True),
+            Attendance(github_id="bob", attendance_date=date(2025, 3, 15), commit_count=1, is_attended=True),
+            # 커밋 없는 날의 빈 출석 행은 차이가 아님
+            Attendance(github_id="carol", attendance_date=date(2025, 3, 15), commit_count=0, is_attended=False),
+        ])
+        self.db.commit()
+        start, end = date(2025, 3, 14), date(2025, 3, 15)
+
+        queries = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args, **kwargs: queries.append(1))
+        mismatches = find_attendance_mismatches(self.db, start, end)
+        self.assertEqual(len(queries), 1)
+
+        self.assertEqual(
+            [(m["attendance_date"], m["github_id"], m["stored_commit_count"], m["commit_count"]) for m in mismatches],
+            [
+                (date(2025, 3, 14), "alice", 1, 2),
+                (date(2025, 3, 14), "bob", None, 1),
+                (date(2025, 3, 14), "carol", 5, 0),
+            ]
+        )
+
+        self.assertEqual(repair_attendance_mismatches(self.db, mismatches), 3)
+        self.db.commit()
+        self.assertEqual(find_attendance_mismatches(self.db, start, end), [])
+        carol = self.db.query(Attendance).filter(
+            Attendance.github_id == "carol", Attendance.attendance_date == date(2025, 3, 14)
+        ).one()
+        self.assertEqual((carol.commit_count, carol.is_attended), (0, False))
+
+def make_api_commit(sha, committer_date):
+    return {
+        "sha": sha,
+        "html_url": f"https://github.com/alice/repo/commit/{sha}",
+        "repository": {"full_name": "alice/repo", "private": False},
+        "commit": {"message": f"commit {sha}", "committer": {"date": committer_date}},
+    }
+
+
+class TestDeltaAttendance(unittest.IsolatedAsyncioTestCase):
+    """커밋 수집 시 바뀐 출석 칸에만 변화량을 반영하는지 테스트"""
+
+    def setUp(self):
+        commit_fetch_cache.clear()
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.db.add(User(github_id="alice"))
+        self.db.commit()
+        self.check_date = date(2025, 3, 14)
+
+    def tearDown(self):
+        commit_fetch_cache.clear()
+        self.db.close()
+
+    async def check(self, commits):
+        with patch("app.services.github_service.get_github_commits", return_value=commits):
+            return await check_user_commit_and_save("alice", self.check_date, "token", self.db, force_refresh=True)
+
+    async def test_new_commits_increment_their_kst_dates(self):
+        result = await self.check([
+            make_api_commit("a1", "2025-03-14T01:00:00Z"),
+            make_api_commit("a2", "2025-03-14T10:00:00+09:00"),
+            # KST 2025-03-15 00:30
+            make_api_commit("a3", "2025-03-14T15:30:00Z"),
+        ])
+
+        self.assertEqual((result["commit_count"], result["is_attended"], result["updated_cells"]), (2, True, 2))
+        rows = self.db.query(Attendance).order_by(Attendance.attendance_date).all()
+        self.assertEqual(
+            [(r.attendance_date, r.commit_count) for r in rows],
+            [(date(2025, 3, 14), 2), (date(2025, 3, 15), 1)]
+        )
+
+        # 증가분 반영 결과가 전체 재계산 결과와 같다
+        rows = derive_attendance_rows(self.db, date(2025, 3, 14), date(2025, 3, 15))
+        self.assertEqual(diff_attendance_rows(self.db, rows, date(2025, 3, 14), date(2025, 3, 15)), [])
+
+    async def test_run_without_new_commits_writes_no_attendance(self):
+        commits = [make_api_commit("a1", "2025-03-14T01:00:00Z")]
+        await self.check(commits)
+
+        result = await self.check(commits + [make_api_commit("a2", "2025-03-14T02:00:00Z")])
+        self.assertEqual((result["commit_count"], result["updated_cells"]), (2, 1))
+
+        result = await self.check(commits)
+        self.assertEqual((result["commit_count"], result["updated_cells"]), (2, 0))
+        self.assertEqual(self.db.query(Attendance).count(), 1)
+
+    async def test_commit_saved_by_another_worker_is_not_saved_again(self):
+        """다른 수집이 먼저 키를 저장한 커밋은 (날짜가 달라도) 다시 저장하거나 출석에 더하지 않는다"""
+        self.db.add(GitHubCommitKey(commit_id="a1", repository="alice/repo"))
+        self.db.commit()
+
+        result = await self.check([make_api_commit("a1", "2025-03-14T01:00:00Z"), make_api_commit("a2", "2025-03-14T02:00:00Z")])
+
+        self.assertEqual((result["commit_count"], result["updated_cells"]), (1, 1))
+        self.assertEqual([c.commit_id for c in self.db.query(GitHubCommit).all()], ["a2"])
+        self.assertEqual(self.db.query(GitHubCommitKey).count(), 2)
+
+    async def test_no_commits_creates_no_attendance_row(self):
+        result = await self.check([])
+
+        self.assertEqual((result["status"], result["commit_count"], result["is_attended"]), ("success", 0, False))
+        self.assertEqual(self.db.query(Attendance).count(), 0)
+
+
+class TestDailyAttendanceStats(unittest.IsolatedAsyncioTestCase):
+    """날짜별 출석 통계 쿼리 수와 캐시 테스트"""
+
+    def setUp(self):
+        daily_stats_cache.clear()
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.check_date = date(2025, 3, 14)
+        self.queries = 0
+        event.listen(self.engine, "before_cursor_execute", self.count_query)
+
+    def tearDown(self):
+        daily_stats_cache.clear()
+        self.db.close()
+
+    def count_query(self, *args, **kwargs):
+        self.queries += 1
+
+    def add_attendees(self, num_users):
+        self.db.add_all([User(github_id=f"user{i}") for i in range(num_users)])
+        self.db.add_all([
+            Attendance(github_id=f"user{i}", attendance_date=self.check_date, commit_count=i, is_attended=i % 2 == 0)
+            for i in range(num_users)
+        ])
+        self.db.commit()
+
+    async def stats_queries(self):
+        daily_stats_cache.clear()
+        self.queries = 0
+        stats = await get_daily_attendance_stats(self.check_date, self.db)
+        return stats, self.queries
+
+    async def test_query_count_does_not_grow_with_attendees(self):
+        self.add_attendees(4)
+        stats, small = await self.stats_queries()
+        self.assertEqual((stats["total_users"], stats["present_count"]), (4, 2))
+        self.assertEqual(stats["present_users"], [
+            {"github_id": "user0", "commit_count": 0}, {"github_id": "user2", "commit_count": 2}
+        ])
+
+        self.db.add_all([User(github_id=f"more{i}") for i in range(50)])
+        self.db.add_all([
+            Attendance(github_id=f"more{i}", attendance_date=self.check_date, commit_count=1, is_attended=True)
+            for i in range(50)
+        ])
+        self.db.commit()
+        stats, large = await self.stats_queries()
+        self.assertEqual(stats["present_count"], 52)
+        self.assertEqual(small, large)
+
+    async def test_cached_until_attendance_changes(self):
+        self.add_attendees(2)
+        first = await get_daily_attendance_stats(self.check_date, self.db)
+
+        self.queries = 0
+        self.assertEqual(await get_daily_attendance_stats(self.check_date, self.db), first)
+        self.assertEqual(self.queries, 0)
+
+        attendance = self.db.query(Attendance).filter(Attendance.github_id == "user1").one()
+        attendance.is_attended = True
+        self.db.flush()
+        on_attendance_changed(self.db, [("user1", self.check_date)])
+        self.db.commit()
+
+        stats = await get_daily_attendance_stats(self.check_date, self.db)
+        self.assertEqual(stats["present_count"], 2)
+
+    async def test_cache_invalidated_only_after_commit(self):
+        """커밋 전에 다른 요청이 옛 값을 다시 캐시해도 커밋되면 버려진다"""
+        self.add_attendees(2)
+        await get_daily_attendance_stats(self.check_date, self.db)
+
+        on_attendance_changed(self.db, [("user1", self.check_date)])
+        self.assertIsNotNone(daily_stats_cache.get(self.check_date))
+        self.db.rollback()
+        self.assertIsNotNone(daily_stats_cache.get(self.check_date))
+
+        on_attendance_changed(self.db, [("user1", self.check_date)])
+        self.db.commit()
+        self.assertIsNone(daily_stats_cache.get(self.check_date))
+
+
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
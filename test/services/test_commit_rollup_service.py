@@ -0,0 +1,108 @@
+from datetime import date
+from unittest import IsolatedAsyncioTestCase
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql import func
+
+from app.database import Base
+from app.models.commit_hourly_rollup import CommitHourlyRollup
+from app.models.github_commit import GitHubCommit
+from app.routers.attendance import get_hourly_commits
+from app.services.commit_rollup_service import get_hourly_commit_counts, rebuild_commit_hourly_rollups
+from app.services.github_service import save_github_commits
+
+
+def make_commit(sha, committed_at, repository="alice/repo"):
+    """GitHub 커밋 검색 API 형식의 커밋을 만듭니다."""
+    return {
+        "sha": sha,
+        "html_url": f"https://github.com/{repository}/commit/{sha}",
+        "repository": {"full_name": repository, "private": False},
+        "commit": {"message": sha, "committer": {"date": committed_at}},
+    }
+
+
+class TestCommitHourlyRollup(IsolatedAsyncioTestCase):
+    """시간대별 커밋 집계 테스트 (SQLite 메모리 DB)"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+
+    def tearDown(self):
+        self.db.close()
+
+    async def _save(self):
+        # UTC 15:30 = KST 다음 날 0시
+        await save_github_commits(self.db, [
+            make_commit("a1", "2025-03-10T01:00:00Z"),
+            make_commit("a2", "2025-03-10T01:40:00Z"),
+            make_commit("a3", "2025-03-10T15:30:00Z"),
+        ], "alice")
+        await save_github_commits(self.db, [make_commit("b1", "2025-03-10T01:10:00Z", "bob/repo")], "bob")
+        self.db.commit()
+
+    def _counts_from_commits(self, start, end):
+        """커밋 테이블을 직접 집계한 시간대별 커밋 수 (이전 구현)"""
+        rows = self.db.query(GitHubCommit.commit_hour_kst, func.count()).filter(
+            GitHubCommit.commit_date_kst >= start,
+            GitHubCommit.commit_date_kst <= end
+        ).group_by(GitHubCommit.commit_hour_kst).all()
+        counts = dict(rows)
+        return [{"hour": hour, "count": counts.get(hour, 0)} for hour in range(24)]
+
+    async def test_ingestion_maintains_rollup(self):
+        await self._save()
+
+        hourly = await get_hourly_commits("2025-03-10", "2025-03-11", self.db)
+        self.assertEqual(hourly, self._counts_from_commits(date(2025, 3, 10), date(2025, 3, 11)))
+        self.assertEqual((hourly[10]["count"], hourly[0]["count"]), (3, 1))
+
+        only_first_day = get_hourly_commit_counts(self.db, date(2025, 3, 10), date(2025, 3, 10))
+        self.assertEqual(only_first_day[0]["count"], 0)
+
+    async def test_per_user_distribution(self):
+        await self._save()
+
+        alice = await get_hourly_commits("2025-03-10", "2025-03-11", self.db, github_id="alice")
+        bob = await get_hourly_commits("2025-03-10", "2025-03-11", self.db, github_id="bob")
+        self.assertEqual({u["hour"]: u["count"] for u in alice if u["count"]}, {0: 1, 10: 2})
+        self.assertEqual({u["hour"]: u["count"] for u in bob if u["count"]}, {10: 1})
+
+    async def test_changed_commit_time_moves_count(self):
+        await self._save()
+        # 같은 커밋의 시각이 바뀌면 이전 시간대에서 빼고 새 시간대에 더함
+        await save_github_commits(self.db, [make_commit("a1", "2025-03-10T05:00:00Z")], "alice")
+        # 같은 시각으로 다시 저장하면 변화 없음
+        await save_github_commits(self.db, [make_commit("a2", "2025-03-10T01:40:00Z")], "alice")
+        self.db.commit()
+
+        hourly = get_hourly_commit_counts(self.db, date(2025, 3, 10), date(2025, 3, 11), "alice")
+        self.assertEqual({u["hour"]: u["count"] for u in hourly if u["count"]}, {0: 1, 10: 1, 14: 1})
+
+    async def test_reads_rollup_rows_only(self):
+        await self._save()
+        queries = []
+        event.listen(self.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: queries.append(statement))
+
+        get_hourly_commit_counts(self.db, date(2025, 3, 10), date(2025, 3, 11))
+        self.assertEqual(len(queries), 1)
+        self.assertIn("commit_hourly_rollups", queries[0])
+        self.assertNotIn("github_commits", queries[0])
+
+    async def test_rebuild_matches_incremental(self):
+        await self._save()
+        incremental = {
+            (r.commit_date_kst, r.commit_hour_kst, r.github_id): r.commit_count
+            for r in self.db.query(CommitHourlyRollup).all()
+        }
+
+        self.assertEqual(rebuild_commit_hourly_rollups(self.db), 3)
+        self.db.commit()
+        rebuilt = {
+            (r.commit_date_kst, r.commit_hour_kst, r.github_id): r.commit_count
+            for r in self.db.query(CommitHourlyRollup).all()
+        }
+        self.assertEqual(rebuilt, incremental)
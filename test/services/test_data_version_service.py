@@ -0,0 +1,131 @@
+import gzip
+import json
+from datetime import date
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.user import User
+from app.routers.attendance import get_attendance_stats, response_cache_flight
+from app.services.admin_service import AdminService
+from app.services.attendance_service import daily_stats_cache, on_attendance_changed
+from app.services.data_version_service import bump_data_version, forget_data_versions, get_data_version
+from app.utils.etag_utils import gzip_etag
+
+
+def make_request(if_none_match=None, accept_encoding=None):
+    """If-None-Match, Accept-Encoding 헤더를 가진 요청을 만듭니다."""
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    if accept_encoding:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/api/attendance/stats", "headers": headers})
+
+
+@patch("app.services.data_version_service.DATA_VERSION_CHECK_SECONDS", 60)
+class TestDataVersion(IsolatedAsyncioTestCase):
+    """데이터 버전과 버전별 응답 캐시 테스트 (SQLite 메모리 DB)"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.db.add(User(github_id="alice"))
+        self.db.add(Attendance(github_id="alice", attendance_date=date(2025, 3, 10), commit_count=1, is_attended=True))
+        self.db.commit()
+
+        self.queries = []
+        event.listen(self.engine, "before_cursor_execute", self._count_query)
+        forget_data_versions()
+
+    def tearDown(self):
+        forget_data_versions()
+        response_cache_flight.clear()
+        self.db.close()
+
+    def _count_query(self, conn, cursor, statement, parameters, context, executemany):
+        self.queries.append(statement)
+
+    async def _get_stats(self, if_none_match=None, accept_encoding=None):
+        request = make_request(if_none_match, accept_encoding)
+        return await get_attendance_stats(request, "2025-03-10", "2025-03-11", self.db)
+
+    def test_bump_is_visible_after_commit(self):
+        self.assertEqual(get_data_version(self.db), 0)
+        bump_data_version(self.db)
+        bump_data_version(self.db)
+        # 커밋 전에는 이전 버전을 그대로 사용
+        self.assertEqual(get_data_version(self.db), 0)
+
+        self.db.commit()
+        self.assertEqual(get_data_version(self.db), 2)
+
+    def test_version_is_not_read_again_within_interval(self):
+        get_data_version(self.db)
+        self.queries.clear()
+        get_data_version(self.db)
+        self.assertEqual(self.queries, [])
+
+    async def test_cached_response_and_not_modified(self):
+        first = await self._get_stats()
+        etag = first.headers["etag"]
+        self.assertEqual(first.headers["cache-control"], "no-cache")
+        self.assertEqual(first.media_type, "application/json")
+
+        # 쓰기가 없으면 DB를 읽지 않고 직렬화해 둔 같은 본문
+        self.queries.clear()
+        second = await self._get_stats()
+        self.assertIs(second.body, first.body)
+        self.assertEqual(self.queries, [])
+
+        not_modified = await self._get_stats(if_none_match=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.headers["etag"], etag)
+
+    async def test_attendance_change_invalidates_cached_response(self):
+        first = await self._get_stats()
+        self.assertEqual(json.loads(first.body)["users"][0]["attended_count"], 1)
+
+        self.db.add(Attendance(github_id="alice", attendance_date=date(2025, 3, 11), commit_count=2, is_attended=True))
+        on_attendance_changed(self.db, [("alice", date(2025, 3, 11))])
+        self.db.commit()
+
+        second = await self._get_stats(if_none_match=first.headers["etag"])
+        self.assertNotEqual(second.headers["etag"], first.headers["etag"])
+        self.assertEqual(json.loads(second.body)["users"][0]["attended_count"], 2)
+
+    async def test_read_model_rebuild_invalidates_cached_responses(self):
+        first = await self._get_stats()
+        daily_stats_cache.set(date(2025, 3, 10), {"stale": True})
+
+        AdminService.rebuild_attendance_read_model(self.db)
+
+        second = await self._get_stats(if_none_match=first.headers["etag"])
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second.headers["etag"], first.headers["etag"])
+        self.assertIsNone(daily_stats_cache.get(date(2025, 3, 10)))
+
+    @patch("app.routers.attendance.GZIP_MINIMUM_SIZE", 10)
+    async def test_gzip_body_is_cached(self):
+        plain = await self._get_stats()
+        compressed = await self._get_stats(accept_encoding="gzip, deflate")
+        self.assertEqual(compressed.headers["content-encoding"], "gzip")
+        self.assertEqual(compressed.headers["etag"], gzip_etag(plain.headers["etag"]))
+        self.assertEqual(gzip.decompress(compressed.body), plain.body)
+
+        again = await self._get_stats(accept_encoding="gzip")
+        self.assertIs(again.body, compressed.body)
+
+    @patch("app.routers.attendance.GZIP_MINIMUM_SIZE", 10)
+    async def test_not_modified_keeps_variant_etag(self):
+        plain = await self._get_stats()
+        compressed = await self._get_stats(accept_encoding="gzip")
+
+        for sent in (plain.headers["etag"], compressed.headers["etag"]):
+            not_modified = await self._get_stats(if_none_match=sent, accept_encoding="gzip")
+            self.assertEqual(not_modified.status_code, 304)
+            self.assertEqual(not_modified.headers["etag"], sent)
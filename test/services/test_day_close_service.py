@@ -0,0 +1,161 @@
+from datetime import date, datetime, timezone
+from unittest import TestCase, IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import config
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.github_commit import GitHubCommit
+from app.models.user import User
+from app.services.admin_service import AdminService
+from app.services.attendance_service import (
+    FinalizedDayError,
+    apply_attendance_deltas,
+    find_attendance_mismatches,
+    recompute_attendance_range,
+)
+from app.services.day_close_service import (
+    close_day,
+    close_pending_days,
+    get_finalized_at,
+    get_finalized_day,
+    get_finalized_days,
+    latest_closable_day,
+    reopen_day,
+)
+from app.services.github_service import GitHubAPIError
+
+# 2025-03-14 00:30 KST
+AFTER_MIDNIGHT = datetime(2025, 3, 13, 15, 30, tzinfo=timezone.utc)
+# 2025-03-14 01:30 KST
+AFTER_GRACE = datetime(2025, 3, 13, 16, 30, tzinfo=timezone.utc)
+
+
+class TestLatestClosableDay(TestCase):
+    @patch("app.services.day_close_service.DAY_CLOSE_GRACE_MINUTES", 60)
+    def test_waits_for_grace_period_after_kst_midnight(self):
+        self.assertEqual(latest_closable_day(AFTER_MIDNIGHT), date(2025, 3, 12))
+        self.assertEqual(latest_closable_day(AFTER_GRACE), date(2025, 3, 13))
+
+
+@patch("app.services.day_close_service.DAY_CLOSE_GRACE_MINUTES", 60)
+class TestCloseDay(IsolatedAsyncioTestCase):
+    """날짜 마감 테스트 (SQLite 메모리 DB)"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+
+    def tearDown(self):
+        self.db.close()
+
+    async def test_close_day_refetches_then_finalizes_once(self):
+        success = {"status": "success", "results": [{"status": "success", "github_id": "alice"}]}
+        with patch("app.services.day_close_service.check_all_attendances", return_value=success) as mock_check:
+            result = await close_day(self.db, date(2025, 3, 13), now=AFTER_GRACE)
+            again = await close_day(self.db, date(2025, 3, 13), now=AFTER_GRACE)
+
+        self.assertTrue(result["finalized"])
+        self.assertFalse(again["finalized"])
+        mock_check.assert_called_once_with(date(2025, 3, 13), self.db, force_refresh=True)
+        self.assertEqual(list(get_finalized_days(self.db)), [date(2025, 3, 13)])
+
+    async def test_day_is_not_closed_before_grace_period(self):
+        with patch("app.services.day_close_service.check_all_attendances") as mock_check:
+            result = await close_day(self.db, date(2025, 3, 13), now=AFTER_MIDNIGHT)
+
+        self.assertFalse(result["finalized"])
+        mock_check.assert_not_called()
+
+    async def test_failed_fetch_keeps_day_open(self):
+        partial = {"status": "success", "results": [{"status": "error", "github_id": "alice"}]}
+        with patch("app.services.day_close_service.check_all_attendances", return_value=partial):
+            result = await close_day(self.db, date(2025, 3, 13), now=AFTER_GRACE)
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(get_finalized_days(self.db), {})
+
+    async def test_github_api_error_keeps_day_open(self):
+        """GitHub API 오류로 커밋을 못 가져온 사용자는 커밋 없음이 아니라 수집 실패로 본다"""
+        self.db.add(User(github_id="alice"))
+        self.db.commit()
+
+        with patch("app.services.github_service.get_github_commits", side_effect=GitHubAPIError("HTTP 403")), \
+                patch.object(config, "github", {"api_token": "token"}), patch.object(config, "project", None):
+            result = await close_day(self.db, date(2025, 3, 13), now=AFTER_GRACE)
+
+        self.assertEqual(result["status"], "error")
+        self.assertIn("alice", result["message"])
+        self.assertEqual(get_finalized_days(self.db), {})
+
+    async def close_with_late_commit(self):
+        """alice를 두고 3/13을 마감한 뒤, 마감 이후에 도착한 3/13 커밋을 저장합니다."""
+        self.db.add(User(github_id="alice"))
+        self.db.commit()
+        success = {"status": "success", "results": []}
+        with patch("app.services.day_close_service.check_all_attendances", return_value=success):
+            await close_day(self.db, date(2025, 3, 13), now=AFTER_GRACE)
+        # KST 2025-03-13 10:00
+        self.db.add(GitHubCommit(
+            github_id="alice", commit_id="late", repository="alice/repo", message="late",
+            commit_url="https://github.com/alice/repo/commit/late", commit_date=datetime(2025, 3, 13, 1, 0)
+        ))
+        self.db.commit()
+
+    async def test_finalized_day_is_not_written(self):
+        """마감된 날짜는 수집, 재계산, 대사, 관리자 수정 어느 경로로도 바뀌지 않는다"""
+        await self.close_with_late_commit()
+        day = date(2025, 3, 13)
+
+        self.assertEqual(apply_attendance_deltas(self.db, {("alice", day): 1}), 0)
+        self.assertEqual(recompute_attendance_range(self.db, day, day), [])
+        self.assertEqual(find_attendance_mismatches(self.db, day, day), [])
+        with self.assertRaises(FinalizedDayError):
+            AdminService.update_user_attendance("alice", day.isoformat(), True, self.db)
+        self.db.commit()
+
+        self.assertEqual(self.db.query(Attendance).count(), 0)
+        finalized_day = get_finalized_day(self.db, day)
+        self.assertEqual(finalized_day.finalized_at.replace(tzinfo=timezone.utc), AFTER_GRACE)
+        self.assertIsNone(finalized_day.reopened_at)
+
+    async def test_reopen_repairs_from_commits_and_restamps(self):
+        await self.close_with_late_commit()
+        day = date(2025, 3, 13)
+        reopened_at = datetime(2025, 3, 20, tzinfo=timezone.utc)
+
+        result = reopen_day(self.db, day, now=reopened_at)
+
+        self.assertEqual((result["reopened"], result["mismatches"]), (True, 1))
+        attendance = self.db.query(Attendance).one()
+        self.assertEqual((attendance.commit_count, attendance.is_attended), (1, True))
+        finalized_day = get_finalized_day(self.db, day)
+        self.assertEqual(finalized_day.finalized_at.replace(tzinfo=timezone.utc), reopened_at)
+        self.assertEqual(finalized_day.reopened_at.replace(tzinfo=timezone.utc), reopened_at)
+
+        # 고칠 것이 없으면 마감 시각을 그대로 둔다
+        self.assertFalse(reopen_day(self.db, day)["reopened"])
+        self.assertEqual(get_finalized_at(self.db, day).replace(tzinfo=timezone.utc), reopened_at)
+
+    async def test_admin_edit_with_reopen_marks_day(self):
+        await self.close_with_late_commit()
+
+        result = AdminService.update_user_attendance("alice", "2025-03-13", True, self.db, reopen=True)
+
+        self.assertEqual(result["data"]["commit_count"], 1)
+        self.assertIsNotNone(get_finalized_day(self.db, date(2025, 3, 13)).reopened_at)
+
+    @patch("app.services.day_close_service.DAY_CLOSE_LOOKBACK_DAYS", 3)
+    async def test_close_pending_days_skips_finalized_days(self):
+        success = {"status": "success", "results": []}
+        with patch("app.services.day_close_service.check_all_attendances", return_value=success) as mock_check:
+            await close_day(self.db, date(2025, 3, 12), now=AFTER_GRACE)
+            results = await close_pending_days(self.db, now=AFTER_GRACE)
+
+        self.assertEqual([r["date"] for r in results], ["2025-03-11", "2025-03-13"])
+        self.assertEqual(mock_check.call_count, 3)
+        self.assertEqual(set(get_finalized_days(self.db)), {date(2025, 3, 11), date(2025, 3, 12), date(2025, 3, 13)})
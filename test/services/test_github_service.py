@@ -2,13 +2,25 @@ import json
 import os
 from datetime import datetime, date
 from unittest import TestCase, IsolatedAsyncioTestCase
+from unittest.mock import patch
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
+from app.models.attendance import Attendance
 from app.models.github_commit import GitHubCommit
-from app.models.user import Base
-from app.services.github_service import get_github_commits, apply_date_filters
+from app.models.user import Base, User
+from app.services.github_service import (
+    get_github_commits,
+    apply_date_filters,
+    fetch_and_save_commits,
+    commit_fetch_cache,
+    count_user_commits,
+    get_user_commit_details,
+    get_all_users_attendance_stats,
+    GitHubAPIError,
+)
+from app.services.attendance_service import check_user_commit_and_save
 
 
 class Test(IsolatedAsyncioTestCase):
@@ -128,3 +140,131 @@ class TestDateFilterFunction(TestCase):
         results = filtered_query.all()
         # Should include commits from March 3, 4
         self.assertEqual(len(results), 2)
+
+    def test_count_user_commits(self):
+        """COUNT 집계 결과가 행 조회 결과의 개수와 같다"""
+        self.assertEqual(count_user_commits(self.db, "testuser"), 5)
+        self.assertEqual(count_user_commits(self.db, "testuser", date(2023, 3, 3), date(2023, 3, 4)), 2)
+        self.assertEqual(count_user_commits(self.db, "nobody"), 0)
+
+    def test_get_user_commit_details(self):
+        details = get_user_commit_details(self.db, "testuser", date(2023, 3, 4))
+        self.assertEqual(len(details), 1)
+        self.assertEqual(details[0]["commit_id"], "commit3")
+        self.assertEqual(set(details[0]), {"commit_id", "repository", "commit_date", "message"})
+
+    def test_kst_columns_are_filled_on_insert(self):
+        """commit_date_kst, commit_hour_kst는 저장 시 KST 기준으로 채워진다"""
+        self.db.bulk_insert_mappings(GitHubCommit, [{
+            "github_id": "testuser",
+            "commit_id": "late",
+            "repository": "test/repo",
+            "message": "late commit",
+            "commit_url": "https://github.com/test/late",
+            # KST 2023-03-07 00:30
+            "commit_date": datetime(2023, 3, 6, 15, 30, 0),
+            "is_private": False,
+        }])
+        self.db.commit()
+
+        commit = self.db.query(GitHubCommit).filter(GitHubCommit.commit_id == "late").one()
+        self.assertEqual((commit.commit_date_kst, commit.commit_hour_kst), (date(2023, 3, 7), 0))
+
+
+class TestFetchCache(IsolatedAsyncioTestCase):
+    def setUp(self):
+        commit_fetch_cache.clear()
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+
+    def tearDown(self):
+        commit_fetch_cache.clear()
+        self.db.close()
+
+    async def _fetch(self, **kwargs):
+        return await fetch_and_save_commits(self.db, "testuser", date(2025, 3, 14), "token", **kwargs)
+
+    async def test_repeated_fetch_within_ttl_skips_github(self):
+        """같은 (사용자, 날짜)를 다시 조회하면 GitHub를 호출하지 않고 캐시된 결과를 사용한다"""
+        with patch("app.services.github_service.get_github_commits", return_value=[]) as mock_get:
+            first = await self._fetch()
+            self.db.commit()
+            second = await self._fetch()
+            forced = await self._fetch(use_cache=False)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertGreaterEqual(second["data_age_seconds"], 0)
+        self.assertFalse(forced["cached"])
+
+    async def test_result_is_cached_only_after_commit(self):
+        """저장한 트랜잭션이 롤백되면 조회 결과를 캐시하지 않는다"""
+        with patch("app.services.github_service.get_github_commits", return_value=[]) as mock_get:
+            await self._fetch()
+            self.db.rollback()
+            again = await self._fetch()
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertFalse(again["cached"])
+
+    async def test_api_error_is_not_cached(self):
+        """GitHub API 오류는 커밋 없음으로 캐시하지 않고 출석 확인 결과를 error로 반환한다"""
+        self.db.add(User(github_id="testuser"))
+        self.db.commit()
+
+        with patch("app.services.github_service.get_github_commits", side_effect=GitHubAPIError("HTTP 403")):
+            result = await check_user_commit_and_save("testuser", date(2025, 3, 14), "token", self.db)
+        self.assertEqual((result["status"], result["github_id"]), ("error", "testuser"))
+        self.assertIsNone(commit_fetch_cache.get(("testuser", date(2025, 3, 14))))
+
+
+class TestAllUsersAttendanceStats(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+
+        self.db.add_all([User(github_id="bob"), User(github_id="alice"), User(github_id="carol")])
+        self.db.add_all([
+            Attendance(github_id="alice", attendance_date=date(2025, 3, 11), commit_count=2, is_attended=True),
+            Attendance(github_id="alice", attendance_date=date(2025, 3, 10), commit_count=1, is_attended=True),
+            Attendance(github_id="bob", attendance_date=date(2025, 3, 10), commit_count=0, is_attended=False),
+            Attendance(github_id="bob", attendance_date=date(2025, 3, 12), commit_count=3, is_attended=True),
+            # 기간 밖
+            Attendance(github_id="carol", attendance_date=date(2025, 3, 20), commit_count=5, is_attended=True),
+        ])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    async def test_single_query_returns_per_user_stats(self):
+        queries = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args, **kwargs: queries.append(1))
+
+        stats = await get_all_users_attendance_stats(self.db, "2025-03-10", "2025-03-13")
+
+        self.assertEqual(len(queries), 1)
+        self.assertEqual([s["github_id"] for s in stats], ["alice", "bob", "carol"])
+        self.assertEqual(stats[0], {
+            "github_id": "alice",
+            "total_days": 4,
+            "attended_days": 2,
+            "attendance_rate": 50.0,
+            "total_commits": 3,
+            "attendance_by_date": {
+                "2025-03-10": {"commit_count": 1, "is_attended": True},
+                "2025-03-11": {"commit_count": 2, "is_attended": True},
+            }
+        })
+        self.assertEqual((stats[1]["attended_days"], stats[1]["total_commits"]), (1, 3))
+        self.assertEqual(stats[2], {
+            "github_id": "carol",
+            "total_days": 4,
+            "attended_days": 0,
+            "attendance_rate": 0,
+            "total_commits": 0,
+            "attendance_by_date": {}
+        })
@@ -0,0 +1,82 @@
+from datetime import date, datetime
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import config
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.user import User
+from app.services.attendance_service import check_all_attendances, daily_stats_cache, get_daily_attendance_stats
+from app.services.github_service import get_all_users_attendance_stats
+from app.services.participant_service import get_active_window, set_user_active
+from app.services.stats_service import build_attendance_stats
+
+# KST 2025-03-12 10:00에 참여 종료
+DEACTIVATED_AT = datetime(2025, 3, 12, 1, 0)
+
+
+class TestParticipantLifecycle(IsolatedAsyncioTestCase):
+    """사용자 참여 상태(활성/비활성) 테스트 (SQLite 메모리 DB)"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+
+        alice, bob = User(github_id="alice"), User(github_id="bob", activated_at=datetime(2025, 3, 1))
+        self.db.add_all([alice, bob])
+        self.db.add_all([
+            Attendance(github_id=github_id, attendance_date=date(2025, 3, day), commit_count=1, is_attended=True)
+            for github_id in ("alice", "bob") for day in (10, 12, 13)
+        ])
+        self.db.commit()
+        set_user_active(self.db, bob, False, now=DEACTIVATED_AT)
+        self.db.commit()
+        daily_stats_cache.clear()
+
+    def tearDown(self):
+        daily_stats_cache.clear()
+        self.db.close()
+
+    def test_deactivate_records_timestamp_and_rejects_reactivation(self):
+        bob = self.db.query(User).filter(User.github_id == "bob").one()
+        self.assertEqual((bob.is_active, bob.deactivated_at), (False, DEACTIVATED_AT))
+        self.assertEqual(get_active_window(bob.is_active, bob.activated_at, bob.deactivated_at), (date(2025, 3, 1), date(2025, 3, 12)))
+        self.assertFalse(set_user_active(self.db, bob, False))
+
+        # 참여 기간을 하나만 기록하므로 다시 활성화하면 이전 참여 기간을 잃음
+        with self.assertRaises(ValueError):
+            set_user_active(self.db, bob, True, now=datetime(2025, 3, 20))
+        self.assertEqual((bob.is_active, bob.activated_at, bob.deactivated_at), (False, datetime(2025, 3, 1), DEACTIVATED_AT))
+
+    async def test_ingestion_skips_inactive_users(self):
+        with patch.dict(config.github, {"api_token": "token"}), \
+                patch("app.services.attendance_service.check_user_commit_and_save", return_value={"status": "success"}) as mock_check:
+            await check_all_attendances(date(2025, 3, 14), self.db)
+
+        self.assertEqual([call.kwargs["github_id"] for call in mock_check.call_args_list], ["alice"])
+
+    async def test_stats_count_inactive_user_only_while_active(self):
+        stats = {s["github_id"]: s for s in await get_all_users_attendance_stats(self.db, "2025-03-10", "2025-03-13")}
+        self.assertEqual((stats["alice"]["total_days"], stats["alice"]["attended_days"]), (4, 3))
+        self.assertEqual((stats["bob"]["total_days"], stats["bob"]["attended_days"]), (3, 2))
+        self.assertEqual(list(stats["bob"]["attendance_by_date"]), ["2025-03-10", "2025-03-12"])
+
+        # 참여 종료 이후 기간에는 포함하지 않음
+        later = await get_all_users_attendance_stats(self.db, "2025-03-13", "2025-03-14")
+        self.assertEqual([s["github_id"] for s in later], ["alice"])
+
+        response = build_attendance_stats(self.db, date(2025, 3, 10), date(2025, 3, 13))
+        bob = next(u for u in response["users"] if u["github_id"] == "bob")
+        self.assertEqual((bob["total_days"], bob["attended_count"], bob["attendance"]), (3, 2, [True, False, True, False]))
+        self.assertEqual([r["rate"] for r in response["daily_rates"]], [100, 0, 100, 100])
+        self.assertEqual(response["total_absent"], 7 - 5)
+
+        self.assertEqual((await get_daily_attendance_stats(date(2025, 3, 12), self.db))["total_users"], 2)
+        # 참여 종료 뒤의 출석 기록은 출석자에도 넣지 않아 출석률이 100%를 넘지 않음
+        after = await get_daily_attendance_stats(date(2025, 3, 13), self.db)
+        self.assertEqual((after["total_users"], after["present_count"], after["attendance_rate"]), (1, 1, 100))
+        self.assertEqual([u["github_id"] for u in after["present_users"]], ["alice"])
@@ -0,0 +1,70 @@
+from datetime import date, datetime, timedelta
+from unittest import TestCase
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.user import User
+from app.services.ranking_service import get_ranking
+from app.services.stats_service import build_attendance_ranking, build_attendance_stats
+
+START = date(2025, 3, 10)
+END = date(2025, 3, 17)
+
+# 8일 중 출석일 (1/8 = 12.5%, 3/8 = 37.5%는 짝수 쪽으로 반올림)
+ATTENDED_DAYS = {"alice": 4, "bob": 4, "carol": 1, "dave": 3, "erin": 0}
+
+
+class TestRanking(TestCase):
+    """SQL 출석률 순위 테스트 (SQLite 메모리 DB)"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+
+        self.db.add_all([User(github_id=github_id) for github_id in ATTENDED_DAYS])
+        self.db.add_all([
+            Attendance(github_id=github_id, attendance_date=START + timedelta(days=i), commit_count=1, is_attended=True)
+            for github_id, days in ATTENDED_DAYS.items() for i in range(days)
+        ])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_ties_share_rank(self):
+        ranking = get_ranking(self.db, START, END)
+        self.assertEqual(
+            [(u["github_id"], u["attendance_rate"], u["rank"]) for u in ranking],
+            [("alice", 50, 1), ("bob", 50, 1), ("dave", 38, 3), ("carol", 12, 4), ("erin", 0, 5)]
+        )
+        self.assertEqual([u["rank"] for u in get_ranking(self.db, START, END, dense=True)], [1, 1, 2, 3, 4])
+
+    def test_limit_and_offset_in_one_query(self):
+        queries = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args, **kwargs: queries.append(1))
+        page = get_ranking(self.db, START, END, limit=2, offset=1)
+
+        self.assertEqual([(u["github_id"], u["rank"]) for u in page], [("bob", 1), ("dave", 3)])
+        # 비활성 사용자 조회 1회 + 순위 쿼리 1회
+        self.assertEqual(len(queries), 2)
+
+    def test_matches_attendance_stats(self):
+        bob = self.db.query(User).filter(User.github_id == "bob").one()
+        bob.activated_at = datetime(2025, 3, 1)
+        bob.is_active = False
+        # KST 2025-03-12 10:00에 참여 종료 -> 3일 중 3일 출석
+        bob.deactivated_at = datetime(2025, 3, 12, 1, 0)
+        self.db.commit()
+
+        stats = build_attendance_stats(self.db, START, END)
+        ranking = build_attendance_ranking(self.db, START, END)
+
+        key = lambda u: (u["github_id"], u["attendance_rate"], u["attended_count"], u["total_days"])
+        self.assertEqual(sorted(map(key, ranking)), sorted(map(key, stats["users"])))
+        self.assertEqual(ranking[0]["github_id"], "bob")
+        self.assertEqual((ranking[0]["attendance_rate"], ranking[0]["total_days"]), (100, 3))
+        self.assertIn("current_streak", ranking[0])
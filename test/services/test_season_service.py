@@ -0,0 +1,96 @@
+import json
+from datetime import date
+from unittest import IsolatedAsyncioTestCase
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.user import User
+from app.routers.attendance import get_attendance_ranking, get_attendance_stats, get_hourly_commits, response_cache_flight
+from app.routers.seasons import get_seasons
+from app.services.data_version_service import forget_data_versions
+from app.services.season_service import create_season, ensure_season_partitions, get_season_period
+from app.utils.date_utils import get_project_period, get_project_season_name
+
+PAST_START = date(2024, 9, 1)
+PAST_END = date(2024, 9, 5)
+
+
+def make_request():
+    """라우트 함수를 직접 호출할 때 넘길 GET 요청을 만듭니다."""
+    return Request({"type": "http", "method": "GET", "path": "/api/attendance", "headers": []})
+
+class TestSeasons(IsolatedAsyncioTestCase):
+    """시즌 테스트 (SQLite 메모리 DB, 파티션은 PostgreSQL에서만 만듦)"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+
+        self.db.add_all([User(github_id="alice"), User(github_id="bob")])
+        # 지난 시즌: alice 3일, bob 1일 출석 / 현재 시즌 첫날: bob만 출석
+        self.db.add_all([
+            Attendance(github_id="alice", attendance_date=date(2024, 9, day), commit_count=1, is_attended=True)
+            for day in (1, 2, 3)
+        ])
+        self.db.add(Attendance(github_id="bob", attendance_date=date(2024, 9, 2), commit_count=2, is_attended=True))
+        self.db.add(Attendance(github_id="bob", attendance_date=get_project_period()[0], commit_count=1, is_attended=True))
+        self.past = create_season(self.db, "season9", PAST_START, PAST_END)
+        self.db.commit()
+
+    def tearDown(self):
+        forget_data_versions()
+        response_cache_flight.clear()
+        self.db.close()
+
+    def test_season_period(self):
+        self.assertEqual(get_season_period(self.db, "season9"), (PAST_START, PAST_END))
+        # seasons 테이블에 없어도 설정 파일의 현재 시즌은 조회됨
+        self.assertEqual(get_season_period(self.db, get_project_season_name()), get_project_period())
+        self.assertIsNone(get_season_period(self.db, "season1"))
+
+    def test_invalid_seasons_are_rejected(self):
+        for name, start, end in (
+            ("season9", date(2023, 1, 1), date(2023, 1, 2)),  # 이름 중복
+            ("season9b", date(2024, 9, 5), date(2024, 9, 10)),  # 기간 겹침
+            ("season8", date(2024, 1, 2), date(2024, 1, 1)),  # 종료일이 시작일보다 빠름
+        ):
+            with self.assertRaises(ValueError):
+                create_season(self.db, name, start, end)
+
+    def test_partitions_are_postgresql_only(self):
+        self.assertEqual(ensure_season_partitions(self.db, self.past), [])
+
+    async def test_endpoints_use_season_period(self):
+        stats = json.loads((await get_attendance_stats(make_request(), None, None, self.db, season="season9")).body)
+        self.assertEqual((stats["start_date"], stats["end_date"]), ("2024-09-01", "2024-09-05"))
+        self.assertEqual((stats["total_days"], stats["days_completed"], stats["is_completed"]), (5, 5, True))
+        self.assertEqual({u["github_id"]: u["attended_count"] for u in stats["users"]}, {"alice": 3, "bob": 1})
+
+        ranking = json.loads((await get_attendance_ranking(make_request(), None, None, self.db, season="season9")).body)
+        self.assertEqual([(u["github_id"], u["attendance_rate"]) for u in ranking], [("alice", 60), ("bob", 20)])
+        # 연속 출석 상태는 현재 시즌 기준이므로 지난 시즌 순위에는 넣지 않음
+        self.assertEqual({u["current_streak"] for u in ranking} | {u["longest_streak"] for u in ranking}, {None})
+        current = json.loads((await get_attendance_ranking(
+            make_request(), None, None, self.db, season=get_project_season_name()
+        )).body)
+        self.assertEqual({u["github_id"]: u["longest_streak"] for u in current}, {"alice": 0, "bob": 0})
+
+        hourly = await get_hourly_commits(None, None, self.db, season="season9")
+        self.assertEqual(len(hourly), 24)
+
+    async def test_unknown_season_is_not_found(self):
+        with self.assertRaises(HTTPException) as context:
+            await get_attendance_stats(make_request(), None, None, self.db, season="season1")
+        self.assertEqual(context.exception.status_code, 404)
+
+    async def test_list_seasons(self):
+        seasons = await get_seasons(self.db)
+        self.assertEqual(seasons, [
+            {"name": "season9", "start_date": "2024-09-01", "end_date": "2024-09-05", "is_current": False}
+        ])
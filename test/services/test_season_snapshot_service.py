@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+from datetime import timedelta
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.user import User
+from app.routers.attendance import (
+    get_attendance_history,
+    get_attendance_ranking,
+    get_attendance_stats,
+    response_cache_flight,
+)
+from app.routers.github_commits import read_user_daily_commits
+from app.season_freeze import freeze_season
+from app.services.data_version_service import forget_data_versions
+from app.services.season_snapshot_service import load_snapshot, new_snapshot, save_snapshot
+from app.utils.date_utils import get_project_period
+
+SEASON_START, SEASON_END = get_project_period()
+
+
+def make_request():
+    """라우트 함수를 직접 호출할 때 넘길 GET 요청을 만듭니다."""
+    return Request({"type": "http", "method": "GET", "path": "/api/attendance", "headers": []})
+
+class TestSeasonSnapshot(IsolatedAsyncioTestCase):
+    """시즌 종료 스냅샷 테스트 (SQLite 메모리 DB, 임시 스냅샷 파일)"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+
+        self.db.add_all([User(github_id="alice"), User(github_id="bob")])
+        self.db.add_all([
+            Attendance(github_id="alice", attendance_date=SEASON_START, commit_count=2, is_attended=True),
+            Attendance(github_id="bob", attendance_date=SEASON_START + timedelta(days=1), commit_count=1, is_attended=True),
+        ])
+        self.db.commit()
+
+        self.path = os.path.join(tempfile.mkdtemp(), "snapshot.json.gz")
+        self.path_patch = patch("app.services.season_snapshot_service.SEASON_SNAPSHOT_PATH", self.path)
+        self.path_patch.start()
+
+    def tearDown(self):
+        forget_data_versions()
+        response_cache_flight.clear()
+        self.path_patch.stop()
+        self.db.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    async def test_freeze_waits_for_season_end(self):
+        with patch("app.season_freeze.is_season_over", return_value=False):
+            result = await freeze_season(self.db)
+
+        self.assertEqual(result["status"], "info")
+        self.assertIsNone(load_snapshot())
+
+    async def test_frozen_endpoints_match_live_responses_without_queries(self):
+        live_stats = json.loads((await get_attendance_stats(make_request(), None, None, self.db)).body)
+        live_history = await get_attendance_history("alice", SEASON_START.isoformat(), SEASON_END.isoformat(), self.db)
+        live_daily = await read_user_daily_commits("bob", None, None, self.db)
+
+        result = await freeze_season(self.db, force=True)
+        self.assertEqual((result["status"], result["users"]), ("success", 2))
+
+        queries = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args, **kwargs: queries.append(1))
+
+        self.assertEqual(json.loads((await get_attendance_stats(make_request(), None, None, self.db)).body), live_stats)
+        self.assertEqual(
+            await get_attendance_history("alice", SEASON_START.isoformat(), SEASON_END.isoformat(), self.db),
+            live_history
+        )
+        self.assertEqual(await read_user_daily_commits("bob", None, None, self.db), live_daily)
+        ranking = json.loads((await get_attendance_ranking(make_request(), None, None, self.db)).body)
+        self.assertEqual([user["github_id"] for user in ranking], [user["github_id"] for user in live_stats["users"]])
+        self.assertEqual(queries, [])
+
+        # 기간을 지정한 조회는 DB에서 읽음
+        await get_attendance_stats(make_request(), SEASON_START.isoformat(), SEASON_START.isoformat(), self.db)
+        self.assertGreater(len(queries), 0)
+
+    async def test_refreeze_builds_from_database_not_previous_snapshot(self):
+        await freeze_season(self.db, force=True)
+        self.db.add(Attendance(github_id="bob", attendance_date=SEASON_START, commit_count=3, is_attended=True))
+        self.db.commit()
+
+        await freeze_season(self.db, force=True)
+        users = {user["github_id"]: user for user in load_snapshot()["stats"]["users"]}
+        self.assertEqual(users["bob"]["attended_count"], 2)
+
+    def test_snapshot_of_another_season_is_ignored(self):
+        save_snapshot(new_snapshot(SEASON_START - timedelta(days=365), SEASON_END - timedelta(days=365)))
+        self.assertIsNone(load_snapshot())
+
+        save_snapshot(new_snapshot(SEASON_START, SEASON_END))
+        self.assertEqual(load_snapshot()["end_date"], SEASON_END.isoformat())
@@ -0,0 +1,90 @@
+from datetime import datetime, date, timedelta, timezone
+from unittest import TestCase, IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.ingestion_shard_lease import IngestionShardLease
+from app.models.user import User
+from app.services.shard_service import (
+    ensure_shard_leases,
+    claim_shard,
+    renew_lease,
+    complete_shard,
+    get_shard_id,
+    run_ingestion_worker,
+)
+
+
+class TestShardLease(TestCase):
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.run_key = "2025-03-14@test"
+        ensure_shard_leases(self.db, self.run_key, 2)
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_workers_claim_different_shards(self):
+        """두 워커는 서로 다른 샤드를 획득하고, 남은 샤드가 없으면 None을 받는다"""
+        self.assertEqual(claim_shard(self.db, self.run_key, "worker-a", 60), 0)
+        self.assertEqual(claim_shard(self.db, self.run_key, "worker-b", 60), 1)
+        self.assertIsNone(claim_shard(self.db, self.run_key, "worker-c", 60))
+
+    def test_ensure_shard_leases_is_idempotent(self):
+        ensure_shard_leases(self.db, self.run_key, 2)
+        self.assertEqual(self.db.query(IngestionShardLease).count(), 2)
+
+    def test_expired_lease_is_taken_over(self):
+        """리스가 만료되면 다른 워커가 샤드를 인계하고, 기존 워커의 하트비트는 실패한다"""
+        self.assertEqual(claim_shard(self.db, self.run_key, "worker-a", 60), 0)
+        self.db.query(IngestionShardLease).filter(IngestionShardLease.shard_id == 0).update(
+            {"lease_expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)}
+        )
+        self.db.commit()
+
+        self.assertEqual(claim_shard(self.db, self.run_key, "worker-b", 60), 0)
+        self.assertFalse(renew_lease(self.db, self.run_key, 0, "worker-a", 60))
+        self.assertTrue(renew_lease(self.db, self.run_key, 0, "worker-b", 60))
+
+    def test_completed_shard_is_not_claimed_again(self):
+        self.assertEqual(claim_shard(self.db, self.run_key, "worker-a", 60), 0)
+        self.assertTrue(complete_shard(self.db, self.run_key, 0, "worker-a"))
+        self.assertEqual(claim_shard(self.db, self.run_key, "worker-b", 60), 1)
+        self.assertIsNone(claim_shard(self.db, self.run_key, "worker-b", 60))
+
+
+class TestRunIngestionWorker(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.github_ids = [f"user{i}" for i in range(10)]
+        self.db.add_all([User(github_id=github_id) for github_id in self.github_ids])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    async def test_every_user_is_processed_once(self):
+        processed = []
+
+        async def fake_check(github_id, check_date, github_api_token, db):
+            processed.append(github_id)
+            return {"status": "success", "github_id": github_id}
+
+        with patch("app.services.shard_service.check_user_commit_and_save", side_effect=fake_check):
+            first = await run_ingestion_worker(self.db, date(2025, 3, 14), "worker-a", run_id="t", num_shards=4)
+            second = await run_ingestion_worker(self.db, date(2025, 3, 14), "worker-b", run_id="t", num_shards=4)
+
+        self.assertEqual(sorted(processed), sorted(self.github_ids))
+        self.assertEqual(first["completed_shards"], [0, 1, 2, 3])
+        self.assertEqual(second["completed_shards"], [])
+
+    def test_shard_id_is_stable(self):
+        self.assertEqual(get_shard_id("junho85", 8), get_shard_id("junho85", 8))
+        self.assertTrue(0 <= get_shard_id("junho85", 8) < 8)
@@ -0,0 +1,107 @@
+import random
+from datetime import date, timedelta
+from unittest import TestCase
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.user import User
+from app.services.attendance_service import on_attendance_changed
+from app.services.streak_service import (
+    compute_streak,
+    get_streaks,
+    rebuild_streaks,
+    verify_streaks,
+)
+
+START = date(2025, 3, 10)
+
+
+def day(n):
+    return START + timedelta(days=n)
+
+
+class TestComputeStreak(TestCase):
+    def test_compute_streak(self):
+        self.assertEqual(compute_streak([]), (0, 0, None))
+        self.assertEqual(compute_streak([day(0), day(1), day(2), day(4), day(5)]), (2, 3, day(5)))
+        self.assertEqual(compute_streak([day(3), day(1), day(2), day(2)]), (3, 3, day(3)))
+
+
+class TestStreakService(TestCase):
+    """출석 기록 변경 시 연속 출석 상태 증분 갱신 테스트 (SQLite 메모리 DB)"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.db.add_all([User(github_id="alice"), User(github_id="bob")])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    def set_attendance(self, github_id, d, is_attended):
+        attendance = self.db.query(Attendance).filter(
+            Attendance.github_id == github_id, Attendance.attendance_date == d
+        ).first()
+        if attendance is None:
+            self.db.add(Attendance(github_id=github_id, attendance_date=d, commit_count=1, is_attended=is_attended))
+        else:
+            attendance.is_attended = is_attended
+        self.db.flush()
+        on_attendance_changed(self.db, [(github_id, d)])
+        self.db.commit()
+
+    def streak(self, github_id, today):
+        return get_streaks(self.db, [github_id], today=today)[github_id]
+
+    def test_daily_attendance_extends_streak(self):
+        for n in (0, 1, 2):
+            self.set_attendance("alice", day(n), True)
+        self.set_attendance("alice", day(4), True)
+
+        self.assertEqual(
+            self.streak("alice", today=day(4)),
+            {"current_streak": 1, "longest_streak": 3, "last_attended_date": day(4).isoformat()}
+        )
+        self.assertEqual(verify_streaks(self.db), [])
+
+    def test_current_streak_expires_after_a_missed_day(self):
+        self.set_attendance("alice", day(0), True)
+        self.set_attendance("alice", day(1), True)
+
+        self.assertEqual(self.streak("alice", today=day(2))["current_streak"], 2)
+        self.assertEqual(self.streak("alice", today=day(3))["current_streak"], 0)
+
+    def test_backfill_and_cancel_rebuild_user(self):
+        for n in (0, 2, 3):
+            self.set_attendance("alice", day(n), True)
+        # 과거 빈 날 채우기
+        self.set_attendance("alice", day(1), True)
+        self.assertEqual(self.streak("alice", today=day(3))["longest_streak"], 4)
+
+        # 출석 취소
+        self.set_attendance("alice", day(3), False)
+        self.assertEqual(
+            self.streak("alice", today=day(3)),
+            {"current_streak": 3, "longest_streak": 3, "last_attended_date": day(2).isoformat()}
+        )
+
+    def test_random_changes_match_full_rebuild(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            self.set_attendance(rng.choice(["alice", "bob"]), day(rng.randint(0, 20)), rng.random() < 0.7)
+            self.assertEqual(verify_streaks(self.db), [])
+
+    def test_rebuild_and_verify(self):
+        self.db.add(Attendance(github_id="bob", attendance_date=day(0), commit_count=1, is_attended=True))
+        self.db.commit()
+        # hook을 거치지 않은 변경은 검증에서 드러남
+        self.assertEqual([m["github_id"] for m in verify_streaks(self.db)], ["bob"])
+
+        self.assertEqual(rebuild_streaks(self.db), {"users": 2})
+        self.db.commit()
+        self.assertEqual(verify_streaks(self.db), [])
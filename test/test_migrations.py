@@ -0,0 +1,120 @@
+import unittest
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect
+
+from app.database import Base
+from app.utils.date_utils import get_project_period
+
+
+def make_alembic_config(connection):
+    alembic_config = Config("alembic.ini")
+    alembic_config.attributes["connection"] = connection
+    return alembic_config
+
+
+class TestMigrations(unittest.TestCase):
+    """Alembic 마이그레이션 테스트 (SQLite 메모리 DB)"""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        self.connection = self.engine.connect()
+        self.alembic_config = make_alembic_config(self.connection)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def test_upgrade_head_matches_models(self):
+        command.upgrade(self.alembic_config, "head")
+
+        diffs = compare_metadata(MigrationContext.configure(self.connection), Base.metadata)
+        self.assertEqual(diffs, [])
+
+    def test_kst_columns_are_backfilled(self):
+        command.upgrade(self.alembic_config, "0001")
+        self.connection.exec_driver_sql(
+            "INSERT INTO github_commits (github_id, commit_id, repository, message, commit_url, commit_date, is_private) "
+            "VALUES ('alice', 'a1', 'alice/repo', 'm', 'u', '2025-03-13 15:30:00.000000', 0)"
+        )
+
+        command.upgrade(self.alembic_config, "head")
+
+        row = self.connection.exec_driver_sql(
+            "SELECT commit_date_kst, commit_hour_kst FROM github_commits"
+        ).one()
+        self.assertEqual(tuple(row), ("2025-03-14", 0))
+        index_names = {index["name"] for index in inspect(self.connection).get_indexes("github_commits")}
+        self.assertIn("ix_github_commits_github_id_commit_date", index_names)
+        self.assertNotIn("ix_github_commits_github_id", index_names)
+
+    def test_commit_hourly_rollups_are_backfilled(self):
+        command.upgrade(self.alembic_config, "0007")
+        self.connection.exec_driver_sql(
+            "INSERT INTO github_commits (github_id, commit_id, repository, message, commit_url, commit_date, "
+            "commit_date_kst, commit_hour_kst, is_private) VALUES "
+            "('alice', 'a1', 'alice/repo', 'm', 'u', '2025-03-13 15:30:00.000000', '2025-03-14', 0, 0), "
+            "('alice', 'a2', 'alice/repo', 'm', 'u', '2025-03-13 15:50:00.000000', '2025-03-14', 0, 0)"
+        )
+
+        command.upgrade(self.alembic_config, "head")
+
+        row = self.connection.exec_driver_sql(
+            "SELECT commit_date_kst, commit_hour_kst, github_id, commit_count FROM commit_hourly_rollups"
+        ).one()
+        self.assertEqual(tuple(row), ("2025-03-14", 0, "alice", 2))
+
+    def test_commit_keys_are_backfilled(self):
+        command.upgrade(self.alembic_config, "0009")
+        self.connection.exec_driver_sql(
+            "INSERT INTO github_commits (github_id, commit_id, repository, message, commit_url, commit_date, "
+            "commit_date_kst, commit_hour_kst, is_private) VALUES "
+            "('alice', 'a1', 'alice/repo', 'm', 'u', '2025-03-13 15:30:00.000000', '2025-03-14', 0, 0)"
+        )
+
+        command.upgrade(self.alembic_config, "head")
+
+        rows = self.connection.exec_driver_sql("SELECT commit_id, repository FROM github_commit_keys").all()
+        self.assertEqual([tuple(row) for row in rows], [("a1", "alice/repo")])
+
+    def test_attendance_read_model_is_backfilled(self):
+        season_start, season_end = get_project_period()
+        command.upgrade(self.alembic_config, "0010")
+        self.connection.exec_driver_sql("INSERT INTO users (github_id) VALUES ('alice'), ('bob')")
+        self.connection.exec_driver_sql(
+            "INSERT INTO attendances (github_id, attendance_date, commit_count, is_attended) "
+            f"VALUES ('alice', '{season_start.isoformat()}', 1, 1)"
+        )
+        # 이전 쓰기 경로가 일부 사용자만 채운 매트릭스
+        self.connection.exec_driver_sql(
+            "INSERT INTO attendance_matrix (github_id, start_date, days, attended_count) "
+            f"VALUES ('bob', '{season_start.isoformat()}', '0', 0)"
+        )
+
+        command.upgrade(self.alembic_config, "head")
+
+        rows = self.connection.exec_driver_sql(
+            "SELECT github_id, days, attended_count FROM attendance_matrix ORDER BY github_id"
+        ).all()
+        total_days = (season_end - season_start).days + 1
+        self.assertEqual([tuple(row) for row in rows], [
+            ("alice", "1" + "0" * (total_days - 1), 1), ("bob", "0" * total_days, 0)
+        ])
+        counts = self.connection.exec_driver_sql(
+            "SELECT COUNT(*), SUM(attended_count) FROM daily_attendance_counts"
+        ).one()
+        self.assertEqual(tuple(counts), (total_days, 1))
+
+    def test_downgrade_to_baseline(self):
+        command.upgrade(self.alembic_config, "head")
+        command.downgrade(self.alembic_config, "0001")
+
+        self.assertNotIn("attendance_matrix", inspect(self.connection).get_table_names())
+        columns = {column["name"] for column in inspect(self.connection).get_columns("github_commits")}
+        self.assertNotIn("commit_date_kst", columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
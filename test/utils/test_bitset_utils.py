@@ -0,0 +1,75 @@
+from datetime import date
+from unittest import TestCase, IsolatedAsyncioTestCase
+
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.user import User
+from app.routers.attendance import get_attendance_stats
+from app.services.stats_service import build_attendance_stats
+from app.utils.bitset_utils import decode_bitset, decode_ranges, encode_bitsets, encode_ranges
+
+ATTENDED = np.array([
+    [True, True, False, False, False, False, False, False, True, False],
+    [False] * 10,
+    [True] * 10,
+])
+
+
+class TestBitsetEncoding(TestCase):
+    def test_bitset_is_msb_first_base64(self):
+        # 11000000 10000000 -> 0xC0 0x80
+        self.assertEqual(encode_bitsets(ATTENDED), ["wIA=", "AAA=", "/8A="])
+
+    def test_ranges_are_inclusive_index_pairs(self):
+        self.assertEqual(encode_ranges(ATTENDED), [[[0, 1], [8, 8]], [], [[0, 9]]])
+        self.assertEqual(encode_ranges(np.zeros((0, 10), dtype=bool)), [])
+
+    def test_round_trip(self):
+        attended = np.random.default_rng(0).random((20, 37)) < 0.5
+        for row, bitset, ranges in zip(attended, encode_bitsets(attended), encode_ranges(attended)):
+            self.assertEqual(decode_bitset(bitset, 37), row.tolist())
+            self.assertEqual(decode_ranges(ranges, 37), row.tolist())
+
+
+class TestAttendanceStatsFormat(IsolatedAsyncioTestCase):
+    """출석 통계의 출석 여부 목록 형식 테스트 (SQLite 메모리 DB)"""
+
+    def setUp(self):
+        self.engine = create_engine('sqlite:///:memory:')
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.db.add_all([User(github_id="alice"), User(github_id="bob")])
+        self.db.add_all([
+            Attendance(github_id="alice", attendance_date=date(2025, 3, day), commit_count=1, is_attended=True)
+            for day in (10, 11, 13)
+        ])
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_compact_formats_decode_to_list_format(self):
+        start, end = date(2025, 3, 10), date(2025, 3, 14)
+        expected = build_attendance_stats(self.db, start, end)
+        self.assertNotIn("attendance_format", expected)
+
+        for attendance_format, decode in (("bitset", decode_bitset), ("ranges", decode_ranges)):
+            stats = build_attendance_stats(self.db, start, end, attendance_format)
+            self.assertEqual(stats["attendance_format"], attendance_format)
+            for user, expected_user in zip(stats["users"], expected["users"]):
+                self.assertEqual(decode(user["attendance"], 5), expected_user["attendance"])
+                self.assertEqual(
+                    {k: v for k, v in user.items() if k != "attendance"},
+                    {k: v for k, v in expected_user.items() if k != "attendance"}
+                )
+
+    async def test_unknown_format_is_rejected(self):
+        with self.assertRaises(HTTPException):
+            request = Request({"type": "http", "method": "GET", "path": "/api/attendance/stats", "headers": []})
+            await get_attendance_stats(request, "2025-03-10", "2025-03-14", self.db, format="csv")
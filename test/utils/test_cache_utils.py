@@ -0,0 +1,127 @@
+import asyncio
+import time
+from unittest import TestCase, IsolatedAsyncioTestCase
+
+from app.utils.cache_utils import SingleFlight, TTLCache
+
+
+class TestTTLCache(TestCase):
+    def test_get_returns_value_and_age(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.set(("junho85", "2025-03-14"), {"status": "success"})
+
+        value, age = cache.get(("junho85", "2025-03-14"))
+        self.assertEqual(value, {"status": "success"})
+        self.assertGreaterEqual(age, 0)
+        self.assertIsNone(cache.get(("junho85", "2025-03-15")))
+
+    def test_expired_and_invalidated_values_are_dropped(self):
+        cache = TTLCache(ttl_seconds=0.01)
+        cache.set("key", 1)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("key"))
+
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("key", 1)
+        cache.invalidate("key")
+        self.assertIsNone(cache.get("key"))
+
+    def test_max_entries_evicts_oldest(self):
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c")[0], 3)
+
+
+class TestSingleFlight(IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_share_one_run(self):
+        """동시에 들어온 같은 키의 호출은 한 번만 실행된다"""
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"status": "success"}
+
+        results = await asyncio.gather(*[flight.run("2025-03-14", work) for _ in range(5)])
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result == {"status": "success"} for result in results))
+
+    async def test_recent_result_is_reused_within_ttl(self):
+        flight = SingleFlight(result_ttl_seconds=60)
+        calls = []
+
+        async def work():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(await flight.run("key", work), 1)
+        self.assertEqual(await flight.run("key", work), 1)
+        self.assertEqual(await flight.run("other", work), 2)
+
+        flight.forget("key")
+        self.assertEqual(await flight.run("key", work), 3)
+
+    async def test_error_result_is_not_cached(self):
+        flight = SingleFlight(result_ttl_seconds=60)
+        calls = []
+
+        async def work():
+            calls.append(1)
+            return {"status": "error"}
+
+        await flight.run("key", work, should_cache=lambda r: r["status"] != "error")
+        await flight.run("key", work, should_cache=lambda r: r["status"] != "error")
+        self.assertEqual(len(calls), 2)
+
+    async def test_exception_is_shared_and_not_cached(self):
+        flight = SingleFlight(result_ttl_seconds=60)
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(flight.run("key", work), flight.run("key", work), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        self.assertIsNone(flight.get_recent("key"))
+
+    async def test_cancelled_leader_does_not_fail_waiters(self):
+        """작업을 실행하던 호출이 취소되면 기다리던 호출이 다시 실행해 결과를 받는다"""
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return len(calls)
+
+        leader = asyncio.ensure_future(flight.run("key", work))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.run("key", work)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        self.assertEqual(await asyncio.gather(*followers), [2, 2, 2])
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(len(calls), 2)
+
+    async def test_cancelled_waiter_does_not_cancel_run(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.run("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.run("key", work))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+
+        self.assertEqual(await leader, "done")
+        with self.assertRaises(asyncio.CancelledError):
+            await follower
@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+from starlette.requests import Request
+
+from app.utils.compression_utils import accepts_gzip
+
+
+def make_request(accept_encoding):
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestAcceptsGzip(TestCase):
+    def test_accept_encoding_tokens_and_qvalues(self):
+        for header, expected in (
+            ("gzip", True),
+            ("gzip, deflate, br", True),
+            ("br;q=1.0, GZIP;q=0.5", True),
+            ("*", True),
+            ("gzip;q=0", False),
+            ("gzip;q=0.0, deflate", False),
+            ("*;q=0", False),
+            ("gzip;q=0, *", False),
+            ("x-gzip", False),
+            ("deflate", False),
+            ("", False),
+            (None, False),
+        ):
+            with self.subTest(header=header):
+                self.assertEqual(accepts_gzip(make_request(header)), expected)